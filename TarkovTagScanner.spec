@@ -3,7 +3,7 @@ from PyInstaller.utils.hooks import collect_all
 
 datas = [('screenshots', 'screenshots')]
 binaries = []
-hiddenimports = ['easyocr', 'cv2', 'PIL', 'numpy', 'pynput', 'keyboard']
+hiddenimports = ['easyocr', 'cv2', 'PIL', 'numpy', 'pynput', 'keyboard', 'mss']
 tmp_ret = collect_all('easyocr')
 datas += tmp_ret[0]; binaries += tmp_ret[1]; hiddenimports += tmp_ret[2]
 
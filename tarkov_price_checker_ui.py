@@ -3,25 +3,30 @@ Tarkov Item Price Checker with UI, Hotkey, and OCR Support
 Press Ctrl+Shift+P to capture screen and automatically detect item names
 """
 
-import pyautogui
+import time
+MODULE_LOAD_START = time.perf_counter()  # Reference point for --profile-startup
+
 import requests
 import json
-from datetime import datetime, timedelta
 import os
-from PIL import Image
-import time
+import sys
 import tkinter as tk
 import tkinter.simpledialog
 from tkinter import ttk, scrolledtext, messagebox, colorchooser
 import keyboard
 import threading
-import easyocr
-import cv2
-import numpy as np
-from pynput import mouse
+import queue
+import multiprocessing
+import importlib.util
 import pickle
+import hashlib
+import struct
+from collections import OrderedDict, deque
+from collections.abc import Mapping
 from packaging import version
 from difflib import SequenceMatcher
+# Heavy dependencies (easyocr/torch, cv2, numpy, pyautogui, pynput) are
+# imported inside the functions that use them so the window opens first
 try:
     from pystray import Icon, Menu, MenuItem
     from PIL import Image as PILImage
@@ -30,11 +35,2531 @@ except ImportError:
     TRAY_AVAILABLE = False
 
 
+# Price fields requested for every item lookup
+ITEM_PRICE_FIELDS = """
+                id
+                name
+                shortName
+                width
+                height
+                avg24hPrice
+                basePrice
+                lastLowPrice
+                changeLast48hPercent
+                low24hPrice
+                high24hPrice
+                iconLink
+                wikiLink
+                link
+                updated
+                sellFor {
+                  vendor {
+                    name
+                  }
+                  price
+                  currency
+                }
+"""
+
+
+class CatalogRecord:
+    """
+    Read-only view of one row of a CatalogSnapshot
+    
+    Answers .get() / [] like the item dicts from the API, so the display code
+    takes either. Only the columns the store keeps are available; sellFor
+    holds just the best trader offer.
+    """
+    
+    __slots__ = ('_snapshot', '_row')
+    
+    def __init__(self, snapshot, row):
+        self._snapshot = snapshot
+        self._row = row
+    
+    def get(self, key, default=None):
+        value = self._snapshot.value(key, self._row)
+        return default if value is None else value
+    
+    def __getitem__(self, key):
+        value = self._snapshot.value(key, self._row)
+        if value is None:
+            raise KeyError(key)
+        return value
+    
+    def __repr__(self):
+        return f"CatalogRecord({self.get('id')!r}, {self.get('name')!r})"
+
+
+class CatalogSnapshot(Mapping):
+    """
+    Memory-mapped, read-only catalog file: item id -> CatalogRecord
+    
+    The numeric columns stay on disk and are paged in as rows are read;
+    only the id and name lookups are built in memory when the file opens.
+    """
+    
+    def __init__(self, path):
+        import numpy as np
+        self.path = path
+        self._mm = np.memmap(path, dtype=np.uint8, mode='r')
+        head = bytes(self._mm[:CatalogStore.PREFIX_SIZE])
+        if head[:len(CatalogStore.MAGIC)] != CatalogStore.MAGIC:
+            raise ValueError(f"Not a catalog file: {path}")
+        format_version, header_len = struct.unpack('<II', head[len(CatalogStore.MAGIC):])
+        if format_version != CatalogStore.FORMAT_VERSION:
+            raise ValueError(f"Unsupported catalog format {format_version}: {path}")
+        header = json.loads(bytes(self._mm[CatalogStore.PREFIX_SIZE:CatalogStore.PREFIX_SIZE + header_len]))
+        
+        self.game_mode = header['game_mode']
+        self.fetched_at = header['fetched_at']
+        self.columns = {}
+        for name, (dtype, offset, length) in header['columns'].items():
+            dtype = np.dtype(dtype)
+            self.columns[name] = self._mm[offset:offset + length * dtype.itemsize].view(dtype)
+        
+        # Decode the table in one pass to build the lookups, then let it go
+        blob = bytes(self.columns['strings'])
+        offsets = self.columns['string_offsets'].tolist()
+        def decode(indices):
+            return [blob[offsets[i]:offsets[i + 1]].decode('utf-8') if i >= 0 else None for i in indices.tolist()]
+        ids = decode(self.columns['id'])
+        self.rows = {item_id: row for row, item_id in enumerate(ids)}  # id -> row
+        self.by_name = {}   # name or short name -> id
+        for key in ('name', 'shortName'):
+            for item_id, name in zip(ids, decode(self.columns[key])):
+                if name:
+                    self.by_name.setdefault(name, item_id)
+    
+    def string(self, index):
+        """Decode entry index of the interned string table (None for -1)"""
+        if index < 0:
+            return None
+        start, end = self.columns['string_offsets'][index:index + 2].tolist()
+        return bytes(self.columns['strings'][start:end]).decode('utf-8')
+    
+    def value(self, key, row):
+        """One field of one row as a plain Python value (None if missing)"""
+        if key == 'sellFor':
+            trader = self.value('trader', row)
+            if trader is None:
+                return None
+            return [{'vendor': {'name': trader}, 'price': self.value('traderPrice', row), 'currency': 'RUB'}]
+        column = self.columns.get(key)
+        if column is None:
+            return None
+        if key in CatalogStore.STRING_COLUMNS:
+            return self.string(column[row])
+        if key in CatalogStore.FLOAT_COLUMNS:
+            value = float(column[row])
+            return None if value != value else value  # NaN marks missing
+        value = int(column[row])
+        return None if value == CatalogStore.MISSING else value
+    
+    def __getitem__(self, item_id):
+        return CatalogRecord(self, self.rows[item_id])
+    
+    def __iter__(self):
+        return iter(self.rows)
+    
+    def __len__(self):
+        return len(self.rows)
+
+
+class CatalogStore:
+    """
+    On-disk price catalog, one columnar file per game mode
+    
+    File layout (little-endian): MAGIC, uint32 format version, uint32 JSON
+    header length, the JSON header (game mode, fetch time, row count and
+    dtype/offset/length of every column), then the columns, each aligned to
+    64 bytes. Strings (ids, names, trader names, update stamps) are interned
+    into one UTF-8 table and stored as int32 indices; missing integers are
+    MISSING and missing floats NaN.
+    
+    Every save writes a new file and older ones are removed when possible -
+    Windows won't delete a file that is still memory-mapped, so those are
+    cleaned up on a later save.
+    """
+    
+    MAGIC = b'TKCATLG\n'
+    FORMAT_VERSION = 1
+    PREFIX_SIZE = len(MAGIC) + 8
+    ALIGN = 64
+    MISSING = -(2 ** 63)
+    STRING_COLUMNS = ('id', 'name', 'shortName', 'updated', 'trader')
+    INT_COLUMNS = {
+        'avg24hPrice': '<i8', 'basePrice': '<i8', 'lastLowPrice': '<i8',
+        'low24hPrice': '<i8', 'high24hPrice': '<i8', 'traderPrice': '<i8',
+        'width': '<i8', 'height': '<i8'
+    }
+    FLOAT_COLUMNS = {'changeLast48hPercent': '<f8'}
+    
+    def __init__(self, directory):
+        self.directory = directory
+    
+    def paths(self, game_mode):
+        """Saved catalog files for a game mode, newest first"""
+        prefix = f"catalog-{game_mode.lower()}-"
+        try:
+            names = [name for name in os.listdir(self.directory)
+                     if name.startswith(prefix) and name.endswith('.bin')]
+        except OSError:
+            return []
+        names.sort(key=lambda name: int(name[len(prefix):-4]) if name[len(prefix):-4].isdigit() else -1,
+                   reverse=True)
+        return [os.path.join(self.directory, name) for name in names]
+    
+    def load(self, game_mode):
+        """
+        Map the newest readable catalog file for a game mode
+        
+        Returns:
+            CatalogSnapshot or None: None if nothing usable is saved
+        """
+        for path in self.paths(game_mode):
+            try:
+                snapshot = CatalogSnapshot(path)
+            except (OSError, ValueError, KeyError) as e:
+                print(f"Warning: Skipping catalog file {path}: {e}")
+                continue
+            if snapshot.game_mode == game_mode:
+                return snapshot
+        return None
+    
+    @staticmethod
+    def best_trader(item):
+        sell_for = item.get('sellFor') or []
+        if not sell_for:
+            return None, None
+        best = max(sell_for, key=lambda offer: offer.get('price') or 0)
+        return (best.get('vendor') or {}).get('name'), best.get('price')
+    
+    def save(self, game_mode, items, fetched_at):
+        """
+        Write items (id -> item dict or CatalogRecord) as a new catalog file
+        
+        Returns:
+            str: Path of the file written
+        """
+        import numpy as np
+        
+        strings = {}  # Interned string -> index
+        def intern(value):
+            if value is None:
+                return -1
+            return strings.setdefault(value, len(strings))
+        
+        columns = {name: [] for name in self.STRING_COLUMNS}
+        columns.update((name, []) for name in self.INT_COLUMNS)
+        columns.update((name, []) for name in self.FLOAT_COLUMNS)
+        for item_id, item in items.items():
+            trader, trader_price = self.best_trader(item)
+            values = {'id': item_id, 'trader': trader, 'traderPrice': trader_price}
+            for name, column in columns.items():
+                value = values[name] if name in values else item.get(name)
+                if name in self.STRING_COLUMNS:
+                    column.append(intern(value))
+                elif name in self.FLOAT_COLUMNS:
+                    column.append(float('nan') if value is None else value)
+                else:
+                    column.append(self.MISSING if value is None else int(value))
+        
+        encoded = [s.encode('utf-8') for s in strings]
+        arrays = {name: np.asarray(values, dtype='<i4') for name, values in columns.items()
+                  if name in self.STRING_COLUMNS}
+        arrays.update((name, np.asarray(columns[name], dtype=dtype)) for name, dtype in self.INT_COLUMNS.items())
+        arrays.update((name, np.asarray(columns[name], dtype=dtype)) for name, dtype in self.FLOAT_COLUMNS.items())
+        arrays['string_offsets'] = np.concatenate(([0], np.cumsum([len(s) for s in encoded]))).astype('<i8')
+        arrays['strings'] = np.frombuffer(b''.join(encoded), dtype=np.uint8)
+        
+        # The header holds the column offsets, which depend on the header size
+        layout, header = {}, b''
+        while True:
+            offset = self.PREFIX_SIZE + len(header)
+            for name, array in arrays.items():
+                offset += -offset % self.ALIGN
+                layout[name] = [array.dtype.str, offset, len(array)]
+                offset += array.nbytes
+            new_header = json.dumps({
+                'game_mode': game_mode,
+                'fetched_at': fetched_at,
+                'count': len(items),
+                'columns': layout
+            }).encode('utf-8')
+            if len(new_header) == len(header):
+                break
+            header = new_header
+        
+        os.makedirs(self.directory, exist_ok=True)
+        path = os.path.join(self.directory, f"catalog-{game_mode.lower()}-{int(time.time() * 1000)}.bin")
+        with open(path + '.tmp', 'wb') as f:
+            f.write(self.MAGIC + struct.pack('<II', self.FORMAT_VERSION, len(header)) + header)
+            for name, array in arrays.items():
+                f.write(b'\0' * (layout[name][1] - f.tell()))
+                f.write(array.tobytes())
+        os.replace(path + '.tmp', path)
+        
+        for old in self.paths(game_mode):
+            if old != path:
+                try:
+                    os.remove(old)
+                except OSError:
+                    pass  # Still mapped (Windows) - removed on a later save
+        return path
+
+
+class PriceCatalog:
+    """
+    Every item's price data for one game mode, held in memory
+    
+    fetch() pulls the whole item list in pages of page_size (one GraphQL
+    request each) and swaps the new tables in at once, so readers never
+    see a half-updated catalog and never wait for a refresh.
+    
+    refresh() is the incremental version: it lists only id + updated for
+    every item, then re-downloads full data for the ids whose timestamp
+    moved (plus new ones) and swaps in a patched copy.
+    
+    With a CatalogStore, load_snapshot() maps the last saved catalog so
+    lookups work before the network, and save() writes the current one.
+    """
+    
+    def __init__(self, base_url, headers, game_mode='PVP', page_size=500, store=None):
+        self.base_url = base_url
+        self.headers = headers
+        self.game_mode = game_mode
+        self.page_size = page_size
+        self.store = store
+        self.items = {}     # id -> item data (ITEM_PRICE_FIELDS) or CatalogRecord
+        self.by_name = {}   # name or short name -> id
+        self.fetched_at = None
+        self.stats = {'refreshes': 0, 'last_kind': None, 'last_changed': 0,
+                      'last_ms': 0.0, 'last_bytes': 0, 'total_bytes': 0}
+        self._refresh_lock = threading.RLock()  # refresh() may fall back to fetch()
+    
+    def __len__(self):
+        return len(self.items)
+    
+    @property
+    def loaded(self):
+        return self.fetched_at is not None
+    
+    def age(self):
+        """Seconds since the last successful fetch (None if never fetched)"""
+        return time.time() - self.fetched_at if self.fetched_at else None
+    
+    def get(self, item_id):
+        return self.items.get(item_id)
+    
+    def get_by_name(self, name):
+        item_id = self.by_name.get(name)
+        return self.items.get(item_id) if item_id else None
+    
+    def load_snapshot(self, game_mode=None):
+        """
+        Swap in the catalog last saved to the store (memory-mapped, no download)
+        
+        Returns:
+            int: Number of items loaded (0 if nothing is saved for this mode)
+        """
+        game_mode = game_mode or self.game_mode
+        if self.store is None:
+            return 0
+        with self._refresh_lock:
+            snapshot = self.store.load(game_mode)
+            if snapshot is None:
+                return 0
+            self.items, self.by_name, self.game_mode = snapshot, snapshot.by_name, game_mode
+            self.fetched_at = snapshot.fetched_at
+            self.stats['last_kind'] = 'disk'
+            self.stats['last_changed'] = len(snapshot)
+            return len(snapshot)
+    
+    def save(self):
+        """Write the current catalog to the store (returns the path, or None if there's nothing to save)"""
+        with self._refresh_lock:
+            items, game_mode, fetched_at = self.items, self.game_mode, self.fetched_at
+        if self.store is None or not self.loaded or isinstance(items, CatalogSnapshot):
+            return None
+        return self.store.save(game_mode, items, fetched_at)
+    
+    def _post(self, query, variables):
+        """Run a GraphQL query; returns (items, response size in bytes)"""
+        response = requests.post(self.base_url, headers=self.headers,
+                                 json={"query": query, "variables": variables}, timeout=30)
+        response.raise_for_status()
+        data = response.json()
+        if 'errors' in data:
+            raise RuntimeError(data['errors'][0].get('message', 'Unknown error'))
+        return (data.get('data') or {}).get('items') or [], len(response.content)
+    
+    def query_page(self, offset, game_mode, fields=ITEM_PRICE_FIELDS):
+        """
+        Fetch one page of items
+        
+        Returns:
+            tuple: (list of items, response size in bytes)
+        """
+        query = """
+        query CatalogPage($gameMode: GameMode, $limit: Int, $offset: Int) {
+          items(gameMode: $gameMode, limit: $limit, offset: $offset) {""" + fields + """
+          }
+        }
+        """
+        return self._post(query, {
+            "gameMode": 'regular' if game_mode == 'PVP' else 'pve',
+            "limit": self.page_size,
+            "offset": offset
+        })
+    
+    def query_ids(self, ids, game_mode):
+        """Fetch full data for specific item ids; returns (items, response size in bytes)"""
+        query = """
+        query CatalogItems($ids: [ID], $gameMode: GameMode) {
+          items(ids: $ids, gameMode: $gameMode) {""" + ITEM_PRICE_FIELDS + """
+          }
+        }
+        """
+        return self._post(query, {"ids": ids, "gameMode": 'regular' if game_mode == 'PVP' else 'pve'})
+    
+    def _list_all(self, game_mode, fields=ITEM_PRICE_FIELDS):
+        """Page through every item; returns ({id: item}, bytes received)"""
+        items = {}
+        received = 0
+        offset = 0
+        while True:
+            page, size = self.query_page(offset, game_mode, fields)
+            received += size
+            for item in page:
+                if item.get('id'):
+                    items[item['id']] = item
+            if len(page) < self.page_size:
+                return items, received
+            offset += self.page_size
+    
+    @staticmethod
+    def _index_names(items):
+        by_name = {}
+        for item_id, item in items.items():
+            for key in ('name', 'shortName'):
+                if item.get(key):
+                    by_name.setdefault(item[key], item_id)
+        return by_name
+    
+    def _record(self, kind, changed, start, received):
+        self.fetched_at = time.time()
+        self.stats['refreshes'] += 1
+        self.stats['last_kind'] = kind
+        self.stats['last_changed'] = changed
+        self.stats['last_ms'] = (time.perf_counter() - start) * 1000
+        self.stats['last_bytes'] = received
+        self.stats['total_bytes'] += received
+    
+    def refresh(self, game_mode=None, chunk_size=200, full_ratio=0.5):
+        """
+        Bring the catalog up to date, downloading only what changed
+        
+        Falls back to fetch() when nothing is loaded for this game mode or
+        more than full_ratio of the items changed.
+        
+        Returns:
+            int: Number of items re-downloaded
+        """
+        game_mode = game_mode or self.game_mode
+        if not self.loaded or game_mode != self.game_mode:
+            return self.fetch(game_mode)
+        
+        with self._refresh_lock:
+            start = time.perf_counter()
+            current = self.items
+            stamps, received = self._list_all(game_mode, fields="\n                id\n                updated\n")
+            changed = [
+                item_id for item_id, stamp in stamps.items()
+                if item_id not in current or current[item_id].get('updated') != stamp.get('updated')
+            ]
+            removed = [item_id for item_id in current if item_id not in stamps]
+            if len(changed) > full_ratio * max(1, len(stamps)):
+                return self.fetch(game_mode)
+            
+            updates = {}
+            for i in range(0, len(changed), chunk_size):
+                page, size = self.query_ids(changed[i:i + chunk_size], game_mode)
+                received += size
+                updates.update((item['id'], item) for item in page if item.get('id'))
+            
+            # Copy-on-write: patch a copy, then swap it in
+            items = dict(current)
+            items.update(updates)
+            for item_id in removed:
+                items.pop(item_id, None)
+            names_changed = removed or any(
+                item_id not in current or
+                (current[item_id].get('name'), current[item_id].get('shortName')) !=
+                (item.get('name'), item.get('shortName'))
+                for item_id, item in updates.items()
+            )
+            by_name = self._index_names(items) if names_changed else self.by_name
+            self.items, self.by_name = items, by_name
+            self._record('incremental', len(updates), start, received)
+            return len(updates)
+    
+    def fetch(self, game_mode=None):
+        """
+        Download the full catalog and swap it in
+        
+        Args:
+            game_mode (str): 'PVP' or 'PVE' (default: the catalog's current mode)
+            
+        Returns:
+            int: Number of items fetched
+        """
+        game_mode = game_mode or self.game_mode
+        with self._refresh_lock:
+            start = time.perf_counter()
+            items, received = self._list_all(game_mode)
+            by_name = self._index_names(items)
+            
+            # Swap whole tables so concurrent readers see old or new, never a mix
+            self.items, self.by_name, self.game_mode = items, by_name, game_mode
+            self._record('full', len(items), start, received)
+            return len(items)
+
+
+class ScreenGrabber:
+    """Base class for screen capture backends
+    
+    Backends keep their capture handle alive between calls and return region
+    crops as BGR numpy arrays. The returned array is a reused buffer that is
+    overwritten by the next grab of the same size - copy it if it must outlive
+    the next call.
+    """
+    
+    name = 'base'
+    
+    def __init__(self):
+        self._buffers = {}
+    
+    @classmethod
+    def is_available(cls):
+        """Return True if this backend can run on this machine"""
+        return False
+    
+    def grab(self, region=None):
+        """Grab (x, y, width, height) or the full screen as a BGR array"""
+        raise NotImplementedError
+    
+    def release(self):
+        """Release the calling thread's capture handle (call before a capturing thread exits)"""
+    
+    def close(self):
+        """Release the capture handle"""
+        self._buffers.clear()
+    
+    def _buffer(self, height, width):
+        """Get the reusable output buffer for this crop size"""
+        import numpy as np
+        key = (height, width)
+        buf = self._buffers.get(key)
+        if buf is None:
+            buf = np.empty((height, width, 3), dtype=np.uint8)
+            self._buffers[key] = buf
+        return buf
+
+
+class MSSGrabber(ScreenGrabber):
+    """Persistent capture via mss (GDI on Windows, X11 on Linux, CoreGraphics on macOS)
+    
+    mss handles are bound to the thread that created them, so one long-lived
+    handle is kept per capturing thread instead of one per screenshot.
+    Short-lived capturing threads must call release() before exiting.
+    """
+    
+    name = 'mss'
+    
+    def __init__(self):
+        super().__init__()
+        self._local = threading.local()
+        self._handles = []
+        self._lock = threading.Lock()
+    
+    @classmethod
+    def is_available(cls):
+        return importlib.util.find_spec('mss') is not None
+    
+    def _handle(self):
+        sct = getattr(self._local, 'sct', None)
+        if sct is None:
+            import mss
+            sct = mss.mss()
+            self._local.sct = sct
+            with self._lock:
+                self._handles.append(sct)
+        return sct
+    
+    def grab(self, region=None):
+        import cv2
+        import numpy as np
+        sct = self._handle()
+        if region:
+            x, y, width, height = region
+            monitor = {'left': int(x), 'top': int(y), 'width': int(width), 'height': int(height)}
+        else:
+            monitor = sct.monitors[1]
+        shot = sct.grab(monitor)
+        bgra = np.frombuffer(shot.raw, dtype=np.uint8).reshape(shot.height, shot.width, 4)
+        buf = self._buffer(shot.height, shot.width)
+        cv2.cvtColor(bgra, cv2.COLOR_BGRA2BGR, dst=buf)
+        return buf
+    
+    def release(self):
+        sct = getattr(self._local, 'sct', None)
+        if sct is None:
+            return
+        self._local.sct = None
+        with self._lock:
+            if sct in self._handles:
+                self._handles.remove(sct)
+        try:
+            sct.close()
+        except Exception:
+            pass
+    
+    def close(self):
+        with self._lock:
+            for sct in self._handles:
+                try:
+                    sct.close()
+                except Exception:
+                    pass
+            self._handles = []
+        self._local = threading.local()
+        super().close()
+
+
+class PyAutoGUIGrabber(ScreenGrabber):
+    """Fallback capture via pyautogui (new capture context on every call)"""
+    
+    name = 'pyautogui'
+    
+    @classmethod
+    def is_available(cls):
+        return True
+    
+    def grab(self, region=None):
+        import cv2
+        import numpy as np
+        import pyautogui
+        if region:
+            screenshot = pyautogui.screenshot(region=tuple(int(v) for v in region))
+        else:
+            screenshot = pyautogui.screenshot()
+        rgb = np.asarray(screenshot)
+        buf = self._buffer(rgb.shape[0], rgb.shape[1])
+        cv2.cvtColor(rgb, cv2.COLOR_RGB2BGR, dst=buf)
+        return buf
+
+
+# Fastest first; 'auto' picks the first available backend
+GRABBER_BACKENDS = [MSSGrabber, PyAutoGUIGrabber]
+
+
+def create_grabber(preferred='auto'):
+    """Create the preferred screen grabber, falling back to the next available one"""
+    for backend in GRABBER_BACKENDS:
+        if preferred not in ('auto', backend.name):
+            continue
+        if backend.is_available():
+            return backend()
+    return PyAutoGUIGrabber()
+
+
+def benchmark_grabbers(region=(0, 0, 350, 80), iterations=200, warmup=10):
+    """
+    Measure grab latency for every available backend
+    
+    Returns:
+        dict: backend name -> {'p50': ms, 'p99': ms, 'mean': ms}
+    """
+    import numpy as np
+    results = {}
+    for backend in GRABBER_BACKENDS:
+        if not backend.is_available():
+            continue
+        grabber = backend()
+        try:
+            for _ in range(warmup):
+                grabber.grab(region)
+            samples = []
+            for _ in range(iterations):
+                start = time.perf_counter()
+                grabber.grab(region)
+                samples.append((time.perf_counter() - start) * 1000)
+            results[backend.name] = {
+                'p50': float(np.percentile(samples, 50)),
+                'p99': float(np.percentile(samples, 99)),
+                'mean': float(np.mean(samples))
+            }
+        except Exception as e:
+            results[backend.name] = {'error': str(e)}
+        finally:
+            grabber.close()
+    return results
+
+
+def frame_hash(image, inset=4):
+    """
+    Cheap hash of a capture for change detection
+    
+    Downscales to 32x8 grayscale and drops the low 4 bits so sensor-level
+    noise doesn't change the key; inset trims the capture edge.
+    """
+    import cv2
+    if inset and image.shape[0] > 2 * inset and image.shape[1] > 2 * inset:
+        image = image[inset:-inset, inset:-inset]
+    gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY) if image.ndim == 3 else image
+    small = cv2.resize(gray, (32, 8), interpolation=cv2.INTER_AREA)
+    return (small >> 4).tobytes()
+
+
+def localize_tooltip(image, anchor=None, border_threshold=150, min_width=30, min_height=12, max_height=60):
+    """
+    Find the dark tooltip box with a light border and the text line inside it
+    
+    Light pixels are thresholded and their outer contours checked for a wide,
+    short rectangle whose edge is mostly light and whose interior is dark. Of
+    the candidates, the one nearest the anchor (cursor position in the image)
+    wins. Row/column projections of the light pixels inside the box then give
+    a tight box around the text.
+    
+    Args:
+        image: BGR or grayscale capture
+        anchor (tuple): (x, y) cursor position in image coordinates, or None
+        
+    Returns:
+        dict: {'box': (x, y, w, h), 'line': (x, y, w, h)} or None if not found
+    """
+    import cv2
+    import numpy as np
+    gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY) if image.ndim == 3 else image
+    _, bright = cv2.threshold(gray, border_threshold, 255, cv2.THRESH_BINARY)
+    contours, _ = cv2.findContours(bright, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
+    
+    best = None
+    best_distance = None
+    for contour in contours:
+        x, y, w, h = cv2.boundingRect(contour)
+        if w < min_width or h < min_height or h > max_height or w < 2 * h:
+            continue
+        
+        # Tooltip background is dark...
+        inner = gray[y + 2:y + h - 2, x + 2:x + w - 2]
+        if inner.size == 0 or np.median(inner) > 90:
+            continue
+        
+        # ...and framed by a mostly continuous light border
+        edge = np.concatenate([
+            bright[y, x:x + w], bright[y + h - 1, x:x + w],
+            bright[y:y + h, x], bright[y:y + h, x + w - 1]
+        ])
+        if edge.mean() < 255 * 0.6:
+            continue
+        
+        if anchor is not None:
+            nearest_x = min(max(anchor[0], x), x + w)
+            nearest_y = min(max(anchor[1], y), y + h)
+            distance = (nearest_x - anchor[0]) ** 2 + (nearest_y - anchor[1]) ** 2
+        else:
+            distance = -w * h  # Largest box wins without an anchor
+        if best is None or distance < best_distance:
+            best, best_distance = (x, y, w, h), distance
+    
+    if best is None:
+        return None
+    
+    # Tight box around the light text pixels inside the border
+    x, y, w, h = best
+    inner = bright[y + 2:y + h - 2, x + 2:x + w - 2]
+    rows = np.flatnonzero(inner.any(axis=1))
+    cols = np.flatnonzero(inner.any(axis=0))
+    if rows.size == 0 or cols.size == 0:
+        return None
+    
+    pad = 2
+    left = max(x, x + 2 + int(cols[0]) - pad)
+    top = max(y, y + 2 + int(rows[0]) - pad)
+    right = min(x + w, x + 2 + int(cols[-1]) + 1 + pad)
+    bottom = min(y + h, y + 2 + int(rows[-1]) + 1 + pad)
+    return {'box': best, 'line': (left, top, right - left, bottom - top)}
+
+
+def line_signature(binary, height=16):
+    """
+    Exact key of a binarized text-line crop
+    
+    The line is cropped to its ink and scaled to a fixed height (keeping the
+    aspect ratio), so where the crop box lands doesn't matter. Every pixel
+    goes into the digest: names that differ in a single glyph ("6L20" vs
+    "6L23") never share a key, and anything noisier just misses.
+    
+    Returns:
+        bytes or None: 16-byte digest, None if the crop has no ink
+    """
+    import cv2
+    import numpy as np
+    ys, xs = np.nonzero(binary)
+    if not len(xs):
+        return None
+    ink = binary[ys.min():ys.max() + 1, xs.min():xs.max() + 1]
+    width = max(1, round(ink.shape[1] * height / ink.shape[0]))
+    small = cv2.resize(ink, (width, height), interpolation=cv2.INTER_AREA) > 127
+    return hashlib.blake2b(width.to_bytes(4, 'big') + np.packbits(small).tobytes(), digest_size=16).digest()
+
+
+class LRUCache:
+    """Thread-safe bounded mapping with least-recently-used eviction and hit/miss counters"""
+    
+    def __init__(self, maxsize=256):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def __len__(self):
+        return len(self._data)
+    
+    def get(self, key, default=None):
+        """Return the cached value and mark it most recently used"""
+        with self._lock:
+            if key in self._data:
+                self._data.move_to_end(key)
+                self.hits += 1
+                return self._data[key]
+            self.misses += 1
+            return default
+    
+    def put(self, key, value):
+        """Insert or refresh a value, evicting the least recently used entry if full"""
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+    
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+    
+    def stats(self):
+        """Return size, hits, misses and hit rate"""
+        lookups = self.hits + self.misses
+        return {
+            'size': len(self._data),
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / lookups if lookups else 0.0
+        }
+
+
+class TooltipCache(LRUCache):
+    """
+    Tooltip text-line crop -> resolved item name, persisted between sessions
+    
+    Keys are line_signature() digests of the localized crop and only match
+    exactly: a near miss could be a different item, and a wrong hit would
+    show the wrong price without any warning.
+    """
+    
+    version = 2  # Version 1 keys were fuzzy-matched DCT hashes
+    
+    def __init__(self, path, maxsize=512):
+        super().__init__(maxsize)
+        self.path = path
+    
+    def load(self):
+        """Load entries saved by a previous session"""
+        try:
+            if os.path.exists(self.path):
+                with open(self.path, 'rb') as f:
+                    cache_data = pickle.load(f)
+                if cache_data.get('version') == self.version:
+                    for key, value in cache_data.get('entries', []):
+                        self.put(key, value)
+        except Exception as e:
+            print(f"Warning: Could not load tooltip cache: {e}")
+    
+    def save(self):
+        """Persist entries (least recently used first) to disk"""
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            with self._lock:
+                entries = list(self._data.items())
+            with open(self.path, 'wb') as f:
+                pickle.dump({'version': self.version, 'entries': entries}, f)
+        except Exception as e:
+            print(f"Warning: Could not save tooltip cache: {e}")
+
+
+class PriceCache:
+    """
+    Two-tier cache of API price data keyed by (item id or name, game mode)
+    
+    Lookups go to a bounded in-memory LRU first, then to a sqlite file that
+    survives restarts. Entries younger than ttl are fresh; older ones up to
+    max_stale are still returned but flagged stale, so the caller can show
+    them at once and refresh in background. warm() preloads the newest
+    entries into memory at startup.
+    """
+    
+    def __init__(self, path, ttl=30 * 60, max_stale=24 * 60 * 60, memory_size=512, disk_size=5000):
+        self.path = path
+        self.ttl = ttl
+        self.max_stale = max_stale
+        self.disk_size = disk_size
+        self.memory = LRUCache(maxsize=memory_size)  # (key, game mode) -> (data, fetched_at)
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self.disk_reads = 0
+        self._db = None
+        self._lock = threading.Lock()
+        self._refreshing = set()
+    
+    def _connect(self):
+        """Open the sqlite file on first use (call with _lock held)"""
+        if self._db is None:
+            import sqlite3
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            db = sqlite3.connect(self.path, check_same_thread=False)
+            db.execute("PRAGMA journal_mode=WAL")
+            db.execute("PRAGMA synchronous=NORMAL")
+            db.execute(
+                "CREATE TABLE IF NOT EXISTS prices (item_key TEXT, game_mode TEXT, fetched_at REAL, "
+                "data TEXT, PRIMARY KEY (item_key, game_mode))"
+            )
+            self._db = db
+        return self._db
+    
+    def _read(self, key, game_mode):
+        try:
+            with self._lock:
+                row = self._connect().execute(
+                    "SELECT data, fetched_at FROM prices WHERE item_key = ? AND game_mode = ?", (key, game_mode)
+                ).fetchone()
+        except Exception as e:
+            print(f"Warning: Could not read price cache: {e}")
+            return None
+        return (json.loads(row[0]), row[1]) if row else None
+    
+    def get(self, key, game_mode):
+        """
+        Look up cached price data
+        
+        Returns:
+            tuple: (item data, stale) - (None, False) if missing or too old
+        """
+        entry = self.memory.get((key, game_mode))
+        if entry is None:
+            entry = self._read(key, game_mode)
+            if entry is not None:
+                self.disk_reads += 1
+                self.memory.put((key, game_mode), entry)
+        
+        age = time.time() - entry[1] if entry else None
+        if age is None or age > self.max_stale:
+            self.misses += 1
+            return None, False
+        if age >= self.ttl:
+            self.stale_hits += 1
+            return entry[0], True
+        self.hits += 1
+        return entry[0], False
+    
+    def put(self, key, game_mode, data):
+        """Store fresh price data in both tiers"""
+        fetched_at = time.time()
+        self.memory.put((key, game_mode), (data, fetched_at))
+        try:
+            with self._lock:
+                db = self._connect()
+                db.execute("INSERT OR REPLACE INTO prices VALUES (?, ?, ?, ?)",
+                           (key, game_mode, fetched_at, json.dumps(data)))
+                db.commit()
+        except Exception as e:
+            print(f"Warning: Could not write price cache: {e}")
+    
+    def warm(self):
+        """
+        Drop expired rows, trim the file to disk_size and load the newest
+        entries into memory
+        
+        Returns:
+            int: Number of entries loaded
+        """
+        with self._lock:
+            db = self._connect()
+            db.execute("DELETE FROM prices WHERE fetched_at < ?", (time.time() - self.max_stale,))
+            db.execute("DELETE FROM prices WHERE rowid NOT IN "
+                       "(SELECT rowid FROM prices ORDER BY fetched_at DESC LIMIT ?)", (self.disk_size,))
+            db.commit()
+            rows = db.execute("SELECT item_key, game_mode, data, fetched_at FROM prices "
+                              "ORDER BY fetched_at DESC LIMIT ?", (self.memory.maxsize,)).fetchall()
+        for key, game_mode, data, fetched_at in reversed(rows):  # Newest ends up most recently used
+            self.memory.put((key, game_mode), (json.loads(data), fetched_at))
+        return len(rows)
+    
+    def begin_refresh(self, key, game_mode):
+        """Claim the background refresh of an entry; False if one is already running"""
+        with self._lock:
+            if (key, game_mode) in self._refreshing:
+                return False
+            self._refreshing.add((key, game_mode))
+            return True
+    
+    def end_refresh(self, key, game_mode):
+        with self._lock:
+            self._refreshing.discard((key, game_mode))
+    
+    def stats(self):
+        """Return tier sizes, hit/stale/miss counters and hit rate"""
+        try:
+            with self._lock:
+                disk = self._connect().execute("SELECT COUNT(*) FROM prices").fetchone()[0]
+        except Exception:
+            disk = 0
+        lookups = self.hits + self.stale_hits + self.misses
+        return {
+            'memory': len(self.memory),
+            'disk': disk,
+            'hits': self.hits,
+            'stale': self.stale_hits,
+            'misses': self.misses,
+            'disk_reads': self.disk_reads,
+            'hit_rate': (self.hits + self.stale_hits) / lookups if lookups else 0.0
+        }
+
+
+def grid_phase(profile, pitch):
+    """Offset (0..pitch-1) at which a periodic 1-D edge profile is strongest"""
+    import numpy as np
+    pitch = int(pitch)
+    usable = len(profile) - len(profile) % pitch
+    return int(np.argmax(profile[:usable].reshape(-1, pitch).mean(axis=0)))
+
+
+def segment_stash_labels(image, cell_size, text_threshold=170):
+    """
+    Locate the short-name label of every item in a stash/inventory screenshot
+    
+    The grid origin is recovered from the periodic grid-line edges, then light
+    text blobs are kept if they sit in the top band of a cell - where Tarkov
+    draws short names (stack counts sit at the bottom and are skipped). A
+    label belongs to the cell containing its right edge, i.e. the item's
+    top-right cell.
+    
+    Args:
+        image: BGR or grayscale full-screen capture
+        cell_size (int): Grid cell pitch in pixels
+        
+    Returns:
+        list: [{'box': (x, y, w, h), 'cell': (row, col)}] ordered by cell
+    """
+    import cv2
+    import numpy as np
+    gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY) if image.ndim == 3 else image
+    pitch = int(cell_size)
+    
+    # Grid lines show up as periodic vertical/horizontal edges
+    grad_x = np.abs(cv2.Sobel(gray, cv2.CV_32F, 1, 0, ksize=1)).mean(axis=0)
+    grad_y = np.abs(cv2.Sobel(gray, cv2.CV_32F, 0, 1, ksize=1)).mean(axis=1)
+    phase_x = grid_phase(grad_x, pitch)
+    phase_y = grid_phase(grad_y, pitch)
+    
+    # Merge characters into word blobs
+    _, bright = cv2.threshold(gray, text_threshold, 255, cv2.THRESH_BINARY)
+    kernel = cv2.getStructuringElement(cv2.MORPH_RECT, (max(3, pitch // 12), 1))
+    words = cv2.morphologyEx(bright, cv2.MORPH_CLOSE, kernel)
+    contours, _ = cv2.findContours(words, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
+    
+    labels = {}
+    for contour in contours:
+        x, y, w, h = cv2.boundingRect(contour)
+        if h < pitch * 0.08 or h > pitch * 0.3 or w < pitch * 0.06 or w > pitch * 2.2:
+            continue
+        if (y - phase_y) % pitch > pitch * 0.35:
+            continue  # Not in the top band of a cell
+        
+        right = x + w
+        cell = ((y - phase_y) // pitch, (right - 1 - phase_x) // pitch)
+        if cell in labels:
+            # Second word of the same label - grow the box
+            px, py, pw, ph = labels[cell]
+            nx, ny = min(px, x), min(py, y)
+            labels[cell] = (nx, ny, max(px + pw, right) - nx, max(py + ph, y + h) - ny)
+        else:
+            labels[cell] = (x, y, w, h)
+    
+    return [{'box': box, 'cell': cell} for cell, box in sorted(labels.items())]
+
+
+def frame_thumbnail(image, size=(44, 10)):
+    """Downscaled grayscale copy of a capture for frame differencing"""
+    import cv2
+    gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY) if image.ndim == 3 else image
+    return cv2.resize(gray, size, interpolation=cv2.INTER_AREA)
+
+
+def frame_difference(a, b):
+    """Mean absolute pixel difference (0-255) between two thumbnails"""
+    import cv2
+    if a is None or b is None or a.shape != b.shape:
+        return 255.0
+    return float(cv2.absdiff(a, b).mean())
+
+
+# Character pairs OCR commonly swaps in item names (compared lowercase)
+OCR_CONFUSIONS = [
+    ('1', 'i'), ('1', 'l'), ('i', 'l'), ('0', 'o'), ('0', 'd'), ('o', 'd'),
+    ('8', 'b'), ('5', 's'), ('2', 'z'), ('6', 'g'), ('.', ','), ('-', ' ')
+]
+
+
+def align_characters(source, target):
+    """
+    Unit-cost edit alignment between two strings
+    
+    Returns:
+        list: (source char, target char) for every substituted or matched
+            pair of characters (insertions and deletions are left out)
+    """
+    rows, cols = len(source) + 1, len(target) + 1
+    dist = [[0] * cols for _ in range(rows)]
+    for i in range(rows):
+        dist[i][0] = i
+    for j in range(cols):
+        dist[0][j] = j
+    for i in range(1, rows):
+        for j in range(1, cols):
+            dist[i][j] = min(
+                dist[i - 1][j] + 1,
+                dist[i][j - 1] + 1,
+                dist[i - 1][j - 1] + (source[i - 1] != target[j - 1])
+            )
+    pairs = []
+    i, j = len(source), len(target)
+    while i > 0 and j > 0:
+        if dist[i][j] == dist[i - 1][j - 1] + (source[i - 1] != target[j - 1]):
+            pairs.append((source[i - 1], target[j - 1]))
+            i, j = i - 1, j - 1
+        elif dist[i][j] == dist[i - 1][j] + 1:
+            i -= 1
+        else:
+            j -= 1
+    return pairs[::-1]
+
+
+class OCRConfusionTable:
+    """
+    Substitution costs for OCR-aware edit distance, learnable from scans
+    
+    cost(read, actual) is 1.0 for unrelated characters and lower for pairs
+    OCR is known to swap. Defaults come from OCR_CONFUSIONS; learn() lowers
+    costs further for swaps seen in logged (OCR text, resolved name) pairs,
+    which are kept (most recent max_pairs) and persisted between sessions.
+    """
+    
+    version = 1
+    
+    def __init__(self, path=None, default_cost=0.25, min_cost=0.1, min_count=3, max_pairs=2000):
+        self.path = path
+        self.default_cost = default_cost
+        self.min_cost = min_cost
+        self.min_count = min_count
+        self.pairs = deque(maxlen=max_pairs)
+        self._lock = threading.Lock()
+        self.costs = {}
+        self.learn()
+    
+    def cost(self, read, actual):
+        if read == actual:
+            return 0.0
+        return self.costs.get((read, actual), 1.0)
+    
+    def record(self, ocr_text, resolved_name):
+        """Log an OCR reading and the catalog name it resolved to"""
+        ocr_text = (ocr_text or '').lower().strip()
+        resolved_name = (resolved_name or '').lower().strip()
+        # A short name resolved to a long one says nothing about single characters
+        if abs(len(ocr_text) - len(resolved_name)) > max(2, len(resolved_name) // 5):
+            return
+        if ocr_text and resolved_name and ocr_text != resolved_name:
+            with self._lock:
+                self.pairs.append((ocr_text, resolved_name))
+    
+    def learn(self):
+        """
+        Rebuild costs from the defaults plus the logged pairs
+        
+        A swap seen at least min_count times costs 1 - (its share of that
+        character's misreads), floored at min_cost.
+        """
+        costs = {}
+        for a, b in OCR_CONFUSIONS:
+            costs[(a, b)] = costs[(b, a)] = self.default_cost
+        
+        swaps = {}
+        misreads = {}
+        with self._lock:
+            pairs = list(self.pairs)
+        for ocr_text, resolved_name in pairs:
+            for read, actual in align_characters(ocr_text, resolved_name):
+                if read != actual:
+                    swaps[(read, actual)] = swaps.get((read, actual), 0) + 1
+                    misreads[actual] = misreads.get(actual, 0) + 1
+        for (read, actual), count in swaps.items():
+            if count >= self.min_count:
+                learned = max(self.min_cost, 1.0 - count / misreads[actual])
+                costs[(read, actual)] = min(costs.get((read, actual), 1.0), learned)
+        self.costs = costs
+        return costs
+    
+    def load(self):
+        """Load logged pairs from a previous session and relearn"""
+        try:
+            if self.path and os.path.exists(self.path):
+                with open(self.path, 'rb') as f:
+                    data = pickle.load(f)
+                if data.get('version') == self.version:
+                    with self._lock:
+                        self.pairs.extend(data.get('pairs', []))
+                    self.learn()
+        except Exception as e:
+            print(f"Warning: Could not load OCR confusion log: {e}")
+    
+    def save(self):
+        try:
+            if self.path:
+                os.makedirs(os.path.dirname(self.path), exist_ok=True)
+                with self._lock:
+                    pairs = list(self.pairs)
+                with open(self.path, 'wb') as f:
+                    pickle.dump({'version': self.version, 'pairs': pairs}, f)
+        except Exception as e:
+            print(f"Warning: Could not save OCR confusion log: {e}")
+
+
+class FuzzyItemIndex:
+    """
+    Prebuilt index over catalog names for fuzzy item-name lookup
+    
+    Scores are exactly those of the original linear scan: len(query) /
+    len(name) when the query is a substring of the name, otherwise
+    SequenceMatcher(None, query, name).ratio(). Only the work is pruned:
+    
+    - substring hits come from a character trigram inverted index
+    - ratio() is bounded by 2 * shared characters / total length, computed
+      for every name at once from per-name character counts (NumPy), and
+      only names whose bound can still reach the top-k are scored
+    
+    Ties go to the name that comes first in the catalog, as before.
+    
+    With an OCRConfusionTable, confusion_top_k() also scores every name by
+    OCR-weighted edit distance in one NumPy pass (see there).
+    """
+    
+    def __init__(self, names, confusions=None):
+        import numpy as np
+        self.names = list(names)
+        self.lowered = [name.lower() for name in self.names]
+        self.lengths = np.array([len(name) for name in self.lowered], dtype=np.int32)
+        
+        alphabet = sorted(set(''.join(self.lowered)))
+        self.alphabet = {char: column for column, char in enumerate(alphabet)}
+        self.char_counts = np.zeros((len(self.names), len(alphabet)), dtype=np.int16)
+        
+        postings = {}
+        for row, name in enumerate(self.lowered):
+            for char in name:
+                self.char_counts[row, self.alphabet[char]] += 1
+            for gram in {name[i:i + 3] for i in range(len(name) - 2)}:
+                postings.setdefault(gram, []).append(row)
+        self.trigrams = {gram: frozenset(rows) for gram, rows in postings.items()}
+        
+        self.confusions = confusions
+        if confusions is not None:
+            self._build_confusion_tables(confusions)
+    
+    def _build_confusion_tables(self, confusions):
+        """Per-name character codes, the substitution matrix and confusable-class counts"""
+        import numpy as np
+        chars = sorted(set(self.alphabet) | {char for pair in confusions.costs for char in pair})
+        self.codes = {char: code for code, char in enumerate(chars)}
+        pad = len(chars) + 1  # Row len(chars) of the matrix is for unknown query characters
+        
+        # substitution[read code, actual code]
+        self.substitution = np.ones((len(chars) + 1, len(chars) + 2), dtype=np.float32)
+        for code in range(len(chars)):
+            self.substitution[code, code] = 0.0
+        for (read, actual), cost in confusions.costs.items():
+            self.substitution[self.codes[read], self.codes[actual]] = cost
+        
+        max_length = int(self.lengths.max()) if len(self.names) else 0
+        self.name_codes = np.full((len(self.names), max_length), pad, dtype=np.int16)
+        for row, name in enumerate(self.lowered):
+            self.name_codes[row, :len(name)] = [self.codes[char] for char in name]
+        
+        # Characters that can substitute for each other cheaply form one class
+        parent = list(range(len(chars)))
+        def find(code):
+            while parent[code] != code:
+                parent[code] = parent[parent[code]]
+                code = parent[code]
+            return code
+        for (read, actual), cost in confusions.costs.items():
+            if cost < 1.0:
+                parent[find(self.codes[read])] = find(self.codes[actual])
+        roots = sorted({find(code) for code in range(len(chars))})
+        class_of = {root: index for index, root in enumerate(roots)}
+        self.char_class = np.array([class_of[find(code)] for code in range(len(chars))], dtype=np.int16)
+        self.class_counts = np.zeros((len(self.names), len(roots)), dtype=np.int16)
+        for row, name in enumerate(self.lowered):
+            for char in name:
+                self.class_counts[row, self.char_class[self.codes[char]]] += 1
+    
+    def __len__(self):
+        return len(self.names)
+    
+    def substring_rows(self, query):
+        """Rows whose lowercase name contains the (lowercase) query"""
+        if len(query) < 3:
+            return [row for row, name in enumerate(self.lowered) if query in name]
+        grams = sorted(
+            (self.trigrams.get(query[i:i + 3], frozenset()) for i in range(len(query) - 2)),
+            key=len
+        )
+        candidates = grams[0].intersection(*grams[1:])
+        return [row for row in sorted(candidates) if query in self.lowered[row]]
+    
+    def top_k(self, query, k=5, threshold=0.0):
+        """
+        Best-scoring catalog names for a query
+        
+        Args:
+            query (str): Text to match (case and surrounding space are ignored)
+            k (int): Number of matches to return
+            threshold (float): Minimum score to return
+            
+        Returns:
+            list: (name, score) pairs, best first
+        """
+        import heapq
+        import numpy as np
+        query = query.lower().strip()
+        if not query or not self.names:
+            return []
+        
+        scores = {}
+        for row in self.substring_rows(query):
+            scores[row] = len(query) / self.lengths[row]
+        top = heapq.nlargest(k, scores.values())
+        heapq.heapify(top)
+        
+        # Upper bound on ratio() from shared character counts
+        query_counts = np.zeros(len(self.alphabet), dtype=np.int16)
+        for char in query:
+            column = self.alphabet.get(char)
+            if column is not None:
+                query_counts[column] += 1
+        shared = np.minimum(self.char_counts, query_counts).sum(axis=1)
+        bounds = 2.0 * shared / (len(query) + self.lengths)
+        
+        for row in np.argsort(-bounds, kind='stable'):
+            floor = max(threshold, top[0]) if len(top) >= k else threshold
+            if bounds[row] < floor:
+                break
+            if row in scores:
+                continue
+            score = SequenceMatcher(None, query, self.lowered[row]).ratio()
+            scores[int(row)] = score
+            if len(top) < k:
+                heapq.heappush(top, score)
+            elif score > top[0]:
+                heapq.heapreplace(top, score)
+        
+        ranked = sorted(
+            ((score, row) for row, score in scores.items() if score >= threshold),
+            key=lambda pair: (-pair[0], pair[1])
+        )
+        return [(self.names[row], float(score)) for score, row in ranked[:k]]
+    
+    def confusion_top_k(self, query, k=5, threshold=0.6):
+        """
+        Best catalog names by OCR-confusion-weighted edit distance
+        
+        Similarity is 1 - distance / max(len(query), len(name)), where
+        insertions and deletions cost 1 and substitutions cost what the
+        confusion table says. Since every character outside a confusable
+        class costs at least 1, shared class counts (and the length
+        difference) bound the similarity; names that can't reach the
+        threshold are dropped before the DP,
+        which then runs over all remaining names at once.
+        
+        Returns:
+            list: (name, similarity) pairs, best first
+        """
+        import numpy as np
+        query = query.lower().strip()
+        if self.confusions is None or not query or not self.names:
+            return []
+        
+        other = len(self.codes)
+        query_codes = [self.codes.get(char, other) for char in query]
+        query_classes = np.zeros(self.class_counts.shape[1], dtype=np.int16)
+        for code in query_codes:
+            if code != other:
+                query_classes[self.char_class[code]] += 1
+        longest = np.maximum(len(query), self.lengths)
+        bounds = np.minimum(
+            np.minimum(self.class_counts, query_classes).sum(axis=1),
+            longest - np.abs(self.lengths - len(query))  # Length difference alone costs this much
+        ) / longest
+        rows = np.flatnonzero(bounds >= threshold)
+        if not len(rows):
+            return []
+        
+        lengths = self.lengths[rows]
+        width = int(lengths.max())
+        names = self.name_codes[rows, :width]
+        steps = np.arange(width + 1, dtype=np.float32)
+        previous = np.broadcast_to(steps, (len(rows), width + 1))
+        for i, code in enumerate(query_codes, 1):
+            current = np.empty_like(previous)
+            current[:, 0] = i
+            current[:, 1:] = np.minimum(
+                previous[:, :-1] + self.substitution[code][names],  # substitute
+                previous[:, 1:] + 1.0                                # delete query char
+            )
+            # Insertions (cost 1) as a running minimum along the name
+            previous = np.minimum.accumulate(current - steps, axis=1) + steps
+        
+        distances = previous[np.arange(len(rows)), lengths]
+        similarity = 1.0 - distances / longest[rows]
+        order = np.lexsort((rows, -similarity))
+        return [
+            (self.names[rows[i]], float(similarity[i]))
+            for i in order[:k] if similarity[i] >= threshold
+        ]
+
+
+def fix_ocr_errors(text):
+    """
+    Fix common OCR misreads in Tarkov item names
+    
+    These rewrites predate the confusion-weighted matcher
+    (FuzzyItemIndex.confusion_top_k) and still help API searches when the
+    catalog isn't loaded; new misreads are handled by the matcher's
+    confusion table instead of more patterns here.
+    
+    Args:
+        text (str): OCR detected text
+    
+    Returns:
+        str: Corrected text
+    """
+    if not text:
+        return text
+    
+    # Common OCR corrections for Tarkov items
+    corrections = {
+        # Numbers misread as letters
+        'I': '1',  # I → 1 (e.g., M4AI → M4A1)
+        'l': '1',  # lowercase L → 1
+        'O': '0',  # O → 0
+        'o': '0',  # lowercase o → 0
+        'S': '5',  # S → 5 (in some contexts)
+        'B': '8',  # B → 8 (e.g., B13 → 813 but context matters)
+        'Z': '2',  # Z → 2
+    }
+    
+    # Apply corrections with context awareness
+    corrected = text
+    
+    # Fix M4A1 variants (M4AI → M4A1)
+    import re
+    corrected = re.sub(r'M4A[Il]', 'M4A1', corrected, flags=re.IGNORECASE)
+    corrected = re.sub(r'M4[Il]', 'M4A1', corrected, flags=re.IGNORECASE)
+    
+    # Fix AK variants (AKI4 → AK74, AKI02 → AK102)
+    corrected = re.sub(r'AK[Il](\d)', r'AK\1', corrected, flags=re.IGNORECASE)
+    corrected = re.sub(r'AK([Il])', r'AK7\1', corrected, flags=re.IGNORECASE)
+    
+    # Fix common item patterns
+    corrected = re.sub(r'6[B8]I3', '6B13', corrected, flags=re.IGNORECASE)  # 6BI3 → 6B13
+    corrected = re.sub(r'6813', '6B13', corrected, flags=re.IGNORECASE)  # 6813 → 6B13
+    corrected = re.sub(r'68I3', '6B13', corrected, flags=re.IGNORECASE)  # 68I3 → 6B13
+    
+    # Fix ADAR (ADAR might be misread as AOAR)
+    corrected = re.sub(r'A[O0]AR', 'ADAR', corrected, flags=re.IGNORECASE)
+    
+    # Fix REAP-IR (might be misread with numbers)
+    corrected = re.sub(r'REAP[- ]?[Il]R', 'REAP-IR', corrected, flags=re.IGNORECASE)
+    
+    # Fix MPX variants
+    corrected = re.sub(r'MPX[- ]?[Il]', 'MPX-1', corrected, flags=re.IGNORECASE)
+    
+    # Fix common number patterns in item names (e.g., Gen4, 5.45, 7.62)
+    corrected = re.sub(r'Gen[Il]', 'Gen4', corrected, flags=re.IGNORECASE)
+    corrected = re.sub(r'(\d)[Il](\d)', r'\1.\2', corrected)  # 5I45 → 5.45
+    corrected = re.sub(r'[Il]\.(\d)', r'1.\1', corrected)  # I.56 → 1.56
+    
+    return corrected
+
+
+# UI text that shows up next to tooltips and is never an item name
+UNWANTED_PHRASES = [
+    'inspect', 'examine', 'filter', 'search', 'modding', 
+    'edit build', 'discard', 'use', 'equip', 'move',
+    'context menu', 'fold', 'unfold', 'sort', 'filter by'
+]
+
+
+def select_item_text(results, anchor=None, single_line=False):
+    """
+    Pick the item name out of OCR results
+    
+    Args:
+        results (list): (bbox, text, confidence) tuples from an OCR engine
+        anchor (tuple): (x, y) cursor position in image coordinates
+        single_line (bool): Results come from one localized text line - join
+            its pieces left to right instead of picking the closest one
+        
+    Returns:
+        dict or None: {'text', 'confidence', 'distance'} of the selection
+    """
+    if single_line:
+        pieces = []
+        confidences = []
+        for (bbox, text, confidence) in sorted(results, key=lambda r: min(p[0] for p in r[0])):
+            text_clean = text.strip()
+            if text_clean and not any(phrase in text_clean.lower() for phrase in UNWANTED_PHRASES):
+                pieces.append(text_clean)
+                confidences.append(confidence)
+        if not pieces:
+            return None
+        return {'text': ' '.join(pieces), 'confidence': min(confidences), 'distance': 0.0}
+    
+    # Cursor position in the capture (largest text wins without one)
+    mouse_in_capture_x, mouse_in_capture_y = anchor if anchor is not None else (0, 0)
+    
+    # Filter and find text closest to mouse position
+    text_candidates = []
+    seen = set()
+    
+    for (bbox, text, confidence) in results:
+        text_clean = text.strip()
+        text_lower = text_clean.lower()
+        
+        # Skip duplicates, unwanted phrases, and very short text
+        if text_lower in seen:
+            continue
+        if any(phrase in text_lower for phrase in UNWANTED_PHRASES):
+            continue
+        if len(text_clean) < 3:
+            continue
+        
+        # Calculate center position of this text
+        center_x = sum([point[0] for point in bbox]) / 4
+        center_y = sum([point[1] for point in bbox]) / 4
+        
+        # Calculate distance from mouse position
+        distance = ((center_x - mouse_in_capture_x)**2 + (center_y - mouse_in_capture_y)**2)**0.5
+        
+        seen.add(text_lower)
+        text_candidates.append({
+            'text': text_clean,
+            'distance': distance,
+            'confidence': confidence
+        })
+    
+    if not text_candidates:
+        return None
+    
+    # Sort by distance (closest first)
+    text_candidates.sort(key=lambda x: x['distance'])
+    return text_candidates[0]
+
+
+def read_item_text(engine, image, anchor=None, fast_path=True, min_confidence=0.5):
+    """
+    Full tooltip OCR pipeline: localize, threshold, OCR and pick the item name
+    
+    Kept free of UI state so the scanner, the benchmark harness and the OCR
+    worker all run exactly the same steps.
+    
+    When the tooltip line is localized and fast_path is on, only the
+    recognizer runs on the known line box. Full text detection is the
+    fallback when that read is below min_confidence or no box was found.
+    
+    Args:
+        engine (OCREngine): Loaded OCR backend
+        image: BGR or grayscale capture
+        anchor (tuple): (x, y) cursor position in image coordinates
+        fast_path (bool): Try recognition-only on the localized line first
+        min_confidence (float): Fast-path reads below this fall back to detection
+        
+    Returns:
+        dict: {'text', 'raw_text', 'confidence', 'distance', 'located', 'path',
+            'timings'}; 'text' is None when nothing usable was read, 'path' is
+            'recognize' or 'detect' and 'timings' holds ms per path tried
+    """
+    import cv2
+    gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY) if image.ndim == 3 else image
+    
+    # Find the tooltip box and OCR only the text line inside it
+    located = localize_tooltip(gray, anchor)
+    if located:
+        x, y, w, h = located['line']
+        roi = gray[y:y + h, x:x + w]
+    else:
+        # No box found - fall back to the whole capture
+        roi = gray
+    
+    # Apply thresholding to make text more readable
+    # Tarkov uses light text on dark background
+    _, thresh = cv2.threshold(roi, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)
+    if located:
+        # Give the detector some dark margin around the tight crop
+        thresh = cv2.copyMakeBorder(thresh, 8, 8, 8, 8, cv2.BORDER_CONSTANT, value=0)
+    
+    timings = {}
+    selection = None
+    path = 'detect'
+    
+    if located and fast_path:
+        # The line box is known - skip the text detector
+        start = time.perf_counter()
+        line_box = [8, 8 + roi.shape[1], 8, 8 + roi.shape[0]]
+        results = engine.recognize(thresh, [line_box])
+        timings['recognize'] = (time.perf_counter() - start) * 1000
+        selection = select_item_text(results, single_line=True) if results else None
+        if selection and selection['confidence'] >= min_confidence:
+            path = 'recognize'
+        else:
+            selection = None
+    
+    if selection is None:
+        start = time.perf_counter()
+        results = engine.readtext(thresh)
+        timings['detect'] = (time.perf_counter() - start) * 1000
+        selection = select_item_text(results, anchor, single_line=bool(located)) if results else None
+    
+    result = {'text': None, 'raw_text': None, 'confidence': 0.0, 'distance': None,
+              'located': located, 'path': path, 'timings': timings}
+    if selection:
+        # Fix common OCR misreads
+        item_name = fix_ocr_errors(selection['text']).strip()
+        result.update(raw_text=selection['text'], confidence=selection['confidence'],
+                      distance=selection['distance'])
+        if len(item_name) > 2:  # Must be at least 3 characters
+            result['text'] = item_name
+    return result
+
+
+class OCREngine:
+    """
+    Base class for OCR backends
+    
+    Every backend returns EasyOCR-style (bbox, text, confidence) tuples where
+    bbox is four [x, y] corner points, so the rest of the scanner doesn't care
+    which engine produced them.
+    """
+    
+    name = 'base'
+    
+    @classmethod
+    def is_available(cls):
+        """Return True if the backend's dependencies are installed"""
+        return False
+    
+    def load(self):
+        """Load models (slow - call once, off the UI thread)"""
+    
+    def readtext(self, image):
+        """Detect and recognize all text in a grayscale image"""
+        raise NotImplementedError
+    
+    def recognize(self, image, boxes):
+        """
+        Recognize text in known boxes without running text detection
+        
+        Args:
+            image: Grayscale image
+            boxes (list): [x_min, x_max, y_min, y_max] per text line
+        """
+        raise NotImplementedError
+    
+    def read(self, image, anchor=None, fast_path=True, min_confidence=0.5):
+        """Run the full tooltip pipeline (read_item_text) with this engine"""
+        return read_item_text(self, image, anchor, fast_path, min_confidence)
+    
+    @staticmethod
+    def box_points(x_min, x_max, y_min, y_max):
+        """Axis-aligned box as EasyOCR-style corner points"""
+        return [[x_min, y_min], [x_max, y_min], [x_max, y_max], [x_min, y_max]]
+
+
+def default_ocr_threads():
+    """
+    Torch intra-op thread count for OCR on CPU
+    
+    Tooltip crops are small, so past ~4 threads the sync overhead outweighs
+    the extra cores (and starves the game). 0 in settings means this value.
+    """
+    return max(1, min(4, os.cpu_count() or 1))
+
+
+class EasyOCREngine(OCREngine):
+    """
+    EasyOCR (CRAFT detector + CRNN recognizer), CPU only
+    
+    The recognizer's LSTM and linear layers are dynamically quantized to int8
+    (EasyOCR's quantize=True), which is faster and smaller than fp32 on CPU
+    for near-identical accuracy - see --ocr-regression to verify on a corpus.
+    """
+    
+    name = 'easyocr'
+    quantize = True
+    
+    def __init__(self, threads=None, **reader_kwargs):
+        reader_kwargs.setdefault('quantize', self.quantize)
+        self.threads = threads
+        self.reader_kwargs = reader_kwargs
+        self.reader = None
+    
+    @classmethod
+    def is_available(cls):
+        # find_spec checks the install without importing easyocr (and torch)
+        return importlib.util.find_spec('easyocr') is not None
+    
+    def load(self):
+        if self.reader is None:
+            import easyocr
+            import torch
+            torch.set_num_threads(self.threads or default_ocr_threads())
+            self.reader = easyocr.Reader(['en'], gpu=False, **self.reader_kwargs)
+    
+    def model_bytes(self):
+        """Serialized size of the recognizer weights (int8 packs ~4x smaller than fp32)"""
+        import io
+        import torch
+        buffer = io.BytesIO()
+        torch.save(self.reader.recognizer.state_dict(), buffer)
+        return buffer.tell()
+    
+    def readtext(self, image):
+        return self.reader.readtext(image, detail=1)
+    
+    def recognize(self, image, boxes):
+        """
+        Recognize known boxes in a single recognizer batch
+        
+        Reader.recognize() runs horizontal boxes one at a time on CPU no matter
+        what batch_size says, so the crops are resized here and handed to
+        EasyOCR's get_text in one batch instead.
+        """
+        import math
+        from easyocr.recognition import get_text
+        from easyocr.utils import compute_ratio_and_resize
+        model_height = getattr(self.reader, 'imgH', 64)
+        image_list = []
+        max_ratio = 1.0
+        for box in boxes:
+            x_min, x_max, y_min, y_max = (int(v) for v in box)
+            crop = image[max(0, y_min):y_max, max(0, x_min):x_max]
+            if not crop.size:
+                continue
+            resized, ratio = compute_ratio_and_resize(crop, crop.shape[1], crop.shape[0], model_height)
+            image_list.append((self.box_points(x_min, x_max, y_min, y_max), resized))
+            max_ratio = max(max_ratio, ratio)
+        if not image_list:
+            return []
+        # Reader.recognize's defaults; ignore_char drops characters outside 'en'
+        return get_text(
+            self.reader.character,
+            model_height,
+            int(math.ceil(max_ratio) * model_height),
+            self.reader.recognizer,
+            self.reader.converter,
+            image_list,
+            ignore_char=''.join(set(self.reader.character) - set(self.reader.lang_char)),
+            decoder='greedy',
+            beamWidth=5,
+            batch_size=len(image_list),
+            contrast_ths=0.1,
+            adjust_contrast=0.5,
+            filter_ths=0.003,
+            workers=0,
+            device=self.reader.device
+        )
+
+
+class EasyOCRFP32Engine(EasyOCREngine):
+    """EasyOCR with the unquantized fp32 recognizer (accuracy reference)"""
+    
+    name = 'easyocr-fp32'
+    quantize = False
+
+
+class TesseractOCREngine(OCREngine):
+    """Tesseract via pytesseract (needs the tesseract binary on PATH)"""
+    
+    name = 'tesseract'
+    min_line_height = 32
+    
+    @classmethod
+    def is_available(cls):
+        try:
+            import pytesseract
+            pytesseract.get_tesseract_version()
+            return True
+        except Exception:
+            return False
+    
+    def load(self):
+        import pytesseract
+        self.pytesseract = pytesseract
+    
+    def _lines(self, image, config, offset=(0, 0)):
+        """Group tesseract word boxes into text lines"""
+        data = self.pytesseract.image_to_data(image, config=config, output_type=self.pytesseract.Output.DICT)
+        lines = OrderedDict()
+        for i, word in enumerate(data['text']):
+            confidence = float(data['conf'][i])
+            if not word.strip() or confidence < 0:
+                continue
+            key = (data['block_num'][i], data['par_num'][i], data['line_num'][i])
+            x, y = data['left'][i] + offset[0], data['top'][i] + offset[1]
+            line = lines.setdefault(key, {'words': [], 'conf': [], 'box': [x, x, y, y]})
+            line['words'].append(word)
+            line['conf'].append(confidence / 100)
+            box = line['box']
+            box[0] = min(box[0], x)
+            box[1] = max(box[1], x + data['width'][i])
+            box[2] = min(box[2], y)
+            box[3] = max(box[3], y + data['height'][i])
+        return [
+            (self.box_points(*line['box']), ' '.join(line['words']), min(line['conf']))
+            for line in lines.values()
+        ]
+    
+    def readtext(self, image):
+        return self._lines(image, '--psm 6')
+    
+    def recognize(self, image, boxes):
+        import cv2
+        results = []
+        for (x_min, x_max, y_min, y_max) in boxes:
+            crop = image[int(y_min):int(y_max), int(x_min):int(x_max)]
+            if 0 < crop.shape[0] < self.min_line_height:
+                # Tesseract misreads glyphs only a few pixels tall (stash labels)
+                scale = self.min_line_height / crop.shape[0]
+                crop = cv2.resize(crop, None, fx=scale, fy=scale, interpolation=cv2.INTER_CUBIC)
+            lines = self._lines(crop, '--psm 7', offset=(x_min, y_min))
+            text = ' '.join(line[1] for line in lines)
+            confidence = min((line[2] for line in lines), default=0.0)
+            results.append((self.box_points(x_min, x_max, y_min, y_max), text, confidence))
+        return results
+
+
+class ONNXEasyOCREngine(EasyOCREngine):
+    """
+    EasyOCR detector with the recognizer exported to ONNX Runtime
+    
+    The fp32 recognizer is exported once to model_dir and reused after that.
+    Preprocessing and greedy CTC decoding mirror easyocr.recognition.
+    """
+    
+    name = 'onnx'
+    model_height = 64
+    
+    quantize = False  # Dynamically quantized modules can't be exported
+    
+    def __init__(self, model_dir, threads=None, **reader_kwargs):
+        super().__init__(threads, **reader_kwargs)
+        self.model_path = os.path.join(model_dir, 'easyocr_recognizer.onnx')
+        self.session = None
+    
+    @classmethod
+    def is_available(cls):
+        return importlib.util.find_spec('onnxruntime') is not None and super().is_available()
+    
+    def load(self):
+        super().load()
+        import onnxruntime
+        if not os.path.exists(self.model_path):
+            self.export()
+        options = onnxruntime.SessionOptions()
+        options.intra_op_num_threads = self.threads or default_ocr_threads()
+        self.session = onnxruntime.InferenceSession(
+            self.model_path, options, providers=['CPUExecutionProvider']
+        )
+        self.input_names = [i.name for i in self.session.get_inputs()]
+    
+    def export(self):
+        """Export EasyOCR's recognizer to ONNX with dynamic batch and width"""
+        import torch
+        os.makedirs(os.path.dirname(self.model_path), exist_ok=True)
+        model = self.reader.recognizer
+        model = getattr(model, 'module', model)  # Unwrap DataParallel
+        model.eval()
+        dummy_image = torch.randn(1, 1, self.model_height, 256)
+        dummy_text = torch.zeros(1, 1, dtype=torch.long)
+        tmp_path = self.model_path + '.tmp'
+        torch.onnx.export(
+            model, (dummy_image, dummy_text), tmp_path,
+            input_names=['image', 'text'],
+            output_names=['logits'],
+            dynamic_axes={'image': {0: 'batch', 3: 'width'}, 'logits': {0: 'batch', 1: 'steps'}},
+            opset_version=12
+        )
+        os.replace(tmp_path, self.model_path)
+    
+    def _recognize_crops(self, crops):
+        """Run the ONNX recognizer on grayscale line crops; returns (text, confidence) each"""
+        import cv2
+        import numpy as np
+        if not crops:
+            return []
+        resized = []
+        for crop in crops:
+            h, w = crop.shape[:2]
+            width = max(1, int(round(w * self.model_height / max(1, h))))
+            resized.append(cv2.resize(crop, (width, self.model_height), interpolation=cv2.INTER_CUBIC))
+        
+        # Normalize to [-1, 1] and right-pad by repeating the last column (NormalizePAD)
+        max_width = max(r.shape[1] for r in resized)
+        batch = np.empty((len(resized), 1, self.model_height, max_width), dtype=np.float32)
+        for i, r in enumerate(resized):
+            normalized = (r.astype(np.float32) / 255.0 - 0.5) / 0.5
+            batch[i, 0, :, :r.shape[1]] = normalized
+            batch[i, 0, :, r.shape[1]:] = normalized[:, -1:]
+        
+        feeds = {'image': batch}
+        if 'text' in self.input_names:
+            feeds['text'] = np.zeros((len(resized), 1), dtype=np.int64)
+        logits = self.session.run(None, feeds)[0]
+        
+        # Softmax + greedy CTC decode with EasyOCR's own character converter
+        exp = np.exp(logits - logits.max(axis=2, keepdims=True))
+        probs = exp / exp.sum(axis=2, keepdims=True)
+        indices = probs.argmax(axis=2)
+        max_probs = probs.max(axis=2)
+        lengths = np.full(len(resized), indices.shape[1], dtype=np.int32)
+        texts = self.reader.converter.decode_greedy(indices.flatten(), lengths)
+        
+        results = []
+        for text, index_row, prob_row in zip(texts, indices, max_probs):
+            kept = prob_row[index_row != 0]
+            confidence = float(kept.prod() ** (2.0 / np.sqrt(len(kept)))) if len(kept) else 0.0
+            results.append((text, confidence))
+        return results
+    
+    def readtext(self, image):
+        horizontal_list, _ = self.reader.detect(image)
+        return self.recognize(image, horizontal_list[0] if horizontal_list else [])
+    
+    def recognize(self, image, boxes):
+        boxes = [[int(v) for v in box] for box in boxes]
+        crops = [image[max(0, y_min):y_max, max(0, x_min):x_max] for (x_min, x_max, y_min, y_max) in boxes]
+        keep = [i for i, crop in enumerate(crops) if crop.size]
+        decoded = self._recognize_crops([crops[i] for i in keep])
+        return [
+            (self.box_points(*boxes[i]), text, confidence)
+            for i, (text, confidence) in zip(keep, decoded)
+        ]
+
+
+OCR_ENGINES = {
+    EasyOCREngine.name: EasyOCREngine,
+    EasyOCRFP32Engine.name: EasyOCRFP32Engine,
+    TesseractOCREngine.name: TesseractOCREngine,
+    ONNXEasyOCREngine.name: ONNXEasyOCREngine
+}
+
+
+def create_ocr_engine(name='easyocr', model_dir=None, threads=None):
+    """
+    Create an (unloaded) OCR engine by name
+    
+    Args:
+        threads (int): Intra-op threads for torch/onnxruntime engines (None = default_ocr_threads())
+    """
+    if name == ONNXEasyOCREngine.name:
+        return ONNXEasyOCREngine(model_dir or os.path.join(os.getcwd(), 'models'), threads)
+    engine_class = OCR_ENGINES[name]
+    if issubclass(engine_class, EasyOCREngine):
+        return engine_class(threads)
+    return engine_class()
+
+
+def make_warmup_tooltip(text="Warm-up Item", size=(350, 80)):
+    """
+    Synthetic capture of an in-game tooltip for warm-up inference
+    
+    Dark box with a light 1px border and one line of white text, close
+    enough to the real thing that localize_tooltip() finds the text line.
+    """
+    import cv2
+    import numpy as np
+    width, height = size
+    image = np.full((height, width, 3), 40, dtype=np.uint8)
+    cv2.rectangle(image, (20, 20), (width - 40, 52), (8, 8, 8), -1)
+    cv2.rectangle(image, (20, 20), (width - 40, 52), (190, 190, 190), 1)
+    cv2.putText(image, text, (30, 42), cv2.FONT_HERSHEY_SIMPLEX, 0.5, (255, 255, 255), 1, cv2.LINE_AA)
+    return image
+
+
+def warm_up_ocr_engine(engine):
+    """
+    Run throwaway inferences so the first real scan doesn't pay for them
+    
+    Torch's first calls allocate buffers and pick kernels; this runs the
+    recognition-only path and the full detect + recognize path once each.
+    
+    Returns:
+        float: Warm-up time in ms
+    """
+    import cv2
+    start = time.perf_counter()
+    image = make_warmup_tooltip()
+    engine.read(image)
+    engine.readtext(cv2.cvtColor(image, cv2.COLOR_BGR2GRAY))
+    return (time.perf_counter() - start) * 1000
+
+
+def ocr_worker_main(requests_queue, responses_queue, engine_name, model_dir, threads=None):
+    """
+    Entry point of the OCR worker process
+    
+    Loads and warms up the engine once, then serves requests until told to stop. Frames
+    arrive in shared memory; only their name, shape and dtype cross the queue.
+    
+    Requests:  (request_id, op, frame, kwargs) with op 'read', 'readtext' or
+               'recognize', or None to stop
+    Responses: (request_id, 'ok' | 'error', payload); the first message is
+               (None, 'ready', load seconds) or (None, 'error', message)
+    """
+    import numpy as np
+    from multiprocessing import shared_memory
+    try:
+        start = time.perf_counter()
+        engine = create_ocr_engine(engine_name, model_dir, threads)
+        engine.load()
+        try:
+            warm_up_ocr_engine(engine)  # Also covers restarts after a crash
+        except Exception as e:
+            print(f"Warning: OCR warm-up failed: {e}")
+        responses_queue.put((None, 'ready', time.perf_counter() - start))
+    except Exception as e:
+        responses_queue.put((None, 'error', f"{type(e).__name__}: {e}"))
+        return
+    
+    attached = None
+    while True:
+        request = requests_queue.get()
+        if request is None:
+            break
+        request_id, op, frame, kwargs = request
+        try:
+            if attached is None or attached.name != frame['shm']:
+                if attached is not None:
+                    attached.close()
+                attached = shared_memory.SharedMemory(name=frame['shm'])
+            image = np.ndarray(frame['shape'], dtype=np.dtype(frame['dtype']), buffer=attached.buf)
+            try:
+                if op == 'read':
+                    payload = engine.read(image, **kwargs)
+                elif op == 'readtext':
+                    payload = engine.readtext(image)
+                elif op == 'recognize':
+                    payload = engine.recognize(image, **kwargs)
+                else:
+                    raise ValueError(f"Unknown OCR op: {op}")
+            finally:
+                del image  # Release the view so the block can be closed
+            responses_queue.put((request_id, 'ok', payload))
+        except Exception as e:
+            responses_queue.put((request_id, 'error', f"{type(e).__name__}: {e}"))
+    
+    if attached is not None:
+        attached.close()
+
+
+class OCRWorkerClient(OCREngine):
+    """
+    OCR engine proxy that runs inference in a long-lived worker process
+    
+    Keeps torch's threads and the GIL away from the Tk mainloop and the hotkey
+    listeners. Frames are copied into a reusable shared-memory block; results
+    come back over a queue. A crashed or hung worker is restarted.
+    """
+    
+    name = 'worker'
+    
+    def __init__(self, engine_name, model_dir, threads=None, load_timeout=600, request_timeout=30):
+        self.engine_name = engine_name
+        self.model_dir = model_dir
+        self.threads = threads
+        self.load_timeout = load_timeout
+        self.request_timeout = request_timeout
+        self.restarts = 0
+        self.process = None
+        self._shm = None
+        self._request_id = 0
+        self._lock = threading.Lock()
+    
+    def load(self):
+        with self._lock:
+            if not self.is_alive():
+                self._start()
+    
+    def is_alive(self):
+        return self.process is not None and self.process.is_alive()
+    
+    def _start(self):
+        """Spawn the worker and wait for its engine to load"""
+        ctx = multiprocessing.get_context('spawn')
+        self._requests = ctx.Queue()
+        self._responses = ctx.Queue()
+        self.process = ctx.Process(
+            target=ocr_worker_main,
+            args=(self._requests, self._responses, self.engine_name, self.model_dir, self.threads),
+            daemon=True
+        )
+        self.process.start()
+        try:
+            _, status, payload = self._responses.get(timeout=self.load_timeout)
+        except queue.Empty:
+            self._kill()
+            raise TimeoutError("OCR worker did not finish loading")
+        if status != 'ready':
+            self._kill()
+            raise RuntimeError(f"OCR worker failed to load: {payload}")
+        self.load_seconds = payload
+    
+    def _kill(self):
+        if self.process is not None:
+            try:
+                self.process.kill()
+                self.process.join(timeout=5)
+            except Exception:
+                pass
+        self.process = None
+    
+    def _restart(self):
+        self.restarts += 1
+        self._kill()
+        self._start()
+    
+    def _put_frame(self, image):
+        """Copy a frame into the shared-memory block, growing it if needed"""
+        import numpy as np
+        from multiprocessing import shared_memory
+        image = np.ascontiguousarray(image)
+        if self._shm is None or self._shm.size < image.nbytes:
+            self._release_shm()
+            self._shm = shared_memory.SharedMemory(create=True, size=max(image.nbytes, 1 << 20))
+        np.ndarray(image.shape, dtype=image.dtype, buffer=self._shm.buf)[...] = image
+        return {'shm': self._shm.name, 'shape': image.shape, 'dtype': image.dtype.str}
+    
+    def _release_shm(self):
+        if self._shm is not None:
+            try:
+                self._shm.close()
+                self._shm.unlink()
+            except Exception:
+                pass
+            self._shm = None
+    
+    def _call(self, op, image, **kwargs):
+        """Send one request and wait for its response, restarting a dead worker once"""
+        with self._lock:
+            for attempt in (1, 2):
+                if not self.is_alive():
+                    self._restart()
+                self._request_id += 1
+                request_id = self._request_id
+                self._requests.put((request_id, op, self._put_frame(image), kwargs))
+                
+                deadline = time.monotonic() + self.request_timeout
+                while True:
+                    try:
+                        response_id, status, payload = self._responses.get(timeout=0.25)
+                    except queue.Empty:
+                        if not self.is_alive():
+                            break  # Crashed mid-request - restart and retry
+                        if time.monotonic() > deadline:
+                            self._restart()
+                            raise TimeoutError("OCR worker timed out - restarted")
+                        continue
+                    if response_id != request_id:
+                        continue  # Stale answer from before a restart
+                    if status == 'error':
+                        raise RuntimeError(payload)
+                    return payload
+            raise RuntimeError("OCR worker crashed twice in a row")
+    
+    def read(self, image, anchor=None, fast_path=True, min_confidence=0.5):
+        # Whole pipeline in one round trip
+        return self._call('read', image, anchor=anchor, fast_path=fast_path, min_confidence=min_confidence)
+    
+    def readtext(self, image):
+        return self._call('readtext', image)
+    
+    def recognize(self, image, boxes):
+        return self._call('recognize', image, boxes=boxes)
+    
+    def close(self):
+        """Stop the worker and free shared memory"""
+        with self._lock:
+            if self.is_alive():
+                try:
+                    self._requests.put(None)
+                    self.process.join(timeout=2)
+                except Exception:
+                    pass
+            self._kill()
+            self._release_shm()
+
+
+def load_ocr_corpus(corpus_dir):
+    """
+    Load a tooltip corpus: image files plus labels.json mapping file name -> item name
+    
+    Returns:
+        list: (file name, BGR image, expected item name)
+    """
+    import cv2
+    with open(os.path.join(corpus_dir, 'labels.json'), 'r', encoding='utf-8') as f:
+        labels = json.load(f)
+    corpus = []
+    for filename, expected in sorted(labels.items()):
+        image = cv2.imread(os.path.join(corpus_dir, filename))
+        if image is not None:
+            corpus.append((filename, image, expected))
+    return corpus
+
+
+def normalize_item_text(text):
+    """Case- and whitespace-insensitive form used to compare item names"""
+    return ' '.join((text or '').lower().split())
+
+
+def benchmark_ocr_engines(corpus, engine_names, anchor=None, model_dir=None, threads=None):
+    """
+    Measure item-name accuracy and latency of OCR engines on a tooltip corpus
+    
+    Every engine runs twice: with the recognition-only fast path ('fast')
+    and with full text detection on every image ('full').
+    
+    Args:
+        corpus (list): Output of load_ocr_corpus()
+        engine_names (list): Keys of OCR_ENGINES to test
+        threads (int): Intra-op threads for torch/onnxruntime engines
+        
+    Returns:
+        dict: engine name -> {'load_s', 'model_mb', 'fast': stats, 'full': stats}
+            where stats is {'accuracy', 'correct', 'total', 'p50', 'p99', 'mean'}
+            (latencies in ms, 'fast' also has 'fallbacks'), or {'error': message}.
+            'model_mb' is None for engines without torch weights.
+    """
+    import numpy as np
+    report = {}
+    for name in engine_names:
+        engine_class = OCR_ENGINES.get(name)
+        if engine_class is None or not engine_class.is_available():
+            report[name] = {'error': 'not installed'}
+            continue
+        try:
+            engine = create_ocr_engine(name, model_dir, threads)
+            start = time.perf_counter()
+            engine.load()
+            report[name] = {'load_s': time.perf_counter() - start, 'model_mb': None}
+            if isinstance(engine, EasyOCREngine):
+                report[name]['model_mb'] = engine.model_bytes() / (1024 * 1024)
+            
+            for mode in ('fast', 'full'):
+                correct = 0
+                fallbacks = 0
+                samples = []
+                for filename, image, expected in corpus:
+                    start = time.perf_counter()
+                    result = read_item_text(engine, image, anchor, fast_path=(mode == 'fast'))
+                    samples.append((time.perf_counter() - start) * 1000)
+                    if normalize_item_text(result['text']) == normalize_item_text(expected):
+                        correct += 1
+                    if mode == 'fast' and result['path'] == 'detect':
+                        fallbacks += 1
+                
+                report[name][mode] = {
+                    'accuracy': correct / len(corpus) if corpus else 0.0,
+                    'correct': correct,
+                    'total': len(corpus),
+                    'fallbacks': fallbacks,
+                    'p50': float(np.percentile(samples, 50)) if samples else 0.0,
+                    'p99': float(np.percentile(samples, 99)) if samples else 0.0,
+                    'mean': float(np.mean(samples)) if samples else 0.0
+                }
+        except Exception as e:
+            report[name] = {'error': str(e)}
+    return report
+
+
+def check_ocr_regression(corpus, baseline='easyocr-fp32', candidate='easyocr', max_accuracy_drop=0.01,
+                         model_dir=None, threads=None):
+    """
+    Accuracy regression gate: compare a candidate OCR engine against a baseline
+    
+    Accuracy is item-name accuracy on the fast path, which is what scans use.
+    
+    Returns:
+        tuple: (passed, report) - passed is False if either engine failed to
+            load or the candidate's accuracy is more than max_accuracy_drop
+            below the baseline's; report is benchmark_ocr_engines() output
+    """
+    report = benchmark_ocr_engines(corpus, [baseline, candidate], model_dir=model_dir, threads=threads)
+    if 'error' in report[baseline] or 'error' in report[candidate]:
+        return False, report
+    drop = report[baseline]['fast']['accuracy'] - report[candidate]['fast']['accuracy']
+    return drop <= max_accuracy_drop, report
+
+
+class ScanCancelled(Exception):
+    """Raised inside a scan that was superseded by a newer request"""
+
+
+class ScanTicket:
+    """Handle passed to a scheduled scan so it can check whether it is still wanted"""
+    
+    def __init__(self, scheduler, generation, background=False):
+        self.scheduler = scheduler
+        self.generation = generation
+        self.background = background
+    
+    @property
+    def cancelled(self):
+        return self.generation != self.scheduler.generation
+    
+    def check(self):
+        """Raise ScanCancelled if a newer scan request has arrived"""
+        if self.cancelled:
+            raise ScanCancelled()
+
+
+class ScanScheduler:
+    """
+    Single-worker scan queue with debounce and latest-wins semantics
+    
+    At most one scan runs and one waits. A new request replaces the waiting
+    one (coalesced) and cancels the running one, which notices at its next
+    ticket.check() and is discarded (cancelled). Triggers arriving within
+    debounce seconds of the previous one - key auto-repeat, button spam - are
+    rejected before they reach the queue (debounced).
+    
+    Background requests (auto-scan) only supersede other background ones:
+    while an explicit scan is running or waiting they are skipped.
+    """
+    
+    def __init__(self, debounce=0.12):
+        self.debounce = debounce
+        self.generation = 0
+        self.counters = {'submitted': 0, 'completed': 0, 'coalesced': 0,
+                         'cancelled': 0, 'debounced': 0, 'skipped': 0}
+        self._pending = None
+        self._running = None  # Ticket of the scan in progress
+        self._last_trigger = {}
+        self._cond = threading.Condition()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+    
+    def accept_trigger(self, key):
+        """Return False (and count it as debounced) if this trigger repeats within the debounce window"""
+        now = time.monotonic()
+        with self._cond:
+            last = self._last_trigger.get(key)
+            self._last_trigger[key] = now
+            if last is not None and now - last < self.debounce:
+                self.counters['debounced'] += 1
+                return False
+        return True
+    
+    def submit(self, func, *args, background=False):
+        """
+        Queue func(*args, ticket=ticket), superseding anything older
+        
+        Args:
+            background (bool): Automatic request - never supersedes an explicit one
+            
+        Returns:
+            ScanTicket or None: The new request's ticket, None if it was skipped
+        """
+        with self._cond:
+            if background and any(t is not None and not t.background
+                                  for t in (self._running, self._pending and self._pending[0])):
+                self.counters['skipped'] += 1
+                return None
+            self.generation += 1
+            ticket = ScanTicket(self, self.generation, background)
+            self.counters['submitted'] += 1
+            if self._pending is not None:
+                self.counters['coalesced'] += 1
+            self._pending = (ticket, func, args)
+            self._cond.notify()
+        return ticket
+    
+    def _run(self):
+        while True:
+            with self._cond:
+                while self._pending is None:
+                    self._cond.wait()
+                ticket, func, args = self._pending
+                self._pending = None
+                self._running = ticket
+            outcome = None
+            try:
+                func(*args, ticket=ticket)
+                outcome = 'completed'
+            except ScanCancelled:
+                outcome = 'cancelled'
+            except Exception as e:
+                print(f"Warning: Scan failed: {e}")
+            with self._cond:
+                self._running = None
+                if outcome:
+                    self.counters[outcome] += 1
+
+
+class StartupProfile:
+    """
+    Per-phase startup timing (printed with --profile-startup)
+    
+    Times are ms since the module started loading. Background phases (OCR,
+    catalog, connection test) overlap the UI phases, so end times matter
+    more than the sum of durations.
+    """
+    
+    def __init__(self, enabled=False, start=None):
+        self.enabled = enabled
+        self.start = MODULE_LOAD_START if start is None else start
+        self.phases = []  # (name, end ms, duration ms or None)
+        self._lock = threading.Lock()
+    
+    def elapsed(self):
+        return (time.perf_counter() - self.start) * 1000
+    
+    def mark(self, name, since=None):
+        """
+        Record the end of a phase
+        
+        Args:
+            since (float): perf_counter() value when the phase began (None for an instant)
+        """
+        end = self.elapsed()
+        duration = (time.perf_counter() - since) * 1000 if since is not None else None
+        with self._lock:
+            self.phases.append((name, end, duration))
+        if self.enabled:
+            took = f"{duration:9.1f} ms" if duration is not None else ' ' * 12
+            print(f"[startup] {end:9.1f} ms  {took}  {name}")
+
+
+class StartupOrchestrator:
+    """
+    Runs startup tasks concurrently, each as soon as its dependencies finish
+    
+    A task listed in `requires` must succeed or the dependent task is skipped;
+    a task listed in `after` only has to finish (it may fail). Every task's
+    start, duration and outcome is recorded, and also marked on the
+    StartupProfile if one is given.
+    """
+    
+    def __init__(self, profile=None):
+        self.profile = profile
+        self.tasks = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def add(self, name, func, requires=(), after=()):
+        """Register a task (call before start())"""
+        self.tasks[name] = {
+            'func': func,
+            'requires': tuple(requires),
+            'after': tuple(after),
+            'status': 'pending',  # pending -> running -> ok | failed | skipped
+            'start_ms': None,
+            'duration_ms': None,
+            'error': None,
+            'done': threading.Event()
+        }
+    
+    def start(self):
+        """Start every task on its own daemon thread"""
+        for name in self.tasks:
+            threading.Thread(target=self._run_task, args=(name,), daemon=True).start()
+    
+    def _run_task(self, name):
+        task = self.tasks[name]
+        for dep in task['requires'] + task['after']:
+            self.tasks[dep]['done'].wait()
+        try:
+            failed = [dep for dep in task['requires'] if self.tasks[dep]['status'] != 'ok']
+            if failed:
+                task['status'] = 'skipped'
+                task['error'] = f"needs {', '.join(failed)}"
+                return
+            
+            started = time.perf_counter()
+            task['start_ms'] = self.profile.elapsed() if self.profile else None
+            task['status'] = 'running'
+            try:
+                task['func']()
+                task['status'] = 'ok'
+            except Exception as e:
+                task['status'] = 'failed'
+                task['error'] = str(e)
+            task['duration_ms'] = (time.perf_counter() - started) * 1000
+            if self.profile:
+                self.profile.mark(f"task {name} ({task['status']})", started)
+        finally:
+            task['done'].set()
+    
+    def wait(self, name, timeout=None):
+        """
+        Block until a task finishes
+        
+        Returns:
+            bool: True if the task succeeded
+        """
+        task = self.tasks[name]
+        task['done'].wait(timeout)
+        return task['status'] == 'ok'
+    
+    def report(self):
+        """Task name -> {'status', 'start_ms', 'duration_ms', 'error'}"""
+        return OrderedDict(
+            (name, {key: task[key] for key in ('status', 'start_ms', 'duration_ms', 'error')})
+            for name, task in self.tasks.items()
+        )
+
+
 class TarkovPriceCheckerUI:
     """Tarkov Price Checker with GUI, Hotkey, and OCR Support"""
     
-    def __init__(self, api_key=None):
+    def __init__(self, api_key=None, startup_profile=None):
         """Initialize the price checker with UI"""
+        self.startup_profile = startup_profile or StartupProfile()
+        self.startup_profile.mark('imports')
+        phase_start = time.perf_counter()
         self.base_url = "https://api.tarkov.dev/graphql"
         self.api_key = api_key  # Not needed for tarkov.dev but kept for compatibility
         self.headers = {'Content-Type': 'application/json'}
@@ -60,43 +2585,138 @@ class TarkovPriceCheckerUI:
         self.hotkey_registered = False
         self.toggle_hotkey_registered = False
         self.mouse_listener = None
-        self.mouse_controller = mouse.Controller()
+        self._mouse_controller = None  # pynput is imported on first use
         self.auto_capture_timer = None
         
         # Configurable hotkeys
         self.toggle_hotkey = 'shift+k'
         self.capture_hotkey = '8'
+        self.stash_hotkey = '9'
+        self.stash_hotkey_registered = False
+        
+        # Tooltip capture geometry relative to the cursor
+        self.capture_width = 350
+        self.capture_height = 80
+        self.capture_offset_x = 15    # Slightly to the right
+        self.capture_offset_y = -60   # Above cursor
+        self.capture_margin = 20      # Extra border grabbed so the tooltip box can be localized
+        
+        # Longest we wait for the capture key to come up before grabbing anyway
+        self.key_release_timeout = 0.3
+        
+        # The preview rectangle sits over the capture region: confirm grabs wait
+        # until it is destroyed and the compositor has dropped it from the screen
+        self.preview_hidden = threading.Event()
+        self.preview_hidden.set()
+        self.preview_hidden_at = 0.0
+        self.compositor_delay = 0.03
+        self.last_scan_timings = {}
         
         # Game mode (PVP/PVE)
         self.game_mode = 'PVP'  # Default to PVP
         
+        # Screen capture backend (created on first grab)
+        self.grabber = None
+        
         # OCR configuration
-        self.ocr_reader = None
+        self.ocr_engine = None
         self.ocr_enabled = True
-        self.ocr_loading = False
+        self.ocr_ready = threading.Event()  # Set once OCR is loaded and warm (or failed)
+        
+        # Every item's prices for both game modes in memory, each refreshed in
+        # background on its own schedule (see price_refresh_loop) and saved to
+        # disk so the next launch starts with them (see CatalogStore)
+        catalog_store = CatalogStore(os.path.join(user_temp, "WabbajackTarkov", "catalog"))
+        self.price_catalogs = {
+            mode: PriceCatalog(self.base_url, self.headers, mode, store=catalog_store)
+            for mode in ('PVP', 'PVE')
+        }
+        self.price_refresh_wakeup = threading.Event()  # Set to re-check catalog ages now
+        self.catalog_max_age = 24 * 60 * 60  # Older catalog prices go to the API instead
+        
+        # API price lookups (catalog misses): memory LRU over a sqlite file,
+        # stale entries served at once while they refresh (see PriceCache)
+        self.price_cache = PriceCache(
+            os.path.join(user_temp, "WabbajackTarkov", "price_cache.sqlite3"),
+            ttl=30 * 60
+        )
+        
+        # OCR character swaps learned from (OCR text, resolved item) pairs
+        self.ocr_confusions = OCRConfusionTable(
+            os.path.join(user_temp, "WabbajackTarkov", "ocr_confusions.pkl")
+        )  # loaded by the 'confusions' startup task
         
-        # Cache for OCR results (item_name: {data, timestamp})
-        self.ocr_cache = {}
-        self.cache_duration = timedelta(minutes=30)  # Cache for 30 minutes
+        # Tooltip text-line signature -> resolved item (skips OCR on repeats)
+        self.tooltip_cache = TooltipCache(
+            os.path.join(user_temp, "WabbajackTarkov", "tooltip_cache.pkl")
+        )
+        self.tooltip_cache.load()
         
         # Cache for all items (for fuzzy matching)
         self.all_items_cache = None
-        self.all_items_timestamp = None
+        self.item_ids = {}  # Catalog name or short name -> tarkov.dev item id
+        self.matcher_index = None  # (source list, FuzzyItemIndex)
+        self.matcher_lock = threading.Lock()  # Swaps names, ids and index together
+        
+        # (normalized OCR text, game mode, threshold, k) -> resolve_item_name() result
+        self.match_memo = LRUCache(maxsize=1024)
+        
+        # Background startup tasks (see start_background_tasks)
+        self.startup = None
+        self.time_to_first_scan = None
         
         # Preview mode for capture
         self.preview_mode = False
         self.preview_window = None
         self.preview_update_timer = None
         
+        # Speculative OCR while the preview rectangle follows the mouse
+        self.speculation_interval = 0.1
+        self.speculative_result = None     # (frame hash, item name)
+        self.speculative_pending = None    # (frame hash, threading.Event) while OCR runs
+        self.speculation_lock = threading.Lock()
+        self.speculation_generation = 0    # Bumped per preview so older loops exit
+        self.preview_excluded = False      # Preview window is invisible to screen capture
+        self.ocr_lock = threading.Lock()
+        
+        # Latency per OCR path: recognition-only vs full detection
+        self.ocr_path_stats = {
+            'recognize': {'count': 0, 'total_ms': 0.0},
+            'detect': {'count': 0, 'total_ms': 0.0},
+            'fallbacks': 0
+        }
+        
+        # All scans run one at a time; newer requests supersede older ones
+        self.scan_scheduler = ScanScheduler()
+        
+        # Hover-dwell auto-scan (no hotkey needed)
+        self.auto_scan_running = False
+        self.auto_scan_thread = None
+        self.auto_scan_generation = 0  # Bumped per start/stop so older loops exit
+        
         # Settings
         self.settings_file = os.path.join(user_temp, "WabbajackTarkov", "settings.pkl")
-        self.items_cache_file = os.path.join(user_temp, "WabbajackTarkov", "items_cache.pkl")
+        self.models_dir = os.path.join(user_temp, "WabbajackTarkov", "models")
         self.current_version = "1.3.2"
         self.settings = {
             'theme_color': '#00ff41',
             'bg_color': '#000000',
             'font_size': 10,
-            'overlay_font_size': 11
+            'overlay_font_size': 11,
+            'save_debug_captures': False,
+            'grabber_backend': 'auto',
+            'auto_scan': False,
+            'auto_scan_rate_hz': 4,
+            'auto_scan_dwell_ms': 250,
+            'auto_scan_diff_threshold': 6.0,
+            'stash_cell_size': 0,  # 0 = auto (63px at 1080p)
+            'ocr_engine': 'easyocr',
+            'ocr_fast_path': True,
+            'ocr_min_confidence': 0.5,
+            'ocr_worker_process': True,
+            'ocr_threads': 0,  # 0 = auto (up to 4)
+            'catalog_refresh_minutes': 10,
+            'background_catalog_refresh_minutes': 30
         }
         self.load_settings()
         
@@ -105,19 +2725,48 @@ class TarkovPriceCheckerUI:
         
         # Overlay window for price display
         self.overlay_window = None
+        self.overlay_excluded = False  # Price overlay is invisible to screen capture
+        self.stash_overlay_window = None
+        
+        # Tk calls queued from worker threads (see run_on_ui)
+        self.ui_queue = queue.Queue()
+        
+        self.startup_profile.mark('settings and caches', phase_start)
         
         # Create main window
+        phase_start = time.perf_counter()
         self.root = tk.Tk()
         self.root.title("Tarkov Tag Scanner")
         self.root.geometry("900x800")
         self.root.configure(bg='#000000')
+        # Cached here so scan threads never call into Tk for it
+        self.screen_height = self.root.winfo_screenheight()
+        self.startup_profile.mark('tk root', phase_start)
         
         # Show loading screen and initialize OCR in background
+        phase_start = time.perf_counter()
         self.show_loading_screen()
         
         self.create_ui()
+        self.startup_profile.mark('build ui', phase_start)
+        phase_start = time.perf_counter()
         self.register_toggle_hotkey()
-        
+        self.startup_profile.mark('register hotkeys', phase_start)
+        self.root.after(30, self.process_ui_queue)
+        
+    @property
+    def mouse_controller(self):
+        """pynput mouse controller, created on first use"""
+        if self._mouse_controller is None:
+            from pynput import mouse
+            self._mouse_controller = mouse.Controller()
+        return self._mouse_controller
+    
+    @property
+    def price_catalog(self):
+        """Price catalog for the current game mode"""
+        return self.price_catalogs[self.game_mode]
+    
     def show_loading_screen(self):
         """Display loading screen while OCR models initialize"""
         # Create loading window
@@ -155,9 +2804,6 @@ class TarkovPriceCheckerUI:
         # Progress animation
         self.loading_dots = 0
         self.animate_loading()
-        
-        # Start OCR initialization in background thread
-        threading.Thread(target=self.initialize_ocr_background, daemon=True).start()
     
     def animate_loading(self):
         """Animate loading dots"""
@@ -167,30 +2813,74 @@ class TarkovPriceCheckerUI:
             self.loading_dots += 1
             self.root.after(500, self.animate_loading)
     
+    def start_background_tasks(self):
+        """
+        Kick off startup work in parallel (see StartupOrchestrator)
+        
+        OCR and the item catalog load independently; the catalog and the
+        price download start from the on-disk snapshot when there is one,
+        and the fuzzy-match index needs the catalog plus the learned OCR
+        confusion costs. The scanner is ready once OCR is loaded and
+        the index is built (or the catalog failed and raw OCR text is used).
+        """
+        self.startup = StartupOrchestrator(self.startup_profile)
+        self.startup.add('ocr', self.initialize_ocr_background)
+        self.startup.add('snapshot', self.load_catalog_snapshot)
+        self.startup.add('catalog', self.load_or_fetch_all_items, after=['snapshot'])
+        self.startup.add('confusions', self.load_ocr_confusions)
+        self.startup.add('matcher', self.build_matcher_index, requires=['catalog'], after=['confusions'])
+        self.startup.add('prices', self.start_price_refresh, after=['snapshot'])
+        self.startup.add('price_cache', self.warm_price_cache)
+        self.startup.add('connection', self.test_connection)
+        self.startup.add('updates', self.check_for_updates)
+        self.startup.add('ready', self.on_startup_ready, requires=['ocr'], after=['matcher'])
+        self.startup.start()
+    
+    def on_startup_ready(self):
+        """Final startup task: everything a scan needs is loaded"""
+        self.time_to_first_scan = self.startup_profile.elapsed()
+        self.startup_profile.mark('ready to scan')
+        self.run_on_ui(self.close_loading_screen)
+        self.log(f">>> Ready to scan ({self.time_to_first_scan / 1000:.1f}s after launch)", '#00ff41')
+    
     def initialize_ocr_background(self):
-        """Initialize OCR in background thread"""
+        """Load the OCR engine (startup task, runs off the UI thread)"""
         try:
-            self.ocr_loading = True
-            # Initialize EasyOCR (downloads models on first run)
-            self.ocr_reader = easyocr.Reader(['en'], gpu=False)
-            self.ocr_loading = False
-            
-            # Pre-fetch all items for fuzzy matching
-            try:
-                if hasattr(self, 'loading_label') and self.loading_window.winfo_exists():
-                    self.loading_label.config(text="Loading item database...")
-                self.load_or_fetch_all_items()
-            except Exception as e:
-                print(f"Warning: Could not pre-fetch items: {e}")
-            
-            # Close loading window
-            if hasattr(self, 'loading_window') and self.loading_window.winfo_exists():
-                self.loading_window.destroy()
+            # Initialize the OCR engine (EasyOCR downloads models on first run)
+            engine_name = self.settings.get('ocr_engine', 'easyocr')
+            threads = self.settings.get('ocr_threads', 0) or None
+            if self.settings.get('ocr_worker_process', True):
+                # Inference runs in its own process, away from the Tk mainloop.
+                # The worker warms its engine up before reporting ready.
+                engine = OCRWorkerClient(engine_name, self.models_dir, threads)
+                engine.load()
+            else:
+                engine = create_ocr_engine(engine_name, self.models_dir, threads)
+                engine.load()
+                phase_start = time.perf_counter()
+                try:
+                    warm_up_ocr_engine(engine)
+                except Exception as e:
+                    print(f"Warning: OCR warm-up failed: {e}")
+                self.startup_profile.mark('ocr warm-up', phase_start)
+            self.ocr_engine = engine
+            self.run_on_ui(self.set_loading_text, "Loading item database...")
         except Exception as e:
-            self.ocr_loading = False
-            if hasattr(self, 'loading_window') and self.loading_window.winfo_exists():
-                self.loading_window.destroy()
-            messagebox.showerror("OCR Error", f"Failed to initialize OCR: {e}")
+            self.run_on_ui(self.close_loading_screen)
+            self.run_on_ui(messagebox.showerror, "OCR Error", f"Failed to initialize OCR: {e}")
+            raise
+        finally:
+            self.ocr_ready.set()
+    
+    def set_loading_text(self, text):
+        """Replace the loading screen's status text (UI thread only)"""
+        if hasattr(self, 'loading_window') and self.loading_window.winfo_exists():
+            self.loading_label.config(text=text)
+    
+    def close_loading_screen(self):
+        """Close the loading screen if it is still open (UI thread only)"""
+        if hasattr(self, 'loading_window') and self.loading_window.winfo_exists():
+            self.loading_window.destroy()
     
     def create_ui(self):
         """Create the user interface"""
@@ -355,6 +3045,37 @@ class TarkovPriceCheckerUI:
             )
             tray_btn.pack(side='left', padx=5)
         
+        # Auto-scan toggle
+        auto_frame = tk.Frame(hotkey_frame, bg='#001100')
+        auto_frame.pack(fill='x', pady=(10, 0))
+        
+        self.auto_scan_var = tk.BooleanVar(value=self.settings.get('auto_scan', False))
+        tk.Checkbutton(
+            auto_frame,
+            text="AUTO-SCAN (hover to scan, no hotkey)",
+            variable=self.auto_scan_var,
+            command=self.toggle_auto_scan,
+            font=("Courier New", 10, "bold"),
+            bg='#001100',
+            fg='#00ff41',
+            selectcolor='#000000',
+            activebackground='#001100',
+            activeforeground='#00ff41'
+        ).pack(side='left', padx=5)
+        
+        tk.Button(
+            auto_frame,
+            text="[ STATS ]",
+            command=self.show_stats,
+            font=("Courier New", 9, "bold"),
+            bg='#003300',
+            fg='#00ff41',
+            padx=10,
+            pady=2,
+            bd=2,
+            cursor='hand2'
+        ).pack(side='right', padx=5)
+        
         # Manual search frame
         search_frame = tk.LabelFrame(
             self.root,
@@ -467,17 +3188,52 @@ class TarkovPriceCheckerUI:
         """
         self.results_text.insert('1.0', instructions)
         
+    def run_on_ui(self, func, *args):
+        """
+        Run a Tk call on the main thread
+        
+        Tk isn't thread-safe, so calls from scan/listener threads are queued
+        and executed by process_ui_queue() instead of touching widgets directly.
+        
+        Returns:
+            bool: True if func ran immediately (already on the main thread)
+        """
+        if threading.current_thread() is threading.main_thread():
+            func(*args)
+            return True
+        self.ui_queue.put((func, args))
+        return False
+    
+    def process_ui_queue(self):
+        """Drain Tk calls queued by worker threads (rescheduled every 30 ms)"""
+        try:
+            while True:
+                func, args = self.ui_queue.get_nowait()
+                try:
+                    func(*args)
+                except Exception as e:
+                    print(f"Warning: UI update failed: {e}")
+        except queue.Empty:
+            pass
+        self.root.after(30, self.process_ui_queue)
+    
     def log(self, message, color='#00ff00'):
         """Log a message to the results text area"""
+        if self.run_on_ui(self._log, message, color):
+            self.root.update()
+    
+    def _log(self, message, color):
         self.results_text.insert('end', f"\n{message}", ('msg',))
         self.results_text.tag_config('msg', foreground=color)
         self.results_text.see('end')
-        self.root.update()
         
     def update_status(self, status, color='#00ff41'):
         """Update the status label"""
+        if self.run_on_ui(self._update_status, status, color):
+            self.root.update()
+    
+    def _update_status(self, status, color):
         self.status_label.config(text=f">>> {status.upper()}", fg=color)
-        self.root.update()
         
     def toggle_hotkey_method(self):
         """Toggle the hotkey listener on/off"""
@@ -488,6 +3244,7 @@ class TarkovPriceCheckerUI:
     
     def start_hotkey_listener(self):
         """Start auto-capture mode"""
+        from pynput import mouse
         try:
             self.hotkey_enabled = True
             self.hotkey_button.config(
@@ -510,16 +3267,23 @@ class TarkovPriceCheckerUI:
                 self.log(">>> WARNING: Keyboard requires admin privileges", '#ff9800')
                 self.log(">>> Mouse interface remains operational", '#ffff00')
             
+            try:
+                keyboard.add_hotkey(self.stash_hotkey, self.on_stash_hotkey_triggered, suppress=False)
+                self.stash_hotkey_registered = True
+                self.log(f">>> Press [{self.stash_hotkey.upper()}] to scan the whole stash grid", '#00ffff')
+            except:
+                pass
+            
             # Start mouse listener (works without admin!)
             def on_click(x, y, button, pressed):
                 if pressed:
                     # Trigger on mouse side buttons (Button.x1 or Button.x2)
                     # These are typically the back/forward buttons on gaming mice
                     if hasattr(button, 'name') and button.name in ['x1', 'x2']:
-                        self.on_hotkey_triggered()
+                        self.on_hotkey_triggered(trigger='mouse')
                     # Alternative: middle mouse button
                     elif button == mouse.Button.middle:
-                        self.on_hotkey_triggered()
+                        self.on_hotkey_triggered(trigger='mouse')
             
             self.mouse_listener = mouse.Listener(on_click=on_click)
             self.mouse_listener.start()
@@ -527,6 +3291,9 @@ class TarkovPriceCheckerUI:
             
             self.log(">>> Mouse interface: [ONLINE]", '#00ff41')
             
+            if self.settings.get('auto_scan'):
+                self.start_auto_scan()
+            
         except Exception as e:
             self.log(f"✗ Failed to register hotkey: {e}", '#ff0000')
             self.hotkey_enabled = False
@@ -535,34 +3302,174 @@ class TarkovPriceCheckerUI:
                 bg='#4CAF50'
             )
     
-    def stop_hotkey_listener(self):
-        """Stop auto-capture mode"""
-        try:
-            if self.hotkey_registered:
-                try:
-                    keyboard.remove_hotkey(self.capture_hotkey)
-                except:
-                    pass
-                self.hotkey_registered = False
-            
-            if self.mouse_listener:
-                self.mouse_listener.stop()
-                self.mouse_listener = None
-            
-            self.hotkey_enabled = False
-            self.hotkey_button.config(
-                text="[ ACTIVATE ]",
-                bg='#003300',
-                fg='#00ff41'
-            )
-            self.update_status("System Standby", '#ffff00')
-            self.log(">>> SYSTEM DEACTIVATED", '#ffff00')
-            
-        except Exception as e:
-            self.log(f"Error stopping hotkey: {e}", '#ff0000')
+    def stop_hotkey_listener(self):
+        """Stop auto-capture mode"""
+        try:
+            if self.hotkey_registered:
+                try:
+                    keyboard.remove_hotkey(self.capture_hotkey)
+                except:
+                    pass
+                self.hotkey_registered = False
+            
+            if self.stash_hotkey_registered:
+                try:
+                    keyboard.remove_hotkey(self.stash_hotkey)
+                except:
+                    pass
+                self.stash_hotkey_registered = False
+            
+            if self.mouse_listener:
+                self.mouse_listener.stop()
+                self.mouse_listener = None
+            
+            self.stop_auto_scan()
+            
+            self.hotkey_enabled = False
+            self.hotkey_button.config(
+                text="[ ACTIVATE ]",
+                bg='#003300',
+                fg='#00ff41'
+            )
+            self.update_status("System Standby", '#ffff00')
+            self.log(">>> SYSTEM DEACTIVATED", '#ffff00')
+            
+        except Exception as e:
+            self.log(f"Error stopping hotkey: {e}", '#ff0000')
+    
+    def toggle_auto_scan(self):
+        """Enable/disable hover-dwell auto-scan from the UI checkbox"""
+        self.settings['auto_scan'] = self.auto_scan_var.get()
+        self.save_settings()
+        if not self.hotkey_enabled:
+            if self.settings['auto_scan']:
+                self.log(">>> Auto-scan will start when the system is activated", '#ffff00')
+            return
+        if self.settings['auto_scan']:
+            self.start_auto_scan()
+        else:
+            self.stop_auto_scan()
+    
+    def start_auto_scan(self):
+        """Start the hover-dwell auto-scan loop"""
+        if self.auto_scan_running:
+            return
+        self.auto_scan_running = True
+        self.auto_scan_generation += 1
+        self.auto_scan_thread = threading.Thread(
+            target=self.auto_scan_loop, args=(self.auto_scan_generation,), daemon=True
+        )
+        self.auto_scan_thread.start()
+        self.log(f">>> Auto-scan: [ONLINE] - hover an item for {self.settings['auto_scan_dwell_ms']}ms", '#00ff41')
+    
+    def stop_auto_scan(self):
+        """Stop the hover-dwell auto-scan loop"""
+        if not self.auto_scan_running:
+            return
+        self.auto_scan_running = False
+        self.auto_scan_generation += 1  # The loop exits at its next tick
+        self.auto_scan_thread = None
+        self.log(">>> Auto-scan: [OFFLINE]", '#ffff00')
+    
+    def auto_scan_loop(self, generation):
+        """
+        Sample the tooltip region and scan once a new tooltip has settled
+        
+        Each tick grabs the capture region and compares a 44x10 grayscale
+        thumbnail against the previous one. OCR only runs after the frame has
+        stayed unchanged for auto_scan_dwell_ms and differs from the last frame
+        that was scanned, so an idle screen costs one small grab per tick.
+        
+        Sampling pauses while the price overlay is up (unless it is excluded
+        from capture): it opens inside the sampled region, and its appearing
+        or closing would otherwise look like a new tooltip. The loop exits
+        once auto_scan_generation moves past generation.
+        """
+        previous = None
+        last_scanned = None
+        stable_since = None
+        
+        try:
+            while self.auto_scan_running and generation == self.auto_scan_generation:
+                tick_start = time.perf_counter()
+                interval = 1.0 / max(1, self.settings.get('auto_scan_rate_hz', 4))
+                threshold = self.settings.get('auto_scan_diff_threshold', 6.0)
+                dwell = self.settings.get('auto_scan_dwell_ms', 250) / 1000
+                
+                try:
+                    # Don't compete with the two-phase hotkey scan or sample our own overlay
+                    overlay_shown = self.overlay_window is not None and not self.overlay_excluded
+                    if (self.preview_mode or overlay_shown or
+                            not self.ocr_ready.is_set() or self.ocr_engine is None):
+                        previous = None
+                    else:
+                        image = self.grab_region(self.get_capture_region())
+                        thumbnail = frame_thumbnail(image)
+                        
+                        if frame_difference(thumbnail, previous) > threshold:
+                            # Still changing - restart the dwell timer
+                            previous = thumbnail
+                            stable_since = tick_start
+                        elif (tick_start - stable_since >= dwell and
+                              frame_difference(thumbnail, last_scanned) > threshold):
+                            # Skipped while a hotkey/stash scan is busy - retried next tick
+                            if self.scan_scheduler.submit(self.auto_scan_capture, image, background=True):
+                                last_scanned = thumbnail
+                except Exception as e:
+                    self.log(f"✗ Auto-scan error: {e}", '#ff0000')
+                    previous = None
+                
+                elapsed = time.perf_counter() - tick_start
+                time.sleep(max(0.0, interval - elapsed))
+        finally:
+            self.release_grab_handle()
+    
+    def auto_scan_capture(self, image, ticket=None):
+        """OCR a settled auto-scan frame and look up the item if one is found"""
+        scan_start = time.perf_counter()
+        cache_key = self.tooltip_cache_key(image)
+        cached_name = self.tooltip_cache.get(cache_key) if cache_key else None
+        item_name = cached_name or self.extract_item_name_from_image(image, verbose=False)
+        timings = {'ocr': (time.perf_counter() - scan_start) * 1000}
+        if not item_name:
+            return
+        if ticket:
+            ticket.check()
+        
+        self.log("\n" + "="*60, '#00ff00')
+        self.log(f"⚡ Auto-scan detected: '{item_name}'", '#00ff00')
+        stage_start = time.perf_counter()
+        found_name = self.search_item(item_name, resolved=bool(cached_name))
+        if found_name and cache_key and not cached_name:
+            self.tooltip_cache.put(cache_key, found_name)
+        if found_name and not cached_name:
+            self.ocr_confusions.record(item_name, found_name)
+        timings['lookup'] = (time.perf_counter() - stage_start) * 1000
+        timings['total'] = (time.perf_counter() - scan_start) * 1000
+        self.log_scan_timings(timings)
+    
+    def on_hotkey_triggered(self, trigger='keyboard'):
+        """
+        Called when the hotkey is pressed
+        
+        Args:
+            trigger (str): 'keyboard' for the capture hotkey, 'mouse' for mouse buttons
+        """
+        # Ignore key auto-repeat and button spam
+        if not self.scan_scheduler.accept_trigger('capture'):
+            return
+        
+        # Runs on the keyboard/mouse listener thread - the preview window is
+        # Tk, so the press itself is handled on the main thread
+        self.run_on_ui(self.handle_capture_press, trigger)
     
-    def on_hotkey_triggered(self):
-        """Called when the hotkey is pressed"""
+    def handle_capture_press(self, trigger):
+        """
+        Toggle the preview rectangle, or capture under it (main thread only)
+        
+        Args:
+            trigger (str): 'keyboard' for the capture hotkey, 'mouse' for mouse buttons
+        """
         if not self.preview_mode:
             # First press: Show preview rectangle
             self.log("\n" + "="*60, '#00ff00')
@@ -573,11 +3480,12 @@ class TarkovPriceCheckerUI:
             self.log("⚡ Capturing...", '#ffff00')
             self.hide_preview_rectangle()
             self.update_status("Capturing screenshot...", '#ffff00')
-            # Run in a separate thread to avoid blocking
-            threading.Thread(target=self.capture_and_search, daemon=True).start()
+            # Queue on the scan worker - supersedes any scan still running
+            self.scan_scheduler.submit(self.capture_and_search, trigger)
     
     def show_preview_rectangle(self):
         """Show a green rectangle overlay to preview capture area"""
+        self.preview_hidden.clear()
         try:
             # Create transparent overlay window
             self.preview_window = tk.Toplevel(self.root)
@@ -585,17 +3493,14 @@ class TarkovPriceCheckerUI:
             self.preview_window.attributes('-alpha', 0.3)  # Semi-transparent
             self.preview_window.overrideredirect(True)  # No window decorations
             
-            # Tooltip-sized dimensions (same as actual capture)
-            capture_width = 350
-            capture_height = 80
-            
-            # Initial position
-            mouse_x, mouse_y = self.mouse_controller.position
-            capture_x = mouse_x + 15
-            capture_y = mouse_y - 60
+            # Tooltip-sized dimensions at the initial position (same as actual capture)
+            capture_x, capture_y, capture_width, capture_height = self.get_capture_region(padded=False)
             
             self.preview_window.geometry(f"{capture_width}x{capture_height}+{capture_x}+{capture_y}")
             
+            # Keep the rectangle out of our own speculative grabs where supported
+            self.preview_excluded = self.exclude_from_capture(self.preview_window)
+            
             # Green border frame
             border_frame = tk.Frame(self.preview_window, bg='#00ff00', bd=0)
             border_frame.pack(fill='both', expand=True, padx=3, pady=3)
@@ -609,19 +3514,25 @@ class TarkovPriceCheckerUI:
             # Start updating position to follow mouse
             self.update_preview_position()
             
+            # OCR the region under the rectangle before the confirm press arrives
+            with self.speculation_lock:
+                self.speculative_result = None
+                self.speculative_pending = None
+            self.speculation_generation += 1
+            threading.Thread(
+                target=self.speculative_scan_loop, args=(self.speculation_generation,), daemon=True
+            ).start()
+            
         except Exception as e:
+            self.preview_hidden.set()
             self.log(f"✗ Preview error: {e}", '#ff0000')
     
     def update_preview_position(self):
         """Update preview rectangle position to follow mouse"""
         if self.preview_mode and self.preview_window:
             try:
-                # Get current mouse position
-                mouse_x, mouse_y = self.mouse_controller.position
-                
                 # Calculate new position (same offset as capture)
-                capture_x = mouse_x + 15
-                capture_y = mouse_y - 60
+                capture_x, capture_y, _, _ = self.get_capture_region(padded=False)
                 
                 # Update window position
                 self.preview_window.geometry(f"+{capture_x}+{capture_y}")
@@ -648,216 +3559,663 @@ class TarkovPriceCheckerUI:
             except:
                 pass
             self.preview_window = None
+            try:
+                self.root.update_idletasks()  # Process the destroy now
+            except:
+                pass
         
         self.preview_mode = False
+        self.speculation_generation += 1  # Stop this preview's speculative loop
+        self.preview_hidden_at = time.perf_counter()
+        self.preview_hidden.set()
+    
+    def get_capture_region(self, padded=True):
+        """
+        Get the (x, y, width, height) tooltip capture region at the cursor
+        
+        Args:
+            padded (bool): Include capture_margin on every side so the whole
+                tooltip box is in frame for localization. The preview
+                rectangle uses the unpadded region.
+        """
+        mouse_x, mouse_y = self.mouse_controller.position
+        margin = self.capture_margin if padded else 0
+        return (
+            int(mouse_x + self.capture_offset_x - margin),
+            int(mouse_y + self.capture_offset_y - margin),
+            self.capture_width + 2 * margin,
+            self.capture_height + 2 * margin
+        )
+    
+    def get_capture_anchor(self):
+        """Cursor position in padded-capture coordinates"""
+        return (
+            self.capture_margin - self.capture_offset_x,
+            self.capture_margin - self.capture_offset_y
+        )
+    
+    def exclude_from_capture(self, window):
+        """
+        Hide a Tk window from screen capture (Windows 10 2004+ only)
+        
+        Returns:
+            bool: True if the window is now excluded
+        """
+        try:
+            import ctypes
+            window.update_idletasks()
+            hwnd = int(window.wm_frame(), 16)
+            WDA_EXCLUDEFROMCAPTURE = 0x11
+            return bool(ctypes.windll.user32.SetWindowDisplayAffinity(hwnd, WDA_EXCLUDEFROMCAPTURE))
+        except Exception:
+            return False  # Not supported - speculative grabs withdraw the preview instead
+    
+    def grab_without_preview(self, region):
+        """
+        Grab a region with the preview rectangle briefly withdrawn
+        
+        For when the preview can't be excluded from capture: the grab then
+        matches what the confirm press sees after the preview is hidden.
+        
+        Returns:
+            numpy.ndarray or None: None if the UI didn't withdraw the preview in time
+        """
+        hidden = threading.Event()
+        
+        def withdraw():
+            try:
+                if self.preview_window:
+                    self.preview_window.withdraw()
+                    self.preview_window.update_idletasks()
+            finally:
+                hidden.set()
+        
+        def restore():
+            if self.preview_mode and self.preview_window:
+                self.preview_window.deiconify()
+                self.preview_window.attributes('-topmost', True)
+        
+        self.run_on_ui(withdraw)
+        if not hidden.wait(0.5):
+            return None
+        try:
+            time.sleep(self.compositor_delay)  # Let the compositor drop the window from the screen
+            return self.grab_region(region)
+        finally:
+            self.run_on_ui(restore)
+    
+    def speculative_scan_loop(self, generation):
+        """
+        Grab and OCR the region under the preview rectangle while it is shown
+        
+        OCR only runs once two consecutive grabs hash the same (the cursor has
+        settled) at a position not speculated on yet. Unless the preview is
+        excluded from capture, the frame that gets OCR'd is grabbed with the
+        preview withdrawn, so its hash can match the confirm grab (taken after
+        the preview is hidden). The result is keyed by that hash so the
+        confirm press can reuse it. The loop exits once speculation_generation
+        moves past generation (preview hidden or shown again).
+        """
+        previous_hash = None
+        speculated_hash = None
+        try:
+            while self.preview_mode and generation == self.speculation_generation:
+                try:
+                    if not self.ocr_ready.is_set() or self.ocr_engine is None:
+                        time.sleep(self.speculation_interval)
+                        continue
+                    
+                    region = self.get_capture_region()
+                    image = self.grab_region(region)
+                    current_hash = frame_hash(image)
+                    stable = current_hash == previous_hash
+                    previous_hash = current_hash
+                    
+                    if stable and current_hash != speculated_hash:
+                        speculated_hash = current_hash
+                        if not self.preview_excluded:
+                            image = self.grab_without_preview(region)
+                        if image is not None and generation == self.speculation_generation:
+                            self.speculate_on_frame(image)
+                except Exception:
+                    with self.speculation_lock:
+                        pending = self.speculative_pending
+                        self.speculative_pending = None
+                    if pending:
+                        pending[1].set()
+                
+                time.sleep(self.speculation_interval)
+        finally:
+            self.release_grab_handle()
+    
+    def speculate_on_frame(self, image):
+        """OCR a preview-free frame and keep the result for the confirm press"""
+        clean_hash = frame_hash(image)
+        with self.speculation_lock:
+            if self.speculative_result and self.speculative_result[0] == clean_hash:
+                return
+            done = threading.Event()
+            self.speculative_pending = (clean_hash, done)
+        
+        item_name = self.extract_item_name_from_image(image, verbose=False)
+        with self.speculation_lock:
+            self.speculative_result = (clean_hash, item_name)
+            self.speculative_pending = None
+        done.set()
+    
+    def take_speculative_result(self, current_hash, timeout=2.0):
+        """
+        Return the speculative OCR result for this frame, if there is one
+        
+        Waits for an in-flight speculative OCR of the same frame rather than
+        starting a second one.
+        
+        Returns:
+            str or None: Item name when the frame matches, None otherwise
+        """
+        with self.speculation_lock:
+            pending = self.speculative_pending
+        if pending and pending[0] == current_hash:
+            pending[1].wait(timeout)
+        
+        with self.speculation_lock:
+            result = self.speculative_result
+            self.speculative_result = None
+        if result and result[0] == current_hash and result[1]:
+            return result[1]
+        return None
+    
+    def wait_for_trigger_release(self, trigger):
+        """
+        Block until the capture trigger is released and the screen is safe to grab
+        
+        Mouse buttons don't change what the game draws, so those capture
+        immediately. The keyboard hotkey fires on key-down, so wait for the
+        hook to report the key up (capped at key_release_timeout).
+        
+        Either way the preview rectangle must be off the screen first, unless
+        it was excluded from capture: wait for the UI thread to destroy it,
+        then for compositor_delay after that.
+        
+        Returns:
+            float: Time spent waiting in milliseconds
+        """
+        start = time.perf_counter()
+        if trigger == 'keyboard':
+            deadline = start + self.key_release_timeout
+            try:
+                while keyboard.is_pressed(self.capture_hotkey) and time.perf_counter() < deadline:
+                    time.sleep(0.005)
+            except Exception:
+                pass  # Hook unavailable - capture right away
+        
+        if not self.preview_excluded:
+            self.preview_hidden.wait(0.5)
+            remaining = self.preview_hidden_at + self.compositor_delay - time.perf_counter()
+            if remaining > 0:
+                time.sleep(remaining)
+        return (time.perf_counter() - start) * 1000
+    
+    def tooltip_cache_key(self, image):
+        """
+        Exact signature of the localized tooltip text line
+        
+        Returns:
+            bytes or None: line_signature() digest, None if no tooltip text was found
+        """
+        import cv2
+        try:
+            gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
+            located = localize_tooltip(gray, self.get_capture_anchor())
+            if not located:
+                return None
+            x, y, w, h = located['line']
+            _, line = cv2.threshold(gray[y:y + h, x:x + w], 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)
+            return line_signature(line)
+        except Exception:
+            return None
+    
+    def show_stats(self):
+        """Log cache and scan statistics"""
+        self.log("\n" + "="*60, '#00ffff')
+        self.log(">>> SCANNER STATS", '#00ff41')
+        tooltip = self.tooltip_cache.stats()
+        self.log(
+            f"TOOLTIP CACHE: {tooltip['size']} entries | {tooltip['hits']} hits / "
+            f"{tooltip['misses']} misses | hit rate {tooltip['hit_rate']:.0%}",
+            '#ffffff'
+        )
+        for mode, catalog in self.price_catalogs.items():
+            if not catalog.loaded:
+                continue
+            stats = catalog.stats
+            self.log(
+                f"PRICE CATALOG ({mode}): {len(catalog)} items | "
+                f"updated {catalog.age() / 60:.0f} min ago | last refresh ({stats['last_kind']}) "
+                f"{stats['last_changed']} items, {stats['last_ms'] / 1000:.1f}s, {stats['last_bytes'] / 1024:.0f} KB | "
+                f"{stats['total_bytes'] / 1024:.0f} KB total",
+                '#ffffff'
+            )
+        prices = self.price_cache.stats()
+        self.log(
+            f"PRICE CACHE: {prices['memory']} in memory / {prices['disk']} on disk | {prices['hits']} fresh + "
+            f"{prices['stale']} stale hits / {prices['misses']} misses ({prices['disk_reads']} from disk) | "
+            f"hit rate {prices['hit_rate']:.0%}",
+            '#ffffff'
+        )
+        memo = self.match_memo.stats()
+        self.log(
+            f"MATCH MEMO: {memo['size']} entries | {memo['hits']} hits / "
+            f"{memo['misses']} misses | hit rate {memo['hit_rate']:.0%}",
+            '#ffffff'
+        )
+        if self.startup:
+            tasks = ' | '.join(
+                f"{name} {task['duration_ms'] / 1000:.1f}s" if task['duration_ms'] is not None
+                else f"{name} {task['status']}"
+                for name, task in self.startup.report().items()
+            )
+            ready = f"{self.time_to_first_scan / 1000:.1f}s" if self.time_to_first_scan else 'not yet'
+            self.log(f"STARTUP: {tasks} | ready to scan {ready}", '#ffffff')
+        counters = self.scan_scheduler.counters
+        self.log(
+            f"SCAN QUEUE: {counters['submitted']} submitted | {counters['completed']} completed | "
+            f"{counters['coalesced']} coalesced | {counters['cancelled']} cancelled | "
+            f"{counters['debounced']} debounced | {counters['skipped']} auto-scans skipped",
+            '#ffffff'
+        )
+        for path, label in (('recognize', 'OCR FAST PATH'), ('detect', 'OCR FULL DETECT')):
+            stats = self.ocr_path_stats[path]
+            if stats['count']:
+                self.log(f"{label}: {stats['total_ms'] / stats['count']:.0f}ms avg over {stats['count']} reads", '#ffffff')
+        if isinstance(self.ocr_engine, OCRWorkerClient):
+            self.log(f"OCR WORKER: pid {self.ocr_engine.process.pid if self.ocr_engine.is_alive() else '-'} | "
+                     f"{self.ocr_engine.restarts} restarts", '#ffffff')
+        if self.ocr_path_stats['fallbacks']:
+            self.log(f"OCR FALLBACKS: {self.ocr_path_stats['fallbacks']} low-confidence fast reads", '#ffffff')
+        if self.last_scan_timings:
+            stages = ' | '.join(f"{stage} {ms:.0f}ms" for stage, ms in self.last_scan_timings.items())
+            self.log(f"LAST SCAN: {stages}", '#ffffff')
+        self.log("="*60, '#00ffff')
+    
+    def log_scan_timings(self, timings):
+        """Log per-stage scan timings in milliseconds"""
+        self.last_scan_timings = dict(timings)
+        stages = ' | '.join(f"{stage} {ms:.0f}ms" for stage, ms in timings.items())
+        self.log(f"⏱ {stages}", '#888888')
     
-    def capture_and_search(self):
-        """Capture screenshot and search for item"""
+    def capture_and_search(self, trigger='keyboard', ticket=None):
+        """
+        Capture screenshot and search for item
+        
+        Args:
+            trigger (str): What started the scan ('keyboard' or 'mouse')
+            ticket (ScanTicket): Scheduler ticket; the scan stops if superseded
+        """
         try:
-            # Small delay to let keys be released
-            time.sleep(0.3)
+            scan_start = time.perf_counter()
+            timings = {}
             
-            # Get mouse position
-            mouse_x, mouse_y = self.mouse_controller.position
+            # Wait for the hotkey to come up instead of a fixed delay
+            timings['release'] = self.wait_for_trigger_release(trigger)
             
             # Capture tooltip-sized area near cursor
-            capture_width = 350
-            capture_height = 80
-            capture_x = mouse_x + 15   # Slightly to the right
-            capture_y = mouse_y - 60   # Above cursor
-            
-            region = (capture_x, capture_y, capture_width, capture_height)
-            filepath = self.take_screenshot(region=region, filename="tooltip_capture.png")
+            region = self.get_capture_region()
+            _, _, capture_width, capture_height = region
+            stage_start = time.perf_counter()
+            image = self.grab_region(region)
+            timings['grab'] = (time.perf_counter() - stage_start) * 1000
             self.log(f"✓ Captured {capture_width}x{capture_height}px around cursor", '#00ff00')
+            if ticket:
+                ticket.check()
+            
+            # Only write the capture to disk when debug dumps are enabled
+            if self.settings.get('save_debug_captures'):
+                self.save_debug_capture(image, "tooltip_capture.png")
             
             # Use OCR to detect item name (always enabled)
             self.log("🔍 Detecting item name from screenshot...", '#ffff00')
             self.update_status("Reading item name with OCR...", '#ffff00')
             
-            item_name = self.extract_item_name_from_image(filepath)
+            stage_start = time.perf_counter()
+            cache_key = self.tooltip_cache_key(image)
+            cached_name = self.tooltip_cache.get(cache_key) if cache_key else None
+            if cached_name:
+                item_name = cached_name
+                self.log("⚡ Tooltip seen before - skipping OCR", '#00ffff')
+            else:
+                item_name = self.take_speculative_result(frame_hash(image))
+                if item_name is not None:
+                    self.log("⚡ Using speculative OCR result from preview", '#00ffff')
+                else:
+                    item_name = self.extract_item_name_from_image(image)
+            timings['ocr'] = (time.perf_counter() - stage_start) * 1000
+            if ticket:
+                ticket.check()
             
             if item_name:
                 self.log(f"✓ Detected item name: '{item_name}'", '#00ff00')
-                self.search_item(item_name)
+                stage_start = time.perf_counter()
+                found_name = self.search_item(item_name, resolved=bool(cached_name))
+                if found_name and cache_key and not cached_name:
+                    self.tooltip_cache.put(cache_key, found_name)
+                if found_name and not cached_name:
+                    self.ocr_confusions.record(item_name, found_name)
+                timings['lookup'] = (time.perf_counter() - stage_start) * 1000
             else:
                 self.log("⚠ Could not detect item name from screenshot", '#ff9800')
                 self.update_status("No text detected", '#ff0000')
             
+            timings['total'] = (time.perf_counter() - scan_start) * 1000
+            self.log_scan_timings(timings)
+            
+        except ScanCancelled:
+            self.log("⏭ Scan superseded by a newer request", '#888888')
+            raise
         except Exception as e:
             self.log(f"✗ Error: {e}", '#ff0000')
             self.update_status("Error occurred", '#ff0000')
     
-    def initialize_ocr(self):
-        """Check if OCR is ready (already initialized in background)"""
-        if self.ocr_loading:
-            self.log(">>> Waiting for OCR initialization...", '#ffff00')
-            self.update_status("Waiting for OCR...", '#ffff00')
-            while self.ocr_loading:
-                time.sleep(0.1)
-                self.root.update()
-        
-        if self.ocr_reader is None:
-            self.log(">>> ERROR: OCR not initialized", '#ff0000')
-            return False
-        return True
+    def on_stash_hotkey_triggered(self):
+        """Called when the stash scan hotkey is pressed"""
+        if not self.scan_scheduler.accept_trigger('stash'):
+            return
+        self.log("\n" + "="*60, '#00ff00')
+        self.log("⚡ Scanning stash grid...", '#ffff00')
+        self.update_status("Scanning stash...", '#ffff00')
+        self.scan_scheduler.submit(self.stash_scan)
     
-    def fix_ocr_errors(self, text):
+    def get_stash_cell_size(self):
+        """Grid cell pitch in pixels (Tarkov cells are 63px at 1080p and scale with height)"""
+        configured = self.settings.get('stash_cell_size', 0)
+        if configured:
+            return int(configured)
+        return max(16, round(63 * self.screen_height / 1080))
+    
+    def recognize_labels(self, gray, boxes):
         """
-        Fix common OCR misreads in Tarkov item names
+        Read many small text labels with one batched recognizer call
+        
+        The label boxes go straight to the engine's recognize(), which skips
+        text detection; the EasyOCR and ONNX engines run every crop through
+        the recognizer as a single batch.
         
-        Args:
-            text (str): OCR detected text
-            
         Returns:
-            str: Corrected text
-        """
-        if not text:
-            return text
-        
-        # Common OCR corrections for Tarkov items
-        corrections = {
-            # Numbers misread as letters
-            'I': '1',  # I → 1 (e.g., M4AI → M4A1)
-            'l': '1',  # lowercase L → 1
-            'O': '0',  # O → 0
-            'o': '0',  # lowercase o → 0
-            'S': '5',  # S → 5 (in some contexts)
-            'B': '8',  # B → 8 (e.g., B13 → 813 but context matters)
-            'Z': '2',  # Z → 2
-        }
+            list: (text, confidence) per input box, in input order
+        """
+        if not boxes:
+            return []
         
-        # Apply corrections with context awareness
-        corrected = text
+        with self.ocr_lock:
+            results = self.ocr_engine.recognize(gray, [[x, x + w, y, y + h] for (x, y, w, h) in boxes])
+        
+        # engines drop empty crops, so match results back by top-left corner
+        corner_index = {(x, y): i for i, (x, y, w, h) in enumerate(boxes)}
+        texts = [('', 0.0)] * len(boxes)
+        for (bbox, text, confidence) in results:
+            index = corner_index.get((int(bbox[0][0]), int(bbox[0][1])))
+            if index is not None:
+                texts[index] = (text.strip(), float(confidence))
+        return texts
+    
+    def fetch_items_by_names(self, names):
+        """
+        Fetch price data for many catalog names in a single GraphQL request
         
-        # Fix M4A1 variants (M4AI → M4A1)
-        import re
-        corrected = re.sub(r'M4A[Il]', 'M4A1', corrected, flags=re.IGNORECASE)
-        corrected = re.sub(r'M4[Il]', 'M4A1', corrected, flags=re.IGNORECASE)
+        Uses the price catalog and cache like search_item; only names found
+        in neither hit the API. Stale cache entries are returned as they are
+        and refreshed in background.
         
-        # Fix AK variants (AKI4 → AK74, AKI02 → AK102)
-        corrected = re.sub(r'AK[Il](\d)', r'AK\1', corrected, flags=re.IGNORECASE)
-        corrected = re.sub(r'AK([Il])', r'AK7\1', corrected, flags=re.IGNORECASE)
+        Returns:
+            dict: name -> item data for every name that was found
+        """
+        found = {}
+        missing = []
+        stale = []
+        for name in names:
+            cached = self.catalog_item(self.item_ids.get(name), name)
+            if not cached:
+                cached, is_stale = self.price_cache.get(self.item_ids.get(name) or name, self.game_mode)
+                if is_stale:
+                    stale.append(name)
+            if cached:
+                found[name] = cached
+            elif name not in missing:
+                missing.append(name)
+        
+        if stale:
+            self.revalidate_prices(stale)
+        if missing:
+            found.update(self.query_items_by_names(missing, self.game_mode))
+        return found
+    
+    def query_items_by_names(self, names, game_mode):
+        """
+        Fetch price data for catalog names from the API in one request and cache it
         
-        # Fix common item patterns
-        corrected = re.sub(r'6[B8]I3', '6B13', corrected, flags=re.IGNORECASE)  # 6BI3 → 6B13
-        corrected = re.sub(r'6813', '6B13', corrected, flags=re.IGNORECASE)  # 6813 → 6B13
-        corrected = re.sub(r'68I3', '6B13', corrected, flags=re.IGNORECASE)  # 68I3 → 6B13
+        Returns:
+            dict: name -> item data for every name that was found
+        """
+        # Catalog names with a known id go in one items(ids:) field, the rest by name
+        found = {}
+        by_id = {}
+        by_name = []
+        for name in names:
+            if self.item_ids.get(name):
+                by_id.setdefault(self.item_ids[name], []).append(name)
+            else:
+                by_name.append(name)
         
-        # Fix ADAR (ADAR might be misread as AOAR)
-        corrected = re.sub(r'A[O0]AR', 'ADAR', corrected, flags=re.IGNORECASE)
+        params = ''.join(f", $n{i}: String!" for i in range(len(by_name)))
+        fields = ''.join(
+            f"\n              i{i}: items(name: $n{i}, gameMode: $gameMode) {{{ITEM_PRICE_FIELDS}              }}"
+            for i in range(len(by_name))
+        )
+        if by_id:
+            params += ", $ids: [ID]"
+            fields += f"\n              byId: items(ids: $ids, gameMode: $gameMode) {{{ITEM_PRICE_FIELDS}              }}"
+        query = f"query StashItems($gameMode: GameMode{params}) {{{fields}\n            }}"
+        variables = {"gameMode": 'regular' if game_mode == 'PVP' else 'pve'}
+        variables.update({f"n{i}": name for i, name in enumerate(by_name)})
+        if by_id:
+            variables['ids'] = list(by_id)
+        
+        response = requests.post(self.base_url, headers=self.headers,
+                                 json={"query": query, "variables": variables}, timeout=15)
+        response.raise_for_status()
+        data = response.json().get('data') or {}
+        
+        for item in data.get('byId') or []:
+            self.price_cache.put(item.get('id'), game_mode, item)
+            for name in by_id.get(item.get('id'), []):
+                found[name] = item
+        
+        for i, name in enumerate(by_name):
+            items = data.get(f"i{i}") or []
+            if not items:
+                continue
+            # Server does substring search - prefer the exact name/shortName hit
+            lower = name.lower()
+            item = next(
+                (it for it in items if lower in ((it.get('name') or '').lower(), (it.get('shortName') or '').lower())),
+                items[0]
+            )
+            self.price_cache.put(name, game_mode, item)
+            found[name] = item
+        return found
+    
+    def revalidate_prices(self, names):
+        """Re-fetch stale cached prices in background (one request; names already refreshing are skipped)"""
+        game_mode = self.game_mode
+        claimed = [name for name in names
+                   if self.price_cache.begin_refresh(self.item_ids.get(name) or name, game_mode)]
+        if not claimed:
+            return
         
-        # Fix REAP-IR (might be misread with numbers)
-        corrected = re.sub(r'REAP[- ]?[Il]R', 'REAP-IR', corrected, flags=re.IGNORECASE)
+        def refresh():
+            try:
+                self.query_items_by_names(claimed, game_mode)
+            except Exception as e:
+                self.log(f">>> WARNING: Background price refresh failed - {e}", '#ff9800')
+            finally:
+                for name in claimed:
+                    self.price_cache.end_refresh(self.item_ids.get(name) or name, game_mode)
         
-        # Fix MPX variants
-        corrected = re.sub(r'MPX[- ]?[Il]', 'MPX-1', corrected, flags=re.IGNORECASE)
+        threading.Thread(target=refresh, daemon=True).start()
+    
+    def stash_scan(self, ticket=None):
+        """Capture the whole screen, read every item label and rank items by price per slot"""
+        import cv2
+        try:
+            scan_start = time.perf_counter()
+            timings = {}
+            if not self.initialize_ocr():
+                return
+            
+            stage_start = time.perf_counter()
+            image = self.grab_region(None)
+            timings['grab'] = (time.perf_counter() - stage_start) * 1000
+            
+            stage_start = time.perf_counter()
+            gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
+            labels = segment_stash_labels(gray, self.get_stash_cell_size())
+            timings['segment'] = (time.perf_counter() - stage_start) * 1000
+            if not labels:
+                self.log("⚠ No item labels found - open your stash or inventory first", '#ff9800')
+                self.update_status("No items found", '#ff0000')
+                return
+            
+            stage_start = time.perf_counter()
+            texts = self.recognize_labels(gray, [label['box'] for label in labels])
+            timings['ocr'] = (time.perf_counter() - stage_start) * 1000
+            if ticket:
+                ticket.check()
+            
+            # Resolve every label against the local catalog
+            stage_start = time.perf_counter()
+            for label, (text, confidence) in zip(labels, texts):
+                text = self.fix_ocr_errors(text).strip()
+                match = self.find_best_match(text, verbose=False) if len(text) >= 2 else None
+                # Drop labels that didn't resolve to a catalog entry (stray UI text)
+                if match and self.all_items_cache and match == text and text not in self.all_items_cache:
+                    match = None
+                label['name'] = match
+            names = [label['name'] for label in labels if label['name']]
+            items = self.fetch_items_by_names(names)
+            timings['lookup'] = (time.perf_counter() - stage_start) * 1000
+            if ticket:
+                ticket.check()
+            
+            ranked = []
+            for label in labels:
+                item = items.get(label['name'])
+                per_slot = self.get_price_per_slot(item) if item else None
+                if per_slot:
+                    ranked.append(dict(label, item=item, per_slot=per_slot[0]))
+            ranked.sort(key=lambda entry: entry['per_slot'], reverse=True)
+            
+            timings['total'] = (time.perf_counter() - scan_start) * 1000
+            self.log(f"✓ Read {len(labels)} labels, priced {len(ranked)} items", '#00ff00')
+            for rank, entry in enumerate(ranked[:10], 1):
+                self.log(f"#{rank:<3}{entry['item'].get('name', 'Unknown')[:36]:<38}{entry['per_slot']:>10,.0f} ₽/slot", '#00ffff')
+            self.log_scan_timings(timings)
+            self.update_status(f"Stash scan complete ({len(ranked)} items)", '#00ff41')
+            
+            if ranked:
+                self.run_on_ui(self.show_stash_overlay, ranked)
+        except ScanCancelled:
+            self.log("⏭ Stash scan superseded by a newer request", '#888888')
+            raise
+        except Exception as e:
+            self.log(f"✗ Stash scan error: {e}", '#ff0000')
+            self.update_status("Error occurred", '#ff0000')
+    
+    def initialize_ocr(self, timeout=None):
+        """
+        Wait until OCR is ready (it is loaded and warmed up in background)
         
-        # Fix common number patterns in item names (e.g., Gen4, 5.45, 7.62)
-        corrected = re.sub(r'Gen[Il]', 'Gen4', corrected, flags=re.IGNORECASE)
-        corrected = re.sub(r'(\d)[Il](\d)', r'\1.\2', corrected)  # 5I45 → 5.45
-        corrected = re.sub(r'[Il]\.(\d)', r'1.\1', corrected)  # I.56 → 1.56
+        Call from scan threads only - this blocks until the startup task
+        finishes or timeout seconds pass.
+        """
+        if not self.ocr_ready.is_set():
+            self.log(">>> Waiting for OCR initialization...", '#ffff00')
+            self.update_status("Waiting for OCR...", '#ffff00')
+            self.ocr_ready.wait(timeout)
         
-        return corrected
+        if self.ocr_engine is None:
+            self.log(">>> ERROR: OCR not initialized", '#ff0000')
+            return False
+        return True
+    
+    def fix_ocr_errors(self, text):
+        """Fix common OCR misreads in Tarkov item names"""
+        return fix_ocr_errors(text)
+    
+    def record_ocr_path(self, result):
+        """Accumulate per-path OCR latency from a read_item_text() result"""
+        for path, ms in result['timings'].items():
+            self.ocr_path_stats[path]['count'] += 1
+            self.ocr_path_stats[path]['total_ms'] += ms
+        if 'recognize' in result['timings'] and result['path'] == 'detect':
+            self.ocr_path_stats['fallbacks'] += 1
     
-    def extract_item_name_from_image(self, image_path):
+    def extract_item_name_from_image(self, image, verbose=True):
         """
         Extract item name from screenshot using OCR
         Detects the black tooltip box with white border and extracts text from it
+        
+        Args:
+            image: BGR numpy array straight from grab_region(), or a path to
+                an image file on disk
+            verbose (bool): Log progress to the output window (off for background scans)
         """
+        import cv2
+        log = self.log if verbose else (lambda *args, **kwargs: None)
         try:
             # Initialize OCR if needed
             if not self.initialize_ocr():
                 return None
             
-            # Load the screenshot - this should already be just the tooltip
-            img = cv2.imread(image_path)
+            # Captures arrive as in-memory arrays; paths are still accepted
+            if isinstance(image, str):
+                img = cv2.imread(image)
+            else:
+                img = image
             if img is None:
-                self.log("✗ Could not load screenshot", '#ff0000')
+                log("✗ Could not load screenshot", '#ff0000')
                 return None
             
-            # Since we captured exactly where the tooltip is, just use the whole image
-            roi = img
-            
-            self.log(f"✓ Using captured tooltip region", '#00ffff')
-            
-            # Convert to grayscale
-            gray = cv2.cvtColor(roi, cv2.COLOR_BGR2GRAY)
-            
-            # Apply thresholding to make text more readable
-            # Tarkov uses light text on dark background
-            _, thresh = cv2.threshold(gray, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)
+            with self.ocr_lock:
+                result = self.ocr_engine.read(
+                    img, self.get_capture_anchor(),
+                    fast_path=self.settings.get('ocr_fast_path', True),
+                    min_confidence=self.settings.get('ocr_min_confidence', 0.5)
+                )
+            self.record_ocr_path(result)
             
-            # Perform OCR with position data (detail=1 returns bbox, text, confidence)
-            results = self.ocr_reader.readtext(thresh, detail=1)
+            if result['located']:
+                _, _, w, h = result['located']['line']
+                log(f"✓ Localized tooltip text line ({w}x{h}px)", '#00ffff')
+                if 'recognize' in result['timings'] and result['path'] == 'detect':
+                    log("⚠ Low confidence on fast path - ran full text detection", '#ff9800')
+            else:
+                log(f"✓ Using captured tooltip region", '#00ffff')
+                if result['raw_text']:
+                    log(f"✓ Selected closest text (distance: {result['distance']:.1f}px)", '#00ffff')
             
-            if results:
-                # Filter out UI elements
-                unwanted_phrases = [
-                    'inspect', 'examine', 'filter', 'search', 'modding', 
-                    'edit build', 'discard', 'use', 'equip', 'move',
-                    'context menu', 'fold', 'unfold', 'sort', 'filter by'
-                ]
-                
-                # Mouse position in the captured image (we captured 350x80 with mouse at x+15, y-60)
-                # So mouse is at approximately x=-15, y=60 relative to capture origin
-                mouse_in_capture_x = -15  # 15 pixels to the left of capture area
-                mouse_in_capture_y = 60   # 60 pixels below capture area top
-                
-                # Filter and find text closest to mouse position
-                text_candidates = []
-                seen = set()
-                
-                for (bbox, text, confidence) in results:
-                    text_clean = text.strip()
-                    text_lower = text_clean.lower()
-                    
-                    # Skip duplicates, unwanted phrases, and very short text
-                    if text_lower in seen:
-                        continue
-                    if any(phrase in text_lower for phrase in unwanted_phrases):
-                        continue
-                    if len(text_clean) < 3:
-                        continue
-                    
-                    # Calculate center position of this text
-                    center_x = sum([point[0] for point in bbox]) / 4
-                    center_y = sum([point[1] for point in bbox]) / 4
-                    
-                    # Calculate distance from mouse position
-                    distance = ((center_x - mouse_in_capture_x)**2 + (center_y - mouse_in_capture_y)**2)**0.5
-                    
-                    seen.add(text_lower)
-                    text_candidates.append({
-                        'text': text_clean,
-                        'distance': distance,
-                        'confidence': confidence
-                    })
-                
-                if not text_candidates:
-                    self.log("⚠ No valid text detected in screenshot", '#ff9800')
-                    return None
-                
-                # Sort by distance (closest first)
-                text_candidates.sort(key=lambda x: x['distance'])
-                
-                # Take the closest text as the item name
-                item_name = text_candidates[0]['text']
-                self.log(f"✓ Selected closest text (distance: {text_candidates[0]['distance']:.1f}px)", '#00ffff')
-                
-                # Fix common OCR misreads
-                item_name = self.fix_ocr_errors(item_name)
-                item_name = item_name.strip()
-                
-                if len(item_name) > 2:  # Must be at least 3 characters
-                    return item_name
+            if result['text']:
+                return result['text']
             
-            self.log("⚠ No text detected in screenshot", '#ff9800')
+            if result['raw_text'] is None:
+                log("⚠ No text detected in screenshot", '#ff9800')
+            else:
+                log("⚠ No valid text detected in screenshot", '#ff9800')
             return None
             
         except Exception as e:
-            self.log(f"✗ OCR error: {e}", '#ff0000')
+            log(f"✗ OCR error: {e}", '#ff0000')
             import traceback
-            self.log(traceback.format_exc(), '#ff0000')
+            log(traceback.format_exc(), '#ff0000')
             return None
     
     def manual_search(self):
@@ -872,25 +4230,45 @@ class TarkovPriceCheckerUI:
         self.log(f"🔍 Manual search for: {item_name}", '#00bfff')
         self.search_item(item_name)
     
+    def warm_price_cache(self):
+        """Startup task: load recent price lookups from disk so early scans hit memory"""
+        try:
+            count = self.price_cache.warm()
+            if count:
+                self.log(f">>> Loaded {count} cached prices from disk", '#00ff41')
+        except Exception as e:
+            self.log(f">>> Could not load price cache: {e}", '#ff9800')
+    
+    def load_ocr_confusions(self):
+        """Startup task: relearn OCR confusion costs from the saved pairs before the matcher is built"""
+        self.ocr_confusions.load()
+    
+    def load_catalog_snapshot(self):
+        """Startup task: map the last saved price catalogs so lookups work before the network"""
+        for mode, catalog in self.price_catalogs.items():
+            try:
+                count = catalog.load_snapshot()
+                if count:
+                    self.log(f">>> Loaded {count} {mode} items from disk catalog "
+                             f"({catalog.age() / 60:.0f} min old)", '#00ff41')
+            except Exception as e:
+                self.log(f">>> Could not load {mode} disk catalog: {e}", '#ff9800')
+    
     def load_or_fetch_all_items(self):
-        """Load items from disk cache or fetch from API if version changed"""
+        """
+        Load item names from the price catalogs, or fetch them from the API if none is loaded
+        
+        Raises:
+            RuntimeError: No item names could be obtained (the 'catalog' startup
+                task fails, so the matcher task is skipped)
+        """
         try:
-            # Try to load from disk cache
-            if os.path.exists(self.items_cache_file):
-                try:
-                    with open(self.items_cache_file, 'rb') as f:
-                        cache_data = pickle.load(f)
-                        
-                    # Check if cache version matches current app version
-                    if cache_data.get('version') == self.current_version:
-                        self.all_items_cache = cache_data.get('items', [])
-                        if self.all_items_cache:
-                            self.log(f">>> Loaded {len(self.all_items_cache)} items from cache", '#00ff41')
-                            return self.all_items_cache
-                    else:
-                        self.log(f">>> Cache version mismatch, fetching fresh data...", '#ffff00')
-                except Exception as e:
-                    self.log(f">>> Could not load cache: {e}", '#ff9800')
+            # Names and ids are the same in both modes; prefer the current one
+            for catalog in sorted(self.price_catalogs.values(), key=lambda c: c.game_mode != self.game_mode):
+                if catalog.loaded and catalog.by_name:
+                    self.item_ids = dict(catalog.by_name)
+                    self.all_items_cache = list(self.item_ids)
+                    return self.all_items_cache
             
             # Fetch from API
             self.log(">>> Fetching all items from API...", '#ffff00')
@@ -898,10 +4276,11 @@ class TarkovPriceCheckerUI:
             # Determine game mode for API query
             game_mode = 'regular' if self.game_mode == 'PVP' else 'pve'
             
-            # GraphQL query to fetch all items (just names)
+            # GraphQL query to fetch all items (ids and names)
             query = """
             query AllItems($gameMode: GameMode) {
               items(gameMode: $gameMode) {
+                id
                 name
                 shortName
               }
@@ -918,135 +4297,285 @@ class TarkovPriceCheckerUI:
             
             if data and 'data' in data and data['data']['items']:
                 items = data['data']['items']
-                # Store both full names and short names
-                all_names = set()
+                # Store both full names and short names, each mapped to the item id
+                item_ids = {}
                 for item in items:
-                    if item.get('name'):
-                        all_names.add(item['name'])
-                    if item.get('shortName'):
-                        all_names.add(item['shortName'])
+                    for key in ('name', 'shortName'):
+                        if item.get(key):
+                            item_ids.setdefault(item[key], item.get('id'))
                 
-                self.all_items_cache = list(all_names)
-                
-                # Save to disk with version
-                try:
-                    os.makedirs(os.path.dirname(self.items_cache_file), exist_ok=True)
-                    cache_data = {
-                        'version': self.current_version,
-                        'items': self.all_items_cache
-                    }
-                    with open(self.items_cache_file, 'wb') as f:
-                        pickle.dump(cache_data, f)
-                    self.log(f">>> Cached {len(self.all_items_cache)} items to disk", '#00ff41')
-                except Exception as e:
-                    self.log(f">>> Could not save cache: {e}", '#ff9800')
+                self.item_ids = item_ids
+                self.all_items_cache = list(item_ids)
+                self.log(f">>> Fetched {len(self.all_items_cache)} item names", '#00ff41')
                 
                 return self.all_items_cache
             
-            return []
+            raise RuntimeError("API returned no items")
             
         except Exception as e:
             self.log(f">>> WARNING: Could not fetch all items - {e}", '#ff9800')
-            return self.all_items_cache if self.all_items_cache else []
+            if self.all_items_cache:
+                return self.all_items_cache
+            raise
     
-    def find_best_match(self, search_name, threshold=0.6):
-        """Find the best matching item name using fuzzy matching"""
-        # Use cached items (already loaded on startup)
-        all_items = self.all_items_cache if self.all_items_cache else []
+    def refresh_price_catalog(self, game_mode=None):
+        """Bring one game mode's price catalog up to date (default: the current mode)"""
+        game_mode = game_mode or self.game_mode
+        catalog = self.price_catalogs[game_mode]
+        count = catalog.refresh()
+        stats = catalog.stats
+        self.log(f">>> {game_mode} price catalog ({stats['last_kind']}): {count} items updated "
+                 f"({stats['last_bytes'] / 1024:.0f} KB in {stats['last_ms'] / 1000:.1f}s)", '#00ff41')
+        
+        if game_mode == self.game_mode:
+            self.sync_item_names(catalog)
+        
+        # Keep the disk copy current for the next launch
+        if count:
+            try:
+                catalog.save()
+            except Exception as e:
+                self.log(f">>> Could not save {game_mode} disk catalog: {e}", '#ff9800')
+        return count
+    
+    def refresh_price_catalog_safely(self, game_mode=None):
+        """refresh_price_catalog() for background threads - failures are only logged"""
+        try:
+            self.refresh_price_catalog(game_mode)
+        except Exception as e:
+            self.log(f">>> WARNING: {game_mode or self.game_mode} price catalog refresh failed - {e}", '#ff9800')
+    
+    def sync_item_names(self, catalog):
+        """
+        Pick up items added since the name catalog was loaded
+        
+        The matcher index is rebuilt here, on the calling (background) thread;
+        scans keep using the old one until the new one is swapped in.
+        """
+        if catalog.by_name and set(catalog.by_name) != set(self.item_ids):
+            item_ids = dict(catalog.by_name)
+            self.build_matcher_index(list(item_ids), item_ids)
+    
+    def catalog_ttl(self, game_mode):
+        """Seconds a game mode's catalog stays fresh - the mode not in use refreshes less often"""
+        if game_mode == self.game_mode:
+            return self.settings.get('catalog_refresh_minutes', 10) * 60
+        return self.settings.get('background_catalog_refresh_minutes', 30) * 60
+    
+    def start_price_refresh(self):
+        """Startup task: update the current mode's catalog, then keep both modes fresh in background"""
+        try:
+            self.refresh_price_catalog()
+        finally:
+            threading.Thread(target=self.price_refresh_loop, daemon=True).start()
+    
+    def price_refresh_loop(self):
+        """Refresh each game mode's catalog once it is older than its TTL (checked every 15 s)"""
+        while True:
+            for mode in sorted(self.price_catalogs, key=lambda m: m != self.game_mode):
+                age = self.price_catalogs[mode].age()
+                if age is None or age >= self.catalog_ttl(mode):
+                    self.refresh_price_catalog_safely(mode)
+            self.price_refresh_wakeup.wait(15)
+            self.price_refresh_wakeup.clear()
+    
+    def catalog_item(self, item_id=None, name=None):
+        """
+        Item data from the local price catalog
+        
+        Returns:
+            dict, CatalogRecord or None: None if the current game mode's catalog
+            isn't loaded or is too old to trust
+        """
+        catalog = self.price_catalog
+        if not catalog.loaded or catalog.age() > self.catalog_max_age:
+            return None
+        if item_id:
+            return catalog.get(item_id)
+        return catalog.get_by_name(name) if name else None
+    
+    def build_matcher_index(self, items=None, item_ids=None):
+        """
+        Build the fuzzy-match index over the item catalog and swap it in
+        
+        Args:
+            items (list): New catalog names to switch to (default: the current ones)
+            item_ids (dict): Name -> id for the new names. New names, ids and
+                index are swapped in together, so scans never see a mix.
+            
+        Returns:
+            FuzzyItemIndex: Index for find_best_match
+        """
+        if items is None:
+            items = self.all_items_cache or []
+        index = FuzzyItemIndex(items, self.ocr_confusions)
+        with self.matcher_lock:
+            if item_ids is not None:
+                self.item_ids = item_ids
+                self.all_items_cache = items
+            self.matcher_index = (items, index)  # Keyed by the list it was built from
+            self.match_memo.clear()  # Resolutions against the old catalog
+        return index
+    
+    def current_matcher_index(self):
+        """
+        Matcher index for the current catalog, rebuilt if the catalog changed
         
-        if not all_items:
-            return search_name  # Return original if can't fetch items
+        Returns:
+            FuzzyItemIndex or None: None if the catalog isn't loaded
+        """
+        with self.matcher_lock:
+            all_items = self.all_items_cache if self.all_items_cache else []
+            if not all_items:
+                return None
+            if self.matcher_index and self.matcher_index[0] is all_items:
+                return self.matcher_index[1]
+        return self.build_matcher_index()
+    
+    def find_best_matches(self, search_name, k=5, threshold=0.0):
+        """
+        Top-k catalog names for a search string
+        
+        Each name scores the better of substring/ratio similarity and
+        OCR-confusion-weighted edit similarity.
+        
+        Returns:
+            list: (name, score) pairs, best first; empty if the catalog isn't loaded
+        """
+        index = self.current_matcher_index()
+        if index is None:
+            return []
         
-        # Calculate similarity scores
-        best_match = None
-        best_score = 0
+        scores = OrderedDict()
+        for name, score in index.top_k(search_name, k, threshold) + index.confusion_top_k(search_name, k, threshold):
+            scores[name] = max(score, scores.get(name, 0.0))
+        return sorted(scores.items(), key=lambda pair: -pair[1])[:k]
+    
+    def resolve_item_name(self, search_name, k=3, threshold=0.6, margin=0.05):
+        """
+        Resolve OCR or typed text to catalog items
         
-        search_lower = search_name.lower().strip()
+        Names and short names of the same item are merged by id. The result
+        is ambiguous when the runner-up scores within margin of the best
+        match (an exact match never is).
         
-        for item_name in all_items:
-            item_lower = item_name.lower()
-            
-            # Exact match
-            if search_lower == item_lower:
-                return item_name
-            
-            # Check if search is contained in item name
-            if search_lower in item_lower:
-                score = len(search_lower) / len(item_lower)
-                if score > best_score:
-                    best_score = score
-                    best_match = item_name
+        Returns:
+            dict: {'candidates': [{'id', 'name', 'score'}] best first (empty if
+                nothing reached threshold or the catalog isn't loaded),
+                'ambiguous': bool}
+        """
+        # Same OCR text seconds ago? Reuse its resolution (cleared when the catalog changes)
+        self.current_matcher_index()
+        memo_key = (normalize_item_text(search_name), self.game_mode, threshold, k)
+        resolution = self.match_memo.get(memo_key)
+        if resolution is not None:
+            return resolution
+        
+        candidates = []
+        seen = set()
+        for name, score in self.find_best_matches(search_name, k=2 * k, threshold=threshold):
+            item_id = self.item_ids.get(name)
+            if (item_id or name) in seen:
                 continue
-            
-            # Fuzzy matching using SequenceMatcher
-            similarity = SequenceMatcher(None, search_lower, item_lower).ratio()
-            
-            if similarity > best_score:
-                best_score = similarity
-                best_match = item_name
-        
-        # Only return match if similarity is above threshold
-        if best_score >= threshold:
-            if best_match.lower() != search_lower:
-                self.log(f">>> Fuzzy match: '{search_name}' → '{best_match}' (score: {best_score:.2f})", '#00ffff')
-            return best_match
-        
-        return search_name  # Return original if no good match
+            seen.add(item_id or name)
+            candidates.append({'id': item_id, 'name': name, 'score': score})
+        candidates = candidates[:k]
+        ambiguous = (
+            len(candidates) > 1 and candidates[0]['score'] < 1.0 and
+            candidates[0]['score'] - candidates[1]['score'] < margin
+        )
+        resolution = {'candidates': candidates, 'ambiguous': ambiguous}
+        if self.all_items_cache:
+            self.match_memo.put(memo_key, resolution)
+        return resolution
+    
+    def find_best_match(self, search_name, threshold=0.6, verbose=True):
+        """Find the best matching item name using fuzzy matching"""
+        candidates = self.resolve_item_name(search_name, k=1, threshold=threshold)['candidates']
+        if not candidates:
+            return search_name  # Return original if no good match (or no catalog)
+        
+        best_match, best_score = candidates[0]['name'], candidates[0]['score']
+        if verbose and best_match.lower() != search_name.lower().strip():
+            self.log(f">>> Fuzzy match: '{search_name}' → '{best_match}' (score: {best_score:.2f})", '#00ffff')
+        return best_match
     
-    def search_item(self, item_name):
-        """Search for an item and display results using GraphQL"""
-        # Try fuzzy matching to find correct item name
-        corrected_name = self.find_best_match(item_name)
+    def search_item(self, item_name, resolved=False, item_id=None):
+        """
+        Search for an item and display results using GraphQL
+        
+        Args:
+            item_name (str): Item name as typed or read by OCR
+            resolved (bool): Name is already a catalog name - skip fuzzy matching
+            item_id (str): tarkov.dev id of the item, if already known
+            
+        Returns:
+            str or None: The catalog name that was found, None if the search failed
+        """
+        alternatives = []
+        if resolved:
+            corrected_name = item_name
+            item_id = item_id or self.item_ids.get(item_name)
+        else:
+            # Resolve to catalog entries (with ids) using fuzzy matching
+            resolution = self.resolve_item_name(item_name)
+            candidates = resolution['candidates']
+            if candidates:
+                corrected_name, item_id = candidates[0]['name'], candidates[0]['id']
+                if corrected_name.lower() != item_name.lower().strip():
+                    self.log(f">>> Fuzzy match: '{item_name}' → '{corrected_name}' "
+                             f"(score: {candidates[0]['score']:.2f})", '#00ffff')
+                if resolution['ambiguous']:
+                    alternatives = candidates[1:]
+                    self.log(f">>> Ambiguous - runner-up: '{alternatives[0]['name']}' "
+                             f"(score: {alternatives[0]['score']:.2f})", '#ff9800')
+            else:
+                corrected_name = item_name
         
         self.update_status(f"Searching for {corrected_name}...", '#ffff00')
         
-        # Check cache first
-        cache_key = f"{corrected_name}_{self.game_mode}"
-        cached_data = self.get_cached_item(cache_key)
+        # Local price catalog first - no network round trip
+        item = self.catalog_item(item_id, corrected_name)
+        if item:
+            self.display_item_price(item, alternatives)
+            self.update_status("Search complete", '#00ff41')
+            return corrected_name
+        
+        # Check cache first - stale data is shown now and refreshed in background
+        cache_key = item_id or corrected_name
+        cached_data, stale = self.price_cache.get(cache_key, self.game_mode)
         if cached_data:
-            self.log(">>> Using cached data", '#00ffff')
-            self.display_item_price(cached_data)
+            if stale:
+                self.log(">>> Using cached data (refreshing in background)", '#00ffff')
+                self.revalidate_prices([corrected_name])
+            else:
+                self.log(">>> Using cached data", '#00ffff')
+            self.display_item_price(cached_data, alternatives)
             self.update_status("Search complete (cached)", '#00ff41')
-            return
+            return corrected_name
         
         try:
             # Determine game mode for API query
             game_mode = 'regular' if self.game_mode == 'PVP' else 'pve'
             
-            # GraphQL query for Tarkov.dev API
-            # Using 'items' query instead of deprecated 'itemsByName'
-            query = """
-            query Items($name: String!, $gameMode: GameMode) {
-              items(name: $name, gameMode: $gameMode) {
-                name
-                shortName
-                width
-                height
-                avg24hPrice
-                basePrice
-                lastLowPrice
-                changeLast48hPercent
-                low24hPrice
-                high24hPrice
-                iconLink
-                wikiLink
-                link
-                updated
-                sellFor {
-                  vendor {
-                    name
+            # GraphQL query for Tarkov.dev API: by id when the catalog resolved
+            # one, otherwise server-side name search
+            if item_id:
+                query = """
+                query ItemById($ids: [ID], $gameMode: GameMode) {
+                  items(ids: $ids, gameMode: $gameMode) {""" + ITEM_PRICE_FIELDS + """
                   }
-                  price
-                  currency
                 }
-              }
-            }
-            """
-            
-            variables = {
-                "name": corrected_name,
-                "gameMode": game_mode
-            }
+                """
+                variables = {"ids": [item_id], "gameMode": game_mode}
+            else:
+                query = """
+                query Items($name: String!, $gameMode: GameMode) {
+                  items(name: $name, gameMode: $gameMode) {""" + ITEM_PRICE_FIELDS + """
+                  }
+                }
+                """
+                variables = {"name": corrected_name, "gameMode": game_mode}
             payload = {"query": query, "variables": variables}
             
             response = requests.post(self.base_url, headers=self.headers, json=payload, timeout=10)
@@ -1059,33 +4588,68 @@ class TarkovPriceCheckerUI:
                 error_msg = data['errors'][0].get('message', 'Unknown error')
                 self.log(f">>> ERROR: GraphQL error - {error_msg}", '#ff0000')
                 self.update_status("Query error", '#ff0000')
-                return
+                return None
             
             if data and 'data' in data and data['data']['items'] and len(data['data']['items']) > 0:
                 item = data['data']['items'][0]
                 # Cache the result
-                self.cache_item(cache_key, item)
-                self.display_item_price(item)
+                self.price_cache.put(cache_key, self.game_mode, item)
+                self.display_item_price(item, alternatives)
                 self.update_status("Search complete", '#00ff41')
+                return corrected_name
             else:
                 self.log(f">>> ERROR: No item found - {item_name}", '#ff0000')
                 self.log(">>> TIP: Try full item name or check spelling", '#ffff00')
                 self.update_status("Item not found", '#ff0000')
+                return None
                 
         except Exception as e:
             self.log(f">>> ERROR: API request failed - {e}", '#ff0000')
             self.update_status("Error occurred", '#ff0000')
+            return None
+    
+    def show_candidate(self, candidate, ticket=None):
+        """Look up a specific catalog candidate (the overlay's runner-up button)"""
+        self.log(f"\n>>> Showing runner-up: '{candidate['name']}'", '#00ffff')
+        self.search_item(candidate['name'], resolved=True, item_id=candidate['id'])
+    
+    def get_item_price(self, item_data):
+        """Flea price used for display and ranking: avg24h, then last low, then base price"""
+        price = item_data.get('avg24hPrice') or item_data.get('lastLowPrice') or item_data.get('basePrice', 'N/A')
+        if isinstance(price, (int, float)) and price > 0:
+            return price
+        return None
+    
+    def get_price_per_slot(self, item_data):
+        """
+        Price per inventory slot from width and height
+        
+        Returns:
+            tuple or None: (price_per_slot, slots) or None if price/size unknown
+        """
+        price = self.get_item_price(item_data)
+        width = item_data.get('width', None)
+        height = item_data.get('height', None)
+        if width and height and price:
+            slots = width * height
+            return price / slots, slots
+        return None
     
-    def display_item_price(self, item_data):
-        """Display item price information from GraphQL response"""
+    def display_item_price(self, item_data, alternatives=None):
+        """
+        Display item price information from GraphQL response
+        
+        Args:
+            alternatives (list): Close runner-up candidates offered on the overlay
+        """
         self.log("\n" + "="*60, '#00ffff')
         self.log(f">>> ITEM: {item_data.get('name', 'Unknown').upper()}", '#00ff41')
         self.log("="*60, '#00ffff')
         self.log(f"SHORT NAME: {item_data.get('shortName', 'N/A')}", '#ffffff')
         
         # Use avg24hPrice as primary price (flea market average)
-        price = item_data.get('avg24hPrice') or item_data.get('lastLowPrice') or item_data.get('basePrice', 'N/A')
-        if isinstance(price, (int, float)) and price > 0:
+        price = self.get_item_price(item_data)
+        if price:
             self.log(f"FLEA PRICE: {price:,} ₽", '#00ff41')
         else:
             self.log(f"FLEA PRICE: N/A", '#00ff41')
@@ -1107,9 +4671,9 @@ class TarkovPriceCheckerUI:
         # Calculate price per slot from width and height
         width = item_data.get('width', None)
         height = item_data.get('height', None)
-        if width and height and isinstance(price, (int, float)) and price > 0:
-            slots = width * height
-            price_per_slot = price / slots
+        per_slot = self.get_price_per_slot(item_data)
+        if per_slot:
+            price_per_slot, slots = per_slot
             self.log(f"EFFICIENCY: {price_per_slot:,.0f} ₽/slot ({width}x{height} = {slots} slots)", '#00ffff')
         
         # Get best trader sell price
@@ -1125,35 +4689,48 @@ class TarkovPriceCheckerUI:
         self.log("="*60, '#00ffff')
         
         # Show overlay near mouse cursor
-        self.show_overlay(item_data)
+        self.run_on_ui(self.show_overlay, item_data, alternatives)
     
-    def take_screenshot(self, region=None, filename=None):
-        """Take a screenshot"""
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        
-        if filename is None:
-            filename = f"tarkov_screenshot_{timestamp}.png"
-        
-        filepath = os.path.join(self.screenshots_dir, filename)
+    def grab_region(self, region=None):
+        """
+        Grab a screen region straight into memory
         
-        if region:
-            screenshot = pyautogui.screenshot(region=region)
-        else:
-            screenshot = pyautogui.screenshot()
+        Args:
+            region (tuple): (x, y, width, height) or None for the full screen
+            
+        Returns:
+            numpy.ndarray: BGR pixel array ready for OpenCV/EasyOCR
+        """
+        if self.grabber is None:
+            self.grabber = create_grabber(self.settings.get('grabber_backend', 'auto'))
         
-        screenshot.save(filepath)
-        return filepath
+        # The grabber reuses its buffer, so hand OCR a private copy
+        return self.grabber.grab(region).copy()
+    
+    def release_grab_handle(self):
+        """Free this thread's capture handle - for capture loops that are about to exit"""
+        if self.grabber is not None:
+            self.grabber.release()
+    
+    def save_debug_capture(self, image, filename):
+        """Write a captured BGR array to the screenshots folder for debugging"""
+        import cv2
+        try:
+            filepath = os.path.join(self.screenshots_dir, filename)
+            cv2.imwrite(filepath, image)
+            return filepath
+        except Exception as e:
+            self.log(f">>> Could not save debug capture: {e}", '#ff9800')
+            return None
     
     def run(self):
         """Start the GUI application"""
-        # Test API connection on startup
-        self.test_connection()
-        
-        # Check for updates in background
-        threading.Thread(target=self.check_for_updates, daemon=True).start()
+        # OCR, item catalog, connection test and update check run in background
+        self.start_background_tasks()
         
         # Start the main loop
         self.root.protocol("WM_DELETE_WINDOW", self.on_closing)
+        self.root.after_idle(self.startup_profile.mark, 'window interactive')
         self.root.mainloop()
     
     def test_connection(self):
@@ -1188,8 +4765,14 @@ class TarkovPriceCheckerUI:
             self.update_status("Connection Failed", '#ff0000')
             return False
     
-    def show_overlay(self, item_data):
-        """Show a floating overlay window with price info near mouse cursor"""
+    def show_overlay(self, item_data, alternatives=None):
+        """
+        Show a floating overlay window with price info near mouse cursor
+        
+        Args:
+            alternatives (list): Runner-up candidates of an ambiguous match,
+                offered as a button so the right item is one click away
+        """
         # Close previous overlay if it exists
         if self.overlay_window:
             try:
@@ -1231,6 +4814,9 @@ class TarkovPriceCheckerUI:
         
         self.overlay_window.geometry(f"+{overlay_x}+{overlay_y}")
         
+        # The overlay opens inside the auto-scan sample region - keep it out of grabs
+        self.overlay_excluded = self.exclude_from_capture(self.overlay_window)
+        
         # Create frame with border
         frame = tk.Frame(self.overlay_window, bg='#00ff41', padx=3, pady=3)
         frame.pack(fill='both', expand=True)
@@ -1250,8 +4836,8 @@ class TarkovPriceCheckerUI:
         name_label.pack(anchor='w')
         
         # Price (use avg24hPrice from GraphQL) - MOST PROMINENT
-        price = item_data.get('avg24hPrice') or item_data.get('lastLowPrice') or item_data.get('basePrice', 'N/A')
-        price_text = f"{price:,} ₽" if isinstance(price, (int, float)) and price > 0 else "N/A"
+        price = self.get_item_price(item_data)
+        price_text = f"{price:,} ₽" if price else "N/A"
         price_label = tk.Label(
             inner_frame,
             text=price_text,
@@ -1265,9 +4851,9 @@ class TarkovPriceCheckerUI:
         # Price per slot (calculate from width x height) - SECOND MOST PROMINENT
         width = item_data.get('width', None)
         height = item_data.get('height', None)
-        if width and height and isinstance(price, (int, float)) and price > 0:
-            slots = width * height
-            price_per_slot = price / slots
+        per_slot = self.get_price_per_slot(item_data)
+        if per_slot:
+            price_per_slot, slots = per_slot
             slot_label = tk.Label(
                 inner_frame,
                 text=f"{price_per_slot:,.0f} ₽/slot",
@@ -1306,6 +4892,21 @@ class TarkovPriceCheckerUI:
                 )
                 trader_label.pack(anchor='w')
         
+        # Ambiguous match: offer the runner-up without rescanning
+        if alternatives:
+            runner_up = alternatives[0]
+            tk.Button(
+                inner_frame,
+                text=f"NOT IT? → {runner_up['name']}",
+                command=lambda: self.choose_alternative(runner_up),
+                font=("Courier New", 8, "bold"),
+                bg='#332200',
+                fg='#ff9800',
+                activebackground='#553300',
+                relief='flat',
+                cursor='hand2'
+            ).pack(anchor='w', pady=(5, 0))
+        
         # Close button / Auto-close timer
         close_info = tk.Label(
             inner_frame,
@@ -1317,29 +4918,109 @@ class TarkovPriceCheckerUI:
         )
         close_info.pack(pady=(5, 0))
         
-        # Click anywhere on overlay to close
+        # Click anywhere on overlay to close (the auto-close timer of an
+        # overlay that was already replaced must not close the new one)
+        window = self.overlay_window
         def close_overlay(event=None):
-            if self.overlay_window:
-                self.overlay_window.destroy()
+            if self.overlay_window is window:
+                window.destroy()
                 self.overlay_window = None
         
         self.overlay_window.bind('<Button-1>', close_overlay)
         for widget in [frame, inner_frame, name_label, price_label, close_info]:
             widget.bind('<Button-1>', close_overlay)
         
-        # Auto-close after 5 seconds
-        self.overlay_window.after(5000, close_overlay)
+        # Auto-close after 5 seconds (longer when there's a runner-up to pick)
+        self.overlay_window.after(8000 if alternatives else 5000, close_overlay)
+    
+    def choose_alternative(self, candidate):
+        """Overlay button: close the overlay and show the runner-up instead"""
+        if self.overlay_window:
+            self.overlay_window.destroy()
+            self.overlay_window = None
+        self.scan_scheduler.submit(self.show_candidate, candidate)
+    
+    def show_stash_overlay(self, ranked):
+        """
+        Show stash scan results: a rank marker on every priced item plus a top-10 list
+        
+        Markers are drawn on a click-through-looking full-screen canvas where the
+        platform supports a transparent color key (Windows); elsewhere only the
+        ranking list is shown.
+        """
+        if self.stash_overlay_window:
+            try:
+                self.stash_overlay_window.destroy()
+            except:
+                pass
+        
+        window = tk.Toplevel(self.root)
+        window.overrideredirect(True)
+        window.attributes('-topmost', True)
+        window.configure(bg='#010101')
+        self.stash_overlay_window = window
+        
+        screen_width = window.winfo_screenwidth()
+        screen_height = window.winfo_screenheight()
+        try:
+            window.attributes('-transparentcolor', '#010101')
+            window.geometry(f"{screen_width}x{screen_height}+0+0")
+            full_screen = True
+        except tk.TclError:
+            window.geometry("+20+20")
+            full_screen = False
+        
+        canvas = tk.Canvas(window, bg='#010101', highlightthickness=0,
+                           width=screen_width if full_screen else 460,
+                           height=screen_height if full_screen else 60 + 18 * min(10, len(ranked)))
+        canvas.pack(fill='both', expand=True)
+        
+        # Rank markers: top 3 green, top 10 cyan, rest grey
+        if full_screen:
+            for rank, entry in enumerate(ranked, 1):
+                x, y, w, h = entry['box']
+                color = '#00ff41' if rank <= 3 else '#00ffff' if rank <= 10 else '#888888'
+                text = f"#{rank} {entry['per_slot'] / 1000:,.0f}k"
+                marker = canvas.create_text(x + w, y + h + 2, text=text, anchor='ne',
+                                            font=("Courier New", 8, "bold"), fill=color)
+                canvas.create_rectangle(canvas.bbox(marker), fill='#000000', outline=color)
+                canvas.tag_raise(marker)
+        
+        # Ranking list
+        lines = [">>> STASH RANKING (₽/SLOT)"]
+        for rank, entry in enumerate(ranked[:10], 1):
+            lines.append(f"#{rank:<3}{entry['item'].get('name', 'Unknown')[:30]:<32}{entry['per_slot']:>10,.0f}")
+        lines.append("[CLICK TO CLOSE]")
+        list_x, list_y = 20, 20
+        text_id = canvas.create_text(list_x + 10, list_y + 10, text="\n".join(lines), anchor='nw',
+                                     font=("Courier New", 9, "bold"), fill='#00ff41')
+        x0, y0, x1, y1 = canvas.bbox(text_id)
+        canvas.create_rectangle(x0 - 8, y0 - 8, x1 + 8, y1 + 8, fill='#000000', outline='#00ff41', width=2)
+        canvas.tag_raise(text_id)
+        
+        def close_overlay(event=None):
+            if self.stash_overlay_window is window:
+                window.destroy()
+                self.stash_overlay_window = None
+        
+        canvas.bind('<Button-1>', close_overlay)
+        window.after(15000, close_overlay)
     
     def update_game_mode(self):
         """Update the game mode for API queries"""
         self.game_mode = self.mode_var.get()
         self.log(f">>> Game mode set to: {self.game_mode}", '#00ff41')
+        # Both modes' catalogs are kept loaded, so lookups switch over at once
+        # (any matcher rebuild happens off the UI thread); the refresh loop
+        # re-checks now since this mode's TTL just got shorter
+        threading.Thread(target=self.sync_item_names, args=(self.price_catalog,), daemon=True).start()
+        self.price_refresh_wakeup.set()
     
     def configure_hotkeys(self):
         """Open dialog to configure custom hotkeys"""
         config_window = tk.Toplevel(self.root)
         config_window.title("Configure Hotkeys")
-        config_window.geometry("500x300")
+        config_window.geometry("500x400")
         config_window.configure(bg='#000000')
         config_window.transient(self.root)
         config_window.grab_set()
@@ -1400,6 +5081,29 @@ class TarkovPriceCheckerUI:
         capture_entry.insert(0, self.capture_hotkey)
         capture_entry.pack(pady=5)
         
+        # Stash scan hotkey
+        stash_frame = tk.Frame(config_window, bg='#001100', padx=15, pady=10)
+        stash_frame.pack(pady=5, padx=20, fill='x')
+        
+        tk.Label(
+            stash_frame,
+            text="Scan Whole Stash:",
+            font=("Courier New", 10, "bold"),
+            bg='#001100',
+            fg='#00ff41'
+        ).pack(anchor='w')
+        
+        stash_entry = tk.Entry(
+            stash_frame,
+            font=("Courier New", 11),
+            bg='#000000',
+            fg='#00ff41',
+            insertbackground='#00ff41',
+            width=30
+        )
+        stash_entry.insert(0, self.stash_hotkey)
+        stash_entry.pack(pady=5)
+        
         # Help text
         help_label = tk.Label(
             config_window,
@@ -1417,14 +5121,21 @@ class TarkovPriceCheckerUI:
         def save_hotkeys():
             new_toggle = toggle_entry.get().strip().lower()
             new_capture = capture_entry.get().strip().lower()
+            new_stash = stash_entry.get().strip().lower()
             
-            if new_toggle and new_capture:
+            if new_toggle and new_capture and new_stash:
                 # Unregister old hotkeys
                 if self.hotkey_registered:
                     try:
                         keyboard.remove_hotkey(self.capture_hotkey)
                     except:
                         pass
+                if self.stash_hotkey_registered:
+                    try:
+                        keyboard.remove_hotkey(self.stash_hotkey)
+                    except:
+                        pass
+                    self.stash_hotkey_registered = False
                 if self.toggle_hotkey_registered:
                     try:
                         keyboard.remove_hotkey(self.toggle_hotkey)
@@ -1434,6 +5145,7 @@ class TarkovPriceCheckerUI:
                 # Update hotkeys
                 self.toggle_hotkey = new_toggle
                 self.capture_hotkey = new_capture
+                self.stash_hotkey = new_stash
                 
                 # Re-register if active
                 if self.hotkey_enabled:
@@ -1442,6 +5154,11 @@ class TarkovPriceCheckerUI:
                         self.hotkey_registered = True
                     except:
                         self.log(">>> ERROR: Failed to register capture hotkey", '#ff0000')
+                    try:
+                        keyboard.add_hotkey(self.stash_hotkey, self.on_stash_hotkey_triggered)
+                        self.stash_hotkey_registered = True
+                    except:
+                        self.log(">>> ERROR: Failed to register stash hotkey", '#ff0000')
                 
                 try:
                     keyboard.add_hotkey(self.toggle_hotkey, lambda: self.root.after(0, self.toggle_hotkey_handler))
@@ -1449,10 +5166,10 @@ class TarkovPriceCheckerUI:
                 except:
                     self.log(">>> ERROR: Failed to register toggle hotkey", '#ff0000')
                 
-                self.log(f">>> Hotkeys updated: Toggle={new_toggle}, Capture={new_capture}", '#00ff41')
+                self.log(f">>> Hotkeys updated: Toggle={new_toggle}, Capture={new_capture}, Stash={new_stash}", '#00ff41')
                 config_window.destroy()
             else:
-                messagebox.showerror("Error", "Both hotkeys must be specified")
+                messagebox.showerror("Error", "All hotkeys must be specified")
         
         save_btn = tk.Button(
             button_frame,
@@ -1511,23 +5228,6 @@ class TarkovPriceCheckerUI:
         except Exception as e:
             self.log(f">>> Could not save settings: {e}", '#ff0000')
     
-    def get_cached_item(self, item_name):
-        """Get item from cache if not expired"""
-        if item_name in self.ocr_cache:
-            cached = self.ocr_cache[item_name]
-            if datetime.now() - cached['timestamp'] < self.cache_duration:
-                return cached['data']
-            else:
-                del self.ocr_cache[item_name]
-        return None
-    
-    def cache_item(self, item_name, data):
-        """Cache item data"""
-        self.ocr_cache[item_name] = {
-            'data': data,
-            'timestamp': datetime.now()
-        }
-    
     def check_for_updates(self):
         """Check GitHub for new releases"""
         try:
@@ -1543,14 +5243,17 @@ class TarkovPriceCheckerUI:
                     self.log(f"\n>>> UPDATE AVAILABLE: v{latest_version}", '#ffff00')
                     self.log(f">>> Current version: v{self.current_version}", '#ffffff')
                     self.log(f">>> Download: {latest['html_url']}", '#00ffff')
-                    
-                    if messagebox.askyesno("Update Available", 
-                        f"New version v{latest_version} is available!\n\nWould you like to download it?"):
-                        import webbrowser
-                        webbrowser.open(latest['html_url'])
+                    self.run_on_ui(self.prompt_update, latest_version, latest['html_url'])
         except Exception as e:
             pass  # Silently fail for update check
     
+    def prompt_update(self, latest_version, url):
+        """Offer to open the release page (UI thread only)"""
+        if messagebox.askyesno("Update Available", 
+            f"New version v{latest_version} is available!\n\nWould you like to download it?"):
+            import webbrowser
+            webbrowser.open(url)
+    
     def minimize_to_tray(self):
         """Minimize window to system tray"""
         if not TRAY_AVAILABLE:
@@ -1592,7 +5295,7 @@ class TarkovPriceCheckerUI:
         """Open settings dialog"""
         settings_window = tk.Toplevel(self.root)
         settings_window.title("Settings")
-        settings_window.geometry("500x400")
+        settings_window.geometry("500x775")
         settings_window.configure(bg='#000000')
         settings_window.transient(self.root)
         settings_window.grab_set()
@@ -1677,6 +5380,193 @@ class TarkovPriceCheckerUI:
         )
         overlay_spin.pack(side='right', padx=5)
         
+        # Debug capture dumps (off by default - scans stay in memory)
+        debug_frame = tk.Frame(settings_window, bg='#001100', padx=15, pady=10)
+        debug_frame.pack(pady=5, padx=20, fill='x')
+        
+        debug_var = tk.BooleanVar(value=self.settings.get('save_debug_captures', False))
+        tk.Checkbutton(
+            debug_frame,
+            text="Save captures to disk (debug)",
+            variable=debug_var,
+            font=("Courier New", 10, "bold"),
+            bg='#001100',
+            fg=self.settings['theme_color'],
+            selectcolor='#000000',
+            activebackground='#001100',
+            activeforeground=self.settings['theme_color']
+        ).pack(side='left')
+        
+        # Auto-scan sampling rate and dwell time
+        auto_frame = tk.Frame(settings_window, bg='#001100', padx=15, pady=10)
+        auto_frame.pack(pady=5, padx=20, fill='x')
+        
+        tk.Label(
+            auto_frame,
+            text="Auto-Scan Hz / Dwell ms:",
+            font=("Courier New", 10, "bold"),
+            bg='#001100',
+            fg=self.settings['theme_color']
+        ).pack(side='left')
+        
+        dwell_var = tk.IntVar(value=self.settings.get('auto_scan_dwell_ms', 250))
+        tk.Spinbox(
+            auto_frame,
+            from_=100,
+            to=2000,
+            increment=50,
+            textvariable=dwell_var,
+            width=5,
+            font=("Courier New", 10),
+            bg='#000000',
+            fg=self.settings['theme_color']
+        ).pack(side='right', padx=5)
+        
+        rate_var = tk.IntVar(value=self.settings.get('auto_scan_rate_hz', 4))
+        tk.Spinbox(
+            auto_frame,
+            from_=1,
+            to=30,
+            textvariable=rate_var,
+            width=3,
+            font=("Courier New", 10),
+            bg='#000000',
+            fg=self.settings['theme_color']
+        ).pack(side='right', padx=5)
+        
+        # Screen capture backend (see --benchmark-grab to pick the fastest)
+        grabber_frame = tk.Frame(settings_window, bg='#001100', padx=15, pady=10)
+        grabber_frame.pack(pady=5, padx=20, fill='x')
+        
+        tk.Label(
+            grabber_frame,
+            text="Capture Backend:",
+            font=("Courier New", 10, "bold"),
+            bg='#001100',
+            fg=self.settings['theme_color']
+        ).pack(side='left')
+        
+        grabber_var = tk.StringVar(value=self.settings.get('grabber_backend', 'auto'))
+        grabber_menu = tk.OptionMenu(
+            grabber_frame,
+            grabber_var,
+            'auto',
+            *[backend.name for backend in GRABBER_BACKENDS]
+        )
+        grabber_menu.config(
+            font=("Courier New", 9),
+            bg='#000000',
+            fg=self.settings['theme_color'],
+            highlightthickness=0
+        )
+        grabber_menu.pack(side='right', padx=5)
+        
+        # OCR engine (applies on restart; see --benchmark-ocr)
+        engine_frame = tk.Frame(settings_window, bg='#001100', padx=15, pady=10)
+        engine_frame.pack(pady=5, padx=20, fill='x')
+        
+        tk.Label(
+            engine_frame,
+            text="OCR Engine (restart):",
+            font=("Courier New", 10, "bold"),
+            bg='#001100',
+            fg=self.settings['theme_color']
+        ).pack(side='left')
+        
+        engine_var = tk.StringVar(value=self.settings.get('ocr_engine', 'easyocr'))
+        engine_menu = tk.OptionMenu(engine_frame, engine_var, *OCR_ENGINES)
+        engine_menu.config(
+            font=("Courier New", 9),
+            bg='#000000',
+            fg=self.settings['theme_color'],
+            highlightthickness=0
+        )
+        engine_menu.pack(side='right', padx=5)
+        
+        # OCR intra-op threads (applies on restart; 0 = up to 4)
+        threads_frame = tk.Frame(settings_window, bg='#001100', padx=15, pady=10)
+        threads_frame.pack(pady=5, padx=20, fill='x')
+        
+        tk.Label(
+            threads_frame,
+            text="OCR Threads (restart):",
+            font=("Courier New", 10, "bold"),
+            bg='#001100',
+            fg=self.settings['theme_color']
+        ).pack(side='left')
+        
+        threads_var = tk.IntVar(value=self.settings.get('ocr_threads', 0))
+        tk.Spinbox(
+            threads_frame,
+            from_=0,
+            to=os.cpu_count() or 4,
+            textvariable=threads_var,
+            width=5,
+            font=("Courier New", 10),
+            bg='#000000',
+            fg=self.settings['theme_color']
+        ).pack(side='right', padx=5)
+        
+        # Price catalog refresh intervals: current game mode / the other mode
+        refresh_frame = tk.Frame(settings_window, bg='#001100', padx=15, pady=10)
+        refresh_frame.pack(pady=5, padx=20, fill='x')
+        
+        tk.Label(
+            refresh_frame,
+            text="Catalog Refresh min (mode/other):",
+            font=("Courier New", 10, "bold"),
+            bg='#001100',
+            fg=self.settings['theme_color']
+        ).pack(side='left')
+        
+        background_refresh_var = tk.IntVar(value=self.settings.get('background_catalog_refresh_minutes', 30))
+        tk.Spinbox(
+            refresh_frame,
+            from_=1,
+            to=240,
+            textvariable=background_refresh_var,
+            width=5,
+            font=("Courier New", 10),
+            bg='#000000',
+            fg=self.settings['theme_color']
+        ).pack(side='right', padx=5)
+        
+        refresh_var = tk.IntVar(value=self.settings.get('catalog_refresh_minutes', 10))
+        tk.Spinbox(
+            refresh_frame,
+            from_=1,
+            to=240,
+            textvariable=refresh_var,
+            width=5,
+            font=("Courier New", 10),
+            bg='#000000',
+            fg=self.settings['theme_color']
+        ).pack(side='right', padx=5)
+        
+        # Stash grid cell pitch (0 = derive from screen height)
+        cell_frame = tk.Frame(settings_window, bg='#001100', padx=15, pady=10)
+        cell_frame.pack(pady=5, padx=20, fill='x')
+        
+        tk.Label(
+            cell_frame,
+            text="Stash Cell px (0 = auto):",
+            font=("Courier New", 10, "bold"),
+            bg='#001100',
+            fg=self.settings['theme_color']
+        ).pack(side='left')
+        
+        cell_var = tk.IntVar(value=self.settings.get('stash_cell_size', 0))
+        tk.Spinbox(
+            cell_frame,
+            from_=0,
+            to=200,
+            textvariable=cell_var,
+            width=5,
+            font=("Courier New", 10),
+            bg='#000000',
+            fg=self.settings['theme_color']
+        ).pack(side='right', padx=5)
+        
         # Buttons
         button_frame = tk.Frame(settings_window, bg='#000000')
         button_frame.pack(pady=15)
@@ -1684,6 +5574,19 @@ class TarkovPriceCheckerUI:
         def apply_settings():
             self.settings['font_size'] = font_var.get()
             self.settings['overlay_font_size'] = overlay_var.get()
+            self.settings['save_debug_captures'] = debug_var.get()
+            self.settings['auto_scan_rate_hz'] = rate_var.get()
+            self.settings['auto_scan_dwell_ms'] = dwell_var.get()
+            self.settings['ocr_engine'] = engine_var.get()
+            self.settings['ocr_threads'] = threads_var.get()
+            self.settings['stash_cell_size'] = cell_var.get()
+            self.settings['catalog_refresh_minutes'] = refresh_var.get()
+            self.settings['background_catalog_refresh_minutes'] = background_refresh_var.get()
+            if grabber_var.get() != self.settings.get('grabber_backend', 'auto'):
+                self.settings['grabber_backend'] = grabber_var.get()
+                if self.grabber:
+                    self.grabber.close()
+                    self.grabber = None
             self.save_settings()
             messagebox.showinfo("Settings", "Settings saved! Restart the app to apply all changes.")
             settings_window.destroy()
@@ -1729,6 +5632,11 @@ class TarkovPriceCheckerUI:
                 self.overlay_window.destroy()
             except:
                 pass
+        if self.stash_overlay_window:
+            try:
+                self.stash_overlay_window.destroy()
+            except:
+                pass
         if self.hotkey_enabled:
             self.stop_hotkey_listener()
         if self.toggle_hotkey_registered:
@@ -1738,16 +5646,93 @@ class TarkovPriceCheckerUI:
                 pass
         if self.tray_icon:
             self.tray_icon.stop()
+        if self.grabber:
+            self.grabber.close()
+        if isinstance(self.ocr_engine, OCRWorkerClient):
+            self.ocr_engine.close()
+        self.tooltip_cache.save()
+        self.ocr_confusions.save()
         self.save_settings()
         self.root.destroy()
 
 
 def main():
     """Main function to run the UI"""
+    import argparse
+    parser = argparse.ArgumentParser(description="Tarkov Tag Scanner")
+    parser.add_argument('--benchmark-grab', action='store_true',
+                        help="Report p50/p99 screen grab latency per capture backend and exit")
+    parser.add_argument('--iterations', type=int, default=200,
+                        help="Iterations per backend for benchmarks")
+    parser.add_argument('--benchmark-ocr', metavar='CORPUS_DIR',
+                        help="Report item-name accuracy and latency per OCR engine on a tooltip corpus "
+                             "(images + labels.json) and exit")
+    parser.add_argument('--engines', default=','.join(OCR_ENGINES),
+                        help="Comma-separated OCR engines for --benchmark-ocr")
+    parser.add_argument('--ocr-regression', metavar='CORPUS_DIR',
+                        help="Fail (exit 1) if --candidate's item-name accuracy on a tooltip corpus is more "
+                             "than --max-accuracy-drop below --baseline's")
+    parser.add_argument('--baseline', default=EasyOCRFP32Engine.name,
+                        help="Reference OCR engine for --ocr-regression")
+    parser.add_argument('--candidate', default=EasyOCREngine.name,
+                        help="OCR engine under test for --ocr-regression")
+    parser.add_argument('--max-accuracy-drop', type=float, default=0.01,
+                        help="Allowed accuracy drop for --ocr-regression (0.01 = 1 point)")
+    parser.add_argument('--threads', type=int, default=None,
+                        help="Intra-op threads for OCR benchmarks (default: up to 4)")
+    parser.add_argument('--profile-startup', action='store_true',
+                        help="Print a per-phase startup timing breakdown to the console")
+    args = parser.parse_args()
+    
+    def print_ocr_report(report):
+        print(f"{'ENGINE':<14}{'PATH':<6}{'ACCURACY':>10}{'P50 (ms)':>10}{'P99 (ms)':>10}{'FALLBACKS':>11}"
+              f"{'LOAD (s)':>10}{'MODEL (MB)':>12}")
+        for name, stats in report.items():
+            if 'error' in stats:
+                print(f"{name:<14}  error: {stats['error']}")
+                continue
+            model_mb = f"{stats['model_mb']:.1f}" if stats['model_mb'] is not None else '-'
+            for mode in ('fast', 'full'):
+                row = stats[mode]
+                fallbacks = row['fallbacks'] if mode == 'fast' else '-'
+                print(f"{name:<14}{mode:<6}{row['accuracy']:>10.1%}{row['p50']:>10.1f}{row['p99']:>10.1f}"
+                      f"{fallbacks:>11}{stats['load_s']:>10.1f}{model_mb:>12}")
+    
+    if args.benchmark_ocr or args.ocr_regression:
+        import tempfile
+        model_dir = os.path.join(tempfile.gettempdir(), "WabbajackTarkov", "models")
+        corpus = load_ocr_corpus(args.benchmark_ocr or args.ocr_regression)
+        print(f"Corpus: {len(corpus)} tooltips")
+        if args.benchmark_ocr:
+            print_ocr_report(benchmark_ocr_engines(
+                corpus, args.engines.split(','), model_dir=model_dir, threads=args.threads
+            ))
+            return
+        
+        passed, report = check_ocr_regression(
+            corpus, args.baseline, args.candidate, args.max_accuracy_drop,
+            model_dir=model_dir, threads=args.threads
+        )
+        print_ocr_report(report)
+        print(f"OCR regression ({args.candidate} vs {args.baseline}, "
+              f"max drop {args.max_accuracy_drop:.1%}): {'PASS' if passed else 'FAIL'}")
+        sys.exit(0 if passed else 1)
+    
+    if args.benchmark_grab:
+        print(f"{'BACKEND':<12}{'P50 (ms)':>10}{'P99 (ms)':>10}{'MEAN (ms)':>11}")
+        for name, stats in benchmark_grabbers(iterations=args.iterations).items():
+            if 'error' in stats:
+                print(f"{name:<12}  error: {stats['error']}")
+            else:
+                print(f"{name:<12}{stats['p50']:>10.2f}{stats['p99']:>10.2f}{stats['mean']:>11.2f}")
+        return
+    
     # Initialize (no API key needed for tarkov.dev GraphQL API)
-    app = TarkovPriceCheckerUI()
+    app = TarkovPriceCheckerUI(startup_profile=StartupProfile(enabled=args.profile_startup))
     app.run()
 
 
 if __name__ == "__main__":
+    # Required for the OCR worker process in PyInstaller builds
+    multiprocessing.freeze_support()
     main()